@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+from signal import SIGKILL
+from statistics import mean, median
+from tempfile import TemporaryDirectory
+from time import monotonic, perf_counter
+import json
+import os
+import subprocess
+import sys
+
+from engine.config.game_config import NUM_PLAYERS
+from engine.config.io_config import OPEN_PIPE_TIMEOUT_SECONDS
+from engine.interface.io.deadline_pipe import DeadlinePipe
+
+# match_simulator and tournament live at the root of the repository
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from match_simulator import (  # noqa: E402
+    SubmissionPool,
+    Zygote,
+    setup_environments,
+    start_submissions,
+)
+
+
+def main():
+    # python3 benchmarks/bot_pool.py example_submissions/complex.py --matches 20 --workers 4
+
+    try:
+        submission = os.path.abspath(sys.argv[1])
+        options = dict(zip(sys.argv[2::2], sys.argv[3::2]))
+        matches = int(options.pop("--matches", 20))
+        workers = int(options.pop("--workers", os.cpu_count() or 1))
+    except (ValueError, IndexError):
+        print_usage()
+
+    if options:
+        print_usage()
+
+    for name, launcher in (
+        ("fresh processes", None),
+        ("zygote", Zygote()),
+        ("pool", SubmissionPool()),
+    ):
+        latencies = setup_latencies(submission, matches, launcher)
+        print(
+            f"[pool]: {name:15} setup of the {NUM_PLAYERS} submissions of a match, "
+            f"mean {mean(latencies) * 1000:7.1f}ms, median {median(latencies) * 1000:7.1f}ms"
+        )
+        if launcher is not None:
+            launcher.close()
+
+    for name, flags in (
+        ("fresh processes", []),
+        ("zygote", ["--zygote"]),
+        ("pool", ["--pool"]),
+    ):
+        elapsed = tournament(submission, matches, workers, flags)
+        print(
+            f"[pool]: {name:15} tournament of {matches} matches on {workers} workers "
+            f"in {elapsed:6.2f}s"
+        )
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/bot_pool.py <submission> [--matches <n>] [--workers <n>]\n"
+        "   Times how long the submissions of a match take to start and connect to the engine, as fresh\n"
+        "   processes, forked from match_simulator.Zygote and as warm workers of match_simulator.SubmissionPool,\n"
+        "   then plays the same tournament with each of them.\n"
+    )
+    sys.exit(0)
+
+
+def setup_latencies(
+    submission: str, matches: int, launcher: Zygote | SubmissionPool | None
+) -> list[float]:
+    latencies = []
+    with TemporaryDirectory() as directory:
+        for match in range(matches):
+            root = f"{directory}/match_{match}"
+            os.makedirs(root)
+            setup_environments([(NUM_PLAYERS, submission)], root)
+
+            start = perf_counter()
+            if isinstance(launcher, SubmissionPool):
+                launcher.start_submissions([submission] * NUM_PLAYERS, root)
+            else:
+                pids = start_submissions(root, quiet=True, zygote=launcher)
+            pipes = connect(root)
+            latencies.append(perf_counter() - start)
+
+            # Closing the pipes ends the match for the submissions
+            for pipe in pipes:
+                pipe.close()
+
+            if isinstance(launcher, SubmissionPool):
+                launcher.finish_match()
+            elif isinstance(launcher, Zygote):
+                for pid in pids:
+                    launcher.kill(pid)
+            else:
+                for pid in pids:
+                    os.kill(pid, SIGKILL)
+                    os.waitpid(pid, 0)
+
+    return latencies
+
+
+def connect(root: str) -> list[DeadlinePipe]:
+    """The engine's side of the handshake, see PlayerConnection._open_pipes"""
+    deadline = monotonic() + OPEN_PIPE_TIMEOUT_SECONDS * NUM_PLAYERS
+    pipes = []
+    for player in range(NUM_PLAYERS):
+        io = f"{root}/submission{player}/io"
+        pipes.append(DeadlinePipe.open_reader(f"{io}/to_engine.pipe"))
+        pipes.append(DeadlinePipe.open_writer(f"{io}/from_engine.pipe", deadline))
+
+    return pipes
+
+
+def tournament(submission: str, matches: int, workers: int, flags: list[str]) -> float:
+    with TemporaryDirectory() as root:
+        output = f"{root}/tournament"
+        start = perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                f"{ROOT}/tournament.py",
+                "--submissions",
+                submission,
+                "--matches",
+                str(matches),
+                "--workers",
+                str(workers),
+                "--output",
+                output,
+                "--cpu-time",
+                *flags,
+            ],
+            cwd=root,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        elapsed = perf_counter() - start
+
+        with open(f"{output}/leaderboard.json") as f:
+            assert json.load(f)["unfinished_matches"] == 0
+
+    return elapsed
+
+
+if __name__ == "__main__":
+    main()
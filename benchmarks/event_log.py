@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+from copy import deepcopy
+from time import perf_counter
+import gc
+import os
+import sys
+import tracemalloc
+
+from engine.config.game_config import NUM_PLAYERS
+from engine.headless import HeadlessGameEngine, load_bot_factory, silenced
+from engine.interface.io.inprocess_connection import InProcessConnection
+from engine.state.event_log import EventLog
+
+from helper.game import Game
+from helper.interface import LocalConnection
+
+
+def main():
+    # python3 benchmarks/event_log.py example_submissions/complex.py:ComplexBot --games 1000
+
+    try:
+        path, name = sys.argv[1].rsplit(":", 1)
+        options = dict(zip(sys.argv[2::2], sys.argv[3::2]))
+        games = int(options.pop("--games", 1000))
+    except (ValueError, IndexError):
+        print_usage()
+
+    if options:
+        print_usage()
+
+    factory = load_bot_factory(path, name)
+
+    def connect(player_id: int) -> InProcessConnection:
+        return InProcessConnection(player_id, factory(Game(LocalConnection())))
+
+    start = perf_counter()
+    logs = []
+    with silenced():
+        for seed in range(games):
+            engine = HeadlessGameEngine(
+                connection_factory=connect,
+                catalog=[{"team_id": i} for i in range(NUM_PLAYERS)],
+                seed=seed,
+            )
+            engine.start()
+            logs.append(engine.state.event_history)
+    events = sum(len(log) for log in logs)
+    print(
+        f"[event log]: played {games} games ({events} events) in {perf_counter() - start:.1f}s"
+    )
+
+    # Every game's history held at once, as columns and as the models the engine used
+    # to keep. Resident memory is measured first, tracemalloc's bookkeeping would add to it
+    for traced in (False, True):
+        gc.collect()
+        if traced:
+            tracemalloc.start()
+
+        held = []
+        for form in ("columns", "models"):
+            rss = resident()
+            allocated = tracemalloc.get_traced_memory()[0]
+
+            if form == "columns":
+                held.append([deepcopy(log) for log in logs])
+            else:
+                held.append([[e.model_copy(deep=True) for e in log] for log in logs])
+
+            if traced:
+                allocated = tracemalloc.get_traced_memory()[0] - allocated
+                print(
+                    f"[event log]: {form:7} {allocated / games / 1024:7.1f}KiB allocated per game, "
+                    f"{allocated / games * 1000 / 1024**2:7.1f}MiB per 1000 games"
+                )
+            else:
+                grown = resident() - rss
+                print(
+                    f"[event log]: {form:7} resident memory grew {grown / 1024**2:7.1f}MiB "
+                    f"for {games} games"
+                )
+
+        assert isinstance(held[0][0], EventLog)
+        del held
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/event_log.py <path>:<class> [--games <n>]\n"
+        "   Plays <n> headless games with 4 of the bot, keeps the event history of every one of them and\n"
+        "   compares the memory it takes as engine.state.event_log.EventLog columns and as pydantic models.\n"
+    )
+    sys.exit(0)
+
+
+def resident() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import json
+import os
+import subprocess
+import sys
+
+TOURNAMENT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tournament.py"
+)
+
+
+def main():
+    # python3 benchmarks/match_hosts.py example_submissions/complex.py --matches 40 --workers 8
+
+    try:
+        submission = os.path.abspath(sys.argv[1])
+        options = dict(zip(sys.argv[2::2], sys.argv[3::2]))
+        matches = int(options.pop("--matches", 20))
+        workers = int(options.pop("--workers", os.cpu_count() or 1))
+    except (ValueError, IndexError):
+        print_usage()
+
+    if options:
+        print_usage()
+
+    for name, flags in (("engine per match", []), ("engine.aio", ["--aio"])):
+        elapsed, unfinished = tournament(submission, matches, workers, flags)
+        print(
+            f"[hosts]: {name:16} {matches} matches on {workers} workers in {elapsed:6.2f}s, "
+            f"{matches / elapsed * 60:7.1f} matches/minute, {unfinished} unfinished"
+        )
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/match_hosts.py <submission> [--matches <n>] [--workers <n>]\n"
+        "   Plays the same tournament of <submission> against itself with one engine process per match and\n"
+        "   with every match refereed by engine.aio, and compares their throughput. Bots are timed by their CPU\n"
+        "   use so workers beyond the core count do not end matches with timeouts.\n"
+    )
+    sys.exit(0)
+
+
+def tournament(
+    submission: str, matches: int, workers: int, flags: list[str]
+) -> tuple[float, int]:
+    with TemporaryDirectory() as root:
+        output = f"{root}/tournament"
+        start = perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                TOURNAMENT,
+                "--submissions",
+                submission,
+                "--matches",
+                str(matches),
+                "--workers",
+                str(workers),
+                "--output",
+                output,
+                "--cpu-time",
+                *flags,
+            ],
+            cwd=root,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        elapsed = perf_counter() - start
+
+        with open(f"{output}/leaderboard.json") as f:
+            unfinished: int = json.load(f)["unfinished_matches"]
+
+    return elapsed, unfinished
+
+
+if __name__ == "__main__":
+    main()
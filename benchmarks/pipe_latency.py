@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+from statistics import mean, median, quantiles
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import os
+import sys
+
+from wire_protocol import recording
+
+from engine.config.game_config import NUM_PLAYERS
+from engine.headless import load_bot_factory, run_match
+from engine.interface.io.player_connection import PlayerConnection
+
+from helper.interface import Connection
+
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.moves.typing import MoveType
+from lib.interface.queries.query_place_tile import QueryPlaceTile
+from lib.interface.queries.typing import QueryType
+
+
+class AcceptAll:
+    def validate(self, *_) -> None:
+        pass
+
+
+def main():
+    # python3 benchmarks/pipe_latency.py example_submissions/complex.py:ComplexBot --games 2
+
+    try:
+        path, name = sys.argv[1].split(":")
+        games = int(sys.argv[3]) if sys.argv[2:3] == ["--games"] else 1
+    except (ValueError, IndexError):
+        print_usage()
+
+    factory = load_bot_factory(path, name)
+    queries: list[QueryType] = []
+    moves: list[MoveType] = []
+    for _ in range(games):
+        run_match([recording(factory, queries, moves)] * NUM_PLAYERS)
+
+    with TemporaryDirectory() as root:
+        # The engine opens the pipes relative to GAME_ENGINE_CORE_DIRECTORY, "." if unset
+        os.chdir(root)
+        os.makedirs("submission0/io")
+        os.mkfifo("submission0/io/to_engine.pipe")
+        os.mkfifo("submission0/io/from_engine.pipe")
+
+        pid = os.fork()
+        if pid == 0:
+            replay(moves)
+
+        latencies = query(queries)
+        os.waitpid(pid, 0)
+
+    latencies.sort()
+    print(
+        f"[pipe]: {len(latencies)} moves over the pipes, per move latency "
+        f"mean {mean(latencies) * 1e6:.1f}us, median {median(latencies) * 1e6:.1f}us, "
+        f"p99 {quantiles(latencies, n=100)[-1] * 1e6:.1f}us "
+        f"({len(latencies) / sum(latencies):.0f} moves/s)"
+    )
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/pipe_latency.py <path>:<class> [--games <n>]\n"
+        "   Plays <n> headless games (default 1), then replays every query and move over named pipes\n"
+        "   between a PlayerConnection and a forked helper Connection, timing each round trip.\n"
+    )
+    sys.exit(0)
+
+
+def replay(moves: list[MoveType]):
+    """The submission side, answers each query with the recorded move."""
+    os.chdir("submission0")
+    connection = Connection()
+    for move in moves:
+        connection.get_next_query()
+        connection.send_move(move)
+
+    os._exit(0)
+
+
+def query(queries: list[QueryType]) -> list[float]:
+    connection = PlayerConnection(0)
+    validator = AcceptAll()
+
+    latencies = []
+    for query in queries:
+        start = perf_counter()
+        if isinstance(query, QueryPlaceTile):
+            connection._query_move(query, MovePlaceTile, validator)
+        else:
+            connection._query_move_union(
+                query, MovePlaceMeeple, MovePlaceMeeplePass, validator
+            )
+        latencies.append(perf_counter() - start)
+
+        # Replays are not bound by the match time limit
+        connection._cumulative_time = 0
+
+    return latencies
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+from time import perf_counter
+from typing import Callable
+import sys
+
+from lib.game.game_logic import GameLogic
+from lib.interact.map import Map
+from lib.interact.tile import Tile, create_base_tiles
+
+ROAD_LENGTH = 150
+CITY_SIZE = 12
+
+
+class Board(GameLogic):
+    def __init__(self, map: Map) -> None:
+        self.map = map
+
+
+def main():
+    # python3 benchmarks/rules_kernel.py --repeat 200
+
+    try:
+        repeat = int(sys.argv[2]) if sys.argv[1:2] == ["--repeat"] else 100
+    except (ValueError, IndexError):
+        print_usage()
+
+    definitions = {tile.tile_type: tile.definition for tile in create_base_tiles()}
+
+    # A straight road of bridged tiles, left to right
+    road = [(x, 85, "U", 1) for x in range(10, 10 + ROAD_LENGTH)]
+
+    # A square of full city tiles
+    city = [
+        (x, y, "C", 0)
+        for x in range(80, 80 + CITY_SIZE)
+        for y in range(80, 80 + CITY_SIZE)
+    ]
+
+    for name, layout in (("road", road), ("city", city)):
+        build = measure(lambda: board(definitions, layout), repeat)
+        placed = board(definitions, layout)
+        start = placed.map.placed_tiles[0]
+        edge = "right_edge" if name == "road" else "top_edge"
+
+        traverse = measure(
+            lambda: list(placed._traverse_connected_component(start, edge)), repeat
+        )
+        reward = measure(lambda: placed._get_reward(start, edge), repeat)
+        print(
+            f"[rules]: {name:4} {len(layout):4} tiles, "
+            f"traverse {traverse * 1e6:9.1f}us, place all {build * 1e6:9.1f}us, "
+            f"reward {reward * 1e6:6.2f}us"
+        )
+
+    # Every placement of every tile type around the big city
+    placed = board(definitions, city)
+    tiles = [Tile.from_definition(d) for d in definitions.values()]
+    legal = measure(lambda: [placed.map.legal_placements(t) for t in tiles], repeat)
+    print(
+        f"[rules]: legal placements of {len(tiles)} tile types around the city "
+        f"{legal * 1e6:9.1f}us"
+    )
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/rules_kernel.py [--repeat <n>]\n"
+        f"   Times structure traversal, placement and legal placement search on a {ROAD_LENGTH}\n"
+        f"   tile road and a {CITY_SIZE}x{CITY_SIZE} city, best of <n> runs (default 100).\n"
+    )
+    sys.exit(0)
+
+
+def board(definitions, layout: list[tuple[int, int, str, int]]) -> Board:
+    map = Map()
+    for x, y, tile_type, rotation in layout:
+        tile = Tile.from_definition(definitions[tile_type])
+        tile.rotate_clockwise(rotation)
+        map.place_tile(tile, (x, y))
+
+    return Board(map)
+
+
+def measure(run: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+if __name__ == "__main__":
+    main()
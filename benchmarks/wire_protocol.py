@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+from io import BytesIO
+from time import perf_counter
+import sys
+
+from engine.config.game_config import NUM_PLAYERS
+from engine.headless import BotFactory, load_bot_factory, run_match
+
+from helper.bot import Bot
+from helper.game import Game
+
+from lib.interface.events.moves.typing import MoveType
+from lib.interface.io.wire import FrameReader, WireProtocol, compact_loads, dump_frame
+from lib.interface.queries.typing import QueryType, QueryTypeAdapter
+
+from pydantic import BaseModel, TypeAdapter
+
+MoveTypeAdapter: TypeAdapter[MoveType] = TypeAdapter(MoveType)
+PROTOCOLS: list[WireProtocol] = ["json", "compact"]
+MAX_FRAME_SIZE = 1000000
+
+
+def main():
+    # python3 benchmarks/wire_protocol.py example_submissions/complex.py:ComplexBot --games 5
+
+    try:
+        path, name = sys.argv[1].split(":")
+        games = int(sys.argv[3]) if sys.argv[2:3] == ["--games"] else 1
+    except (ValueError, IndexError):
+        print_usage()
+
+    factory = load_bot_factory(path, name)
+    queries: list[QueryType] = []
+    moves: list[MoveType] = []
+    for _ in range(games):
+        run_match([recording(factory, queries, moves)] * NUM_PLAYERS)
+
+    print(
+        f"[wire]: {games} games, {len(queries)} queries and {len(moves)} moves per encoding"
+    )
+    for protocol in PROTOCOLS:
+        query_bytes, query_rate = measure(queries, protocol, decode_query)
+        move_bytes, move_rate = measure(moves, protocol, decode_move)
+        print(
+            f"[wire]: {protocol:8} {(query_bytes + move_bytes) / games / 1024:8.1f} KiB per game "
+            f"(queries {query_bytes / games / 1024:.1f}, moves {move_bytes / games / 1024:.1f}), "
+            f"{query_rate:8.0f} queries/s, {move_rate:8.0f} moves/s"
+        )
+
+
+def print_usage():
+    print(
+        "Usage: python3 benchmarks/wire_protocol.py <path>:<class> [--games <n>]\n"
+        "   Plays <n> headless games (default 1), then encodes and decodes every query and move\n"
+        "   the bots exchanged in each wire protocol, as they would be sent over the pipes.\n"
+    )
+    sys.exit(0)
+
+
+def recording(
+    factory: BotFactory, queries: list[QueryType], moves: list[MoveType]
+) -> BotFactory:
+    def create(game: Game) -> Bot:
+        bot = factory(game)
+        choose_move = bot.choose_move
+
+        def record(query: QueryType) -> MoveType:
+            move = choose_move(query)
+            queries.append(query)
+            moves.append(move)
+            return move
+
+        bot.choose_move = record  # type: ignore[method-assign]
+        return bot
+
+    return create
+
+
+def decode_query(protocol: WireProtocol, data: memoryview) -> BaseModel:
+    if protocol == "compact":
+        return QueryTypeAdapter.model_validate(compact_loads(data)).root
+
+    return QueryTypeAdapter.model_validate_json(bytes(data)).root
+
+
+def decode_move(protocol: WireProtocol, data: memoryview) -> MoveType:
+    if protocol == "compact":
+        return MoveTypeAdapter.validate_python(compact_loads(data))
+
+    return MoveTypeAdapter.validate_json(bytes(data))
+
+
+def measure(messages, protocol: WireProtocol, decode) -> tuple[int, float]:
+    """Total frame bytes and messages per second, encoding and decoding each message."""
+    start = perf_counter()
+    frames = b"".join(dump_frame(message, protocol) for message in messages)
+
+    reader = FrameReader(BytesIO(frames), MAX_FRAME_SIZE)
+    for _ in messages:
+        decode(*reader.read())
+
+    return len(frames), len(messages) / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
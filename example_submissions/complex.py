@@ -16,6 +16,7 @@ Flaws:
 
 """
 
+from helper.bot import run
 from helper.game import Game
 from lib.interact.tile import Tile
 from lib.interface.events.moves.move_place_tile import MovePlaceTile
@@ -41,27 +42,28 @@ class BotState:
         self.meeples_placed: int = 0
 
 
+class ComplexBot:
+    """Implements helper.bot.Bot so it can also be run with engine.headless"""
+
+    def __init__(self, game: Game):
+        self.game = game
+        self.bot_state = BotState()
+
+    def choose_move(self, query: QueryType) -> MoveType:
+        match query:
+            case QueryPlaceTile() as q:
+                print("placing tile")
+                return handle_place_tile(self.game, self.bot_state, q)
+
+            case QueryPlaceMeeple() as q:
+                print("meeple")
+                return handle_place_meeple(self.game, self.bot_state, q)
+            case _:
+                assert False
+
+
 def main():
-    game = Game()
-    bot_state = BotState()
-
-    while True:
-        query = game.get_next_query()
-
-        def choose_move(query: QueryType) -> MoveType:
-            match query:
-                case QueryPlaceTile() as q:
-                    print("placing tile")
-                    return handle_place_tile(game, bot_state, q)
-
-                case QueryPlaceMeeple() as q:
-                    print("meeple")
-                    return handle_place_meeple(game, bot_state, q)
-                case _:
-                    assert False
-
-        print("sending move")
-        game.send_move(choose_move(query))
+    run(ComplexBot(Game()))
 
 
 def handle_place_tile(
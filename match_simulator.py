@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
 import json
+import select
 import shutil
 from signal import SIGKILL
 import subprocess
 import sys
 import os
+import time
 from typing import Tuple
 
 NUM_PLAYERS = 4
@@ -13,6 +15,9 @@ PIPE_PERMISSIONS = 0o660
 FILE_PERMISSIOSN = 0o664
 DIRECTORY_PERMISSIONS = 0o775
 
+# How long a pooled submission gets to notice the engine closed its pipes
+POOL_FINISH_TIMEOUT_SECONDS = 10
+
 
 def main():
     # python3 match_simulator.py --submissions 3:example_submissions/example.py 2:example_submissions/example2.py --engine
@@ -36,7 +41,7 @@ def main():
     if "--engine" in commands:
         if len(commands["--engine"]) != 0:
             print_usage()
-        start_engine()
+        start_engine(submission_pids)
 
     else:
         print(
@@ -82,6 +87,7 @@ def print_usage():
         "                                                       will not be automatically started.\n"
         "       --engine                                    If present, the simulator will start the engine. To run the match without this flag you need to manually\n"
         "                                                       start the engine (for example, while debugging it).\n"
+        "                                                       Set GAME_ENGINE_TIMEOUT_CLOCK=cpu to time bots by their CPU use, not the wall clock.\n"
         "\n"
         "   examples:\n"
         "       python3 match_simulator.py --submissions 4:example_submissions/complex.py --engine\n"
@@ -91,11 +97,11 @@ def print_usage():
     sys.exit(0)
 
 
-def setup_environments(sources: list[Tuple[int, str]]):
-    shutil.rmtree("output", ignore_errors=True)
-    os.mkdir("output")
-    shutil.rmtree("input", ignore_errors=True)
-    os.mkdir("input")
+def setup_environments(sources: list[Tuple[int, str]], root: str = "."):
+    shutil.rmtree(f"{root}/output", ignore_errors=True)
+    os.mkdir(f"{root}/output")
+    shutil.rmtree(f"{root}/input", ignore_errors=True)
+    os.mkdir(f"{root}/input")
 
     count = 0
     source = sources.pop(0)
@@ -104,37 +110,135 @@ def setup_environments(sources: list[Tuple[int, str]]):
             count = 0
             source = sources.pop(0)
 
-        clean_environment_for_player(player)
-        setup_environment_for_player(player, source[1])
+        clean_environment_for_player(player, root)
+        setup_environment_for_player(player, source[1], root)
 
         count += 1
 
     catalog = [{"team_id": i} for i in range(NUM_PLAYERS)]
-    with open("input/catalog.json", "w") as f:
+    with open(f"{root}/input/catalog.json", "w") as f:
         f.write(json.dumps(catalog))
 
 
-def start_submissions() -> list[int]:
+class Zygote:
+    """Starts submissions by forking a warm interpreter (python3 -m helper.zygote)."""
+
+    def __init__(self) -> None:
+        self.process = subprocess.Popen(
+            ["python3", "-m", "helper.zygote"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def _command(self, command: str) -> str:
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.process.stdin.write(f"{command}\n".encode())
+        self.process.stdin.flush()
+        return self.process.stdout.readline().decode().strip()
+
+    def launch(self, submission_dir: str) -> int:
+        """Pid of the started submission, it is not our child, stop it with kill."""
+        return int(self._command(f"launch {os.path.abspath(submission_dir)}"))
+
+    def kill(self, pid: int) -> None:
+        """Kills and reaps a launched submission, the zygote keeps its pid until then."""
+        self._command(f"kill {pid}")
+
+    def close(self) -> None:
+        self.process.kill()
+        self.process.wait()
+
+
+def start_submissions(
+    root: str = ".", quiet: bool = False, zygote: Zygote | None = None
+) -> list[int]:
     player_pids = []
     for player in range(NUM_PLAYERS):
-        os.chdir(f"submission{player}")
-
-        with (
-            open("io/submission.log", "w") as f_log,
-            open("io/submission.err", "w") as f_err,
-        ):
-            process = subprocess.Popen(
-                ["python3", "submission.py"], stdout=f_log, stderr=f_err
+        submission_dir = f"{root}/submission{player}"
+
+        if zygote is not None:
+            pid = zygote.launch(submission_dir)
+
+        else:
+            with (
+                open(f"{submission_dir}/io/submission.log", "w") as f_log,
+                open(f"{submission_dir}/io/submission.err", "w") as f_err,
+            ):
+                pid = subprocess.Popen(
+                    ["python3", "submission.py"],
+                    stdout=f_log,
+                    stderr=f_err,
+                    cwd=submission_dir,
+                ).pid
+
+        player_pids.append(pid)
+        if not quiet:
+            print(f"[simulator]: started submission {player} (pid={pid}).")
+
+    return player_pids
+
+
+class SubmissionPool:
+    """Warm submission processes (python3 -m helper.pool) reused from match to match."""
+
+    def __init__(self) -> None:
+        self.idle: dict[str, list[subprocess.Popen]] = {}
+        self.busy: list[Tuple[str, subprocess.Popen]] = []
+
+    def start_submissions(self, sources: list[str], root: str = ".") -> list[int]:
+        """Sends submission <n> of the sandbox to a warm worker of sources[n]."""
+        for player, source in enumerate(sources):
+            workers = self.idle.setdefault(source, [])
+            if workers:
+                process = workers.pop()
+            else:
+                process = subprocess.Popen(
+                    ["python3", "-m", "helper.pool", os.path.abspath(source)],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+
+            assert process.stdin is not None
+            process.stdin.write(
+                f"{os.path.abspath(root)}/submission{player}\n".encode()
+            )
+            process.stdin.flush()
+            self.busy.append((source, process))
+
+        return [process.pid for _, process in self.busy]
+
+    def finish_match(self) -> None:
+        """Waits for the workers to finish the match, the ones that do not are killed."""
+        deadline = time.monotonic() + POOL_FINISH_TIMEOUT_SECONDS
+        for source, process in self.busy:
+            assert process.stdout is not None
+            ready, _, _ = select.select(
+                [process.stdout], [], [], max(0, deadline - time.monotonic())
             )
 
-        player_pids.append(process.pid)
-        print(f"[simulator]: started submission {player} (pid={process.pid}).")
-        os.chdir("..")
+            if ready and process.stdout.readline() == b"done\n":
+                self.idle[source].append(process)
+            else:
+                process.kill()
+                process.wait()
 
-    return player_pids
+        self.busy = []
+
+    def close(self) -> None:
+        for workers in self.idle.values():
+            for process in workers:
+                process.kill()
+                process.wait()
+
+        self.idle = {}
+
+
+def submission_pids_env(pids: list[int]) -> dict[str, str]:
+    """Lets the engine time submissions by their CPU use (GAME_ENGINE_TIMEOUT_CLOCK=cpu)"""
+    return {"GAME_ENGINE_SUBMISSION_PIDS": ",".join(map(str, pids))}
 
 
-def start_engine():
+def start_engine(submission_pids: list[int]):
     print("[simulator] started engine.")
     with (
         open("output/engine.log", "w") as f_log,
@@ -147,6 +251,7 @@ def start_engine():
             text=True,
             universal_newlines=True,
             bufsize=1,
+            env=dict(os.environ, **submission_pids_env(submission_pids)),
         )
 
         while True:
@@ -160,15 +265,15 @@ def start_engine():
     print("[simulator] engine terminated.")
 
 
-def setup_environment_for_player(player: int, source: str):
-    os.makedirs(f"submission{player}/io", mode=DIRECTORY_PERMISSIONS)
-    os.mkfifo(f"submission{player}/io/to_engine.pipe", mode=PIPE_PERMISSIONS)
-    os.mkfifo(f"submission{player}/io/from_engine.pipe", mode=PIPE_PERMISSIONS)
-    shutil.copy(source, f"submission{player}/submission.py")
+def setup_environment_for_player(player: int, source: str, root: str = "."):
+    os.makedirs(f"{root}/submission{player}/io", mode=DIRECTORY_PERMISSIONS)
+    os.mkfifo(f"{root}/submission{player}/io/to_engine.pipe", mode=PIPE_PERMISSIONS)
+    os.mkfifo(f"{root}/submission{player}/io/from_engine.pipe", mode=PIPE_PERMISSIONS)
+    shutil.copy(source, f"{root}/submission{player}/submission.py")
 
 
-def clean_environment_for_player(player: int):
-    shutil.rmtree(f"submission{player}", ignore_errors=True)
+def clean_environment_for_player(player: int, root: str = "."):
+    shutil.rmtree(f"{root}/submission{player}", ignore_errors=True)
 
 
 if __name__ == "__main__":
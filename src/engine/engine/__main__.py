@@ -1,6 +1,12 @@
 import sys
 
-from engine.game_engine import GameEngine
+if len(sys.argv) > 1 and sys.argv[1] == "--startup-report":
+    from lib.startup import startup_report
+
+    print(startup_report("import engine.game_engine"))
+    sys.exit(0)
+
+from engine.game_engine import GameEngine  # noqa: E402
 
 game = GameEngine(len(sys.argv) > 1 and sys.argv[1] == "--print-recording-interactive")
 game.start()
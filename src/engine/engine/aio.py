@@ -0,0 +1,410 @@
+"""
+Aio
+_Referees many matches from one engine process, each match a coroutine on one event loop_
+- Every match has its own sandbox, laid out by match_simulator.setup_environments, the
+  host starts its submissions and talks to them over their named pipes with asyncio streams
+- Time limits are deadlines on the event loop, a bot thinking only holds up its own match
+- Each sandbox gets the same output directory as a match run with `python -m engine`
+"""
+
+from pydantic import TypeAdapter, ValidationError
+
+from asyncio import (
+    ReadTransport,
+    Semaphore,
+    StreamReader,
+    StreamReaderProtocol,
+    StreamWriter,
+    gather,
+    get_running_loop,
+    run,
+    sleep,
+    timeout,
+)
+from asyncio.streams import FlowControlMixin
+from asyncio.subprocess import Process, create_subprocess_exec
+from time import monotonic, perf_counter
+from typing import Any, Awaitable, Callable, TypeVar
+import json
+import os
+import sys
+import traceback
+
+from engine.config.game_config import SEED
+from engine.config.io_config import (
+    CUMULATIVE_TIMEOUT_SECONDS,
+    MAX_CHARACTERS_READ,
+    OPEN_PIPE_TIMEOUT_SECONDS,
+    TIMEOUT_CLOCK,
+    TIMEOUT_SECONDS,
+    WALL_BACKSTOP_FACTOR,
+    WIRE_PROTOCOL,
+)
+from engine.game_engine import GameEngine
+from engine.headless import GameResult, silenced
+from engine.interface.io.deadline_pipe import OPEN_RETRY_SECONDS, try_open_writer
+from engine.interface.io.exceptions import (
+    BrokenPipeException,
+    CumulativeTimeoutException,
+    InvalidMessageException,
+    InvalidMoveException,
+    PlayerException,
+    TimeoutException,
+)
+from engine.interface.io.input_validator import MoveValidator
+from engine.interface.io.player_connection import PLACE_MEEPLE_ADAPTER
+from engine.interface.io.process_clock import ProcessClock
+from engine.interface.logging.event_factory import event_banned_factory
+from engine.state.game_state import GameState
+
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.moves.typing import MoveType
+from lib.interface.io.wire import WireProtocol, compact_loads, dump_frame, read_frame
+from lib.interface.queries.query_place_meeple import QueryPlaceMeeple
+from lib.interface.queries.query_place_tile import QueryPlaceTile
+from lib.interface.queries.typing import QueryType
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 100
+
+PLACE_TILE_ADAPTER = TypeAdapter(MovePlaceTile)
+
+
+class AsyncPlayerConnection:
+    """
+    AsyncPlayerConnection
+    _PlayerConnection for the event loop_
+    - Same time limits, bans and wire protocol, GAME_ENGINE_TIMEOUT_CLOCK=cpu times the
+      submission by its process like PlayerConnection
+    - `open` must be awaited before the first query
+    """
+
+    def __init__(
+        self, player_id: int, io_directory: str, pid: int | None = None
+    ) -> None:
+        self.player_id = player_id
+        self.protocol: WireProtocol = (
+            "compact" if WIRE_PROTOCOL == "compact" else "json"
+        )
+
+        self._io_directory = io_directory
+        self._reader = StreamReader()
+        self._reader_transport: ReadTransport | None = None
+        self._writer: StreamWriter | None = None
+        self._cumulative_time: float = 0
+        self._cumulative_wall: float = 0
+
+        self._clock: Callable[[], float] = monotonic
+        self._backstop = 1
+        if TIMEOUT_CLOCK == "cpu" and pid is not None and ProcessClock.available(pid):
+            self._clock = ProcessClock(pid)
+            self._backstop = WALL_BACKSTOP_FACTOR
+
+    async def open(self) -> None:
+        await self._time_limited(
+            self._open_pipes(),
+            OPEN_PIPE_TIMEOUT_SECONDS,
+            "You didn't open 'to_engine' for writing or 'from_engine.pipe' for reading in time.",
+            None,
+        )
+
+    def close(self) -> None:
+        if self._reader_transport is not None:
+            self._reader_transport.close()
+        if self._writer is not None:
+            self._writer.close()
+
+    async def query_place_tile(
+        self, state: GameState, validator: MoveValidator
+    ) -> MovePlaceTile:
+        query = QueryPlaceTile(update=state.players[self.player_id].take_outbound())
+        return await self._query_move(query, PLACE_TILE_ADAPTER, validator)
+
+    async def query_place_meeple(
+        self, state: GameState, validator: MoveValidator
+    ) -> MovePlaceMeeple | MovePlaceMeeplePass:
+        query = QueryPlaceMeeple(update=state.players[self.player_id].take_outbound())
+        return await self._query_move(query, PLACE_MEEPLE_ADAPTER, validator)
+
+    async def _open_pipes(self) -> None:
+        # Submissions open to_engine first, the read end can open straight away but
+        # is only read once from_engine is open, before that it has no writer (EOF)
+        to_engine = os.open(
+            f"{self._io_directory}/to_engine.pipe", os.O_RDONLY | os.O_NONBLOCK
+        )
+
+        path = f"{self._io_directory}/from_engine.pipe"
+        try:
+            while (from_engine := try_open_writer(path)) is None:
+                await sleep(OPEN_RETRY_SECONDS)
+        except BaseException:
+            os.close(to_engine)
+            raise
+
+        loop = get_running_loop()
+        self._reader_transport, _ = await loop.connect_read_pipe(
+            lambda: StreamReaderProtocol(self._reader), open(to_engine, "rb", 0)
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            FlowControlMixin, open(from_engine, "wb", 0)
+        )
+        self._writer = StreamWriter(transport, protocol, None, loop)
+
+    async def _query_move(
+        self, query: QueryType, adapter: TypeAdapter[T], validator: MoveValidator
+    ) -> T:
+        protocol, data = await self._time_limited(
+            self._exchange(query),
+            TIMEOUT_SECONDS,
+            "You took too long to respond.",
+            query,
+        )
+
+        try:
+            if protocol == "json":
+                move = adapter.validate_json(data)
+            else:
+                move = adapter.validate_python(compact_loads(data))
+        except ValidationError as e:
+            raise InvalidMessageException(
+                self.player_id,
+                "You sent an invalid message to the game engine.",
+                json.loads(e.json()),
+            )
+        except ValueError as e:
+            raise InvalidMessageException(
+                player_id=self.player_id,
+                error_message=f"You sent a malformed message - {e}.",
+            )
+
+        try:
+            validator.validate(move, query, self.player_id)  # type: ignore[arg-type]
+        except ValueError as e:
+            raise InvalidMoveException(self.player_id, str(e), move)  # type: ignore[arg-type]
+
+        return move
+
+    async def _exchange(self, query: QueryType) -> tuple[WireProtocol, bytes]:
+        assert self._writer is not None
+
+        try:
+            self._writer.write(dump_frame(query, self.protocol))
+            await self._writer.drain()
+        except ConnectionError:
+            raise BrokenPipeException(
+                self.player_id, "You closed 'from_engine.pipe'.", query
+            )
+
+        try:
+            return await read_frame(self._reader, MAX_CHARACTERS_READ)
+        except EOFError:
+            raise BrokenPipeException(
+                self.player_id, "You closed 'to_engine.pipe'.", None
+            )
+        except ValueError as e:
+            raise InvalidMessageException(
+                player_id=self.player_id,
+                error_message=f"You sent a malformed message - {e}.",
+            )
+
+    async def _time_limited(
+        self,
+        io: Awaitable[T],
+        limit: float,
+        error_message: str,
+        query: QueryType | None,
+    ) -> T:
+        # Under CPU timing the deadline is only a backstop, the limit is checked below,
+        # cut short by what is left of the cumulative backstop like time_limited
+        wall_left = CUMULATIVE_TIMEOUT_SECONDS * self._backstop - self._cumulative_wall
+        wall_start = monotonic()
+        start = self._clock()
+        try:
+            async with timeout(min(limit * self._backstop, wall_left)):
+                result = await io
+        except TimeoutError:
+            if wall_left < limit * self._backstop:
+                raise CumulativeTimeoutException(self.player_id, error_message, query)
+            raise TimeoutException(self.player_id, error_message, query)
+        finally:
+            self._cumulative_wall += monotonic() - wall_start
+        end = self._clock()
+
+        if end - start > limit:
+            raise TimeoutException(self.player_id, error_message, query)
+
+        self._cumulative_time += end - start
+        if self._cumulative_time > CUMULATIVE_TIMEOUT_SECONDS:
+            raise CumulativeTimeoutException(self.player_id, error_message, query)
+
+        return result
+
+
+class AsyncGameEngine(GameEngine):
+    """
+    AsyncGameEngine
+    _Plays GameEngine.play as a coroutine, with the submissions of one sandbox_
+    - Starts `submission.py` of every player itself and kills them once the match ends
+    """
+
+    def __init__(self, root: str, seed: int | None = SEED) -> None:
+        with open(f"{root}/input/catalog.json", "r") as f:
+            catalog: list[dict[str, Any]] = json.load(f)
+
+        super().__init__(catalog=catalog, seed=seed, core_directory=root)
+        self.connections: dict[int, AsyncPlayerConnection] = {}
+        self.processes: list[Process] = []
+
+    async def start_async(self) -> None:
+        self.open_recording()
+        try:
+            await self._start_submissions()
+            for connection in self.connections.values():
+                await connection.open()
+            await self._run_game_async()
+        except PlayerException as e:
+            event = event_banned_factory(e)
+            self.mutator.commit(event)
+        finally:
+            await self._stop_submissions()
+            self.finish()
+
+    async def _start_submissions(self) -> None:
+        for player in self.state.players:
+            directory = f"{self.core_directory}/submission{player}"
+            with (
+                open(f"{directory}/io/submission.log", "w") as f_log,
+                open(f"{directory}/io/submission.err", "w") as f_err,
+            ):
+                process = await create_subprocess_exec(
+                    sys.executable,
+                    "submission.py",
+                    stdout=f_log,
+                    stderr=f_err,
+                    cwd=directory,
+                )
+
+            self.processes.append(process)
+            self.connections[player] = AsyncPlayerConnection(
+                player, f"{directory}/io", process.pid
+            )
+
+    async def _stop_submissions(self) -> None:
+        for connection in self.connections.values():
+            connection.close()
+
+        for process in self.processes:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+    async def _run_game_async(self) -> None:
+        turns = self.play()
+        try:
+            player, query = next(turns)
+            while True:
+                connection = self.connections[player.id]
+                move: MoveType
+                if query == "tile":
+                    move = await connection.query_place_tile(self.state, self.validator)
+                else:
+                    move = await connection.query_place_meeple(
+                        self.state, self.validator
+                    )
+                player, query = turns.send(move)
+        except StopIteration:
+            pass
+
+
+async def run_match(root: str, seed: int | None = SEED) -> GameResult:
+    engine = AsyncGameEngine(root, seed)
+    await engine.start_async()
+    return engine.get_result()
+
+
+async def run_matches(
+    roots: list[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Callable[[str, GameResult | None], None] | None = None,
+) -> list[GameResult | None]:
+    """Runs a match in every sandbox, None for a match that crashed the engine"""
+    slots = Semaphore(concurrency)
+
+    async def referee(root: str) -> GameResult | None:
+        async with slots:
+            try:
+                result: GameResult | None = await run_match(root)
+            except Exception:
+                traceback.print_exc()
+                result = None
+
+        if on_result is not None:
+            on_result(root, result)
+        return result
+
+    return await gather(*map(referee, roots))
+
+
+def print_usage() -> None:
+    print(
+        "Usage: python3 -m engine.aio [options] <sandbox> ...\n"
+        "   Referees a match in every sandbox (see match_simulator.setup_environments), all from this process.\n"
+        "   options:\n"
+        f"       --concurrency <n>     Number of matches to run at once (default {DEFAULT_CONCURRENCY}).\n"
+        "\n"
+        "   examples:\n"
+        "       python3 -m engine.aio --concurrency 50 tournament/match_0 tournament/match_1\n"
+    )
+    sys.exit(0)
+
+
+def main(args: list[str]) -> None:
+    roots: list[str] = []
+    concurrency = DEFAULT_CONCURRENCY
+
+    try:
+        i = 0
+        while i < len(args):
+            match args[i]:
+                case "--concurrency":
+                    concurrency = int(args[i + 1])
+                    i += 2
+
+                case root if not root.startswith("--"):
+                    roots.append(os.path.abspath(root))
+                    i += 1
+
+                case _:
+                    print_usage()
+
+    except (ValueError, IndexError):
+        print_usage()
+
+    if not roots or concurrency < 1:
+        print_usage()
+
+    # The engines' own logging would interleave, only the results are printed
+    stdout = sys.stdout
+
+    def report(root: str, result: GameResult | None) -> None:
+        print(f"[aio]: match {root} finished - {result}", file=stdout, flush=True)
+
+    start = perf_counter()
+    with silenced():
+        results = run(run_matches(roots, concurrency, report))
+    total = perf_counter() - start
+
+    crashed = results.count(None)
+    print(
+        f"[aio]: {len(results)} matches in {total:.2f}s "
+        f"({len(results) / total * 60:.1f} matches/minute), {crashed} crashed"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
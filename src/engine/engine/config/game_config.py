@@ -1,3 +1,5 @@
+import os
+
 NUM_PLAYERS = 4
 MAX_ROUNDS = 250
 NUM_MEEPLES = 7
@@ -7,3 +9,6 @@ NUM_TILES_DRAWN_PER_ROUND = 1
 
 STARTING_POINTS = 0
 ENGINE_PLAYER_ID = -1
+
+# Seeds the turn order and tile draws of a match, random if unset
+SEED = int(os.environ["GAME_ENGINE_SEED"]) if "GAME_ENGINE_SEED" in os.environ else None
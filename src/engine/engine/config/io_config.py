@@ -11,6 +11,28 @@ OPEN_PIPE_TIMEOUT_SECONDS = 3
 TIMEOUT_SECONDS = 2
 
 CUMULATIVE_TIMEOUT_SECONDS = 8
+
+# "wall" times bots with the clock, "cpu" with the CPU time their process uses while
+# it holds the turn (see ProcessClock), so bots are not banned for a loaded machine.
+# CPU timing needs the submission pids, it falls back to the wall clock without them.
+TIMEOUT_CLOCK = os.environ.get("GAME_ENGINE_TIMEOUT_CLOCK", "wall")
+
+# Under CPU timing a bot that stops responding is still cut off by the wall clock
+# after this many times its time limit, and banned once its moves took this many
+# times the cumulative limit on the wall clock
+WALL_BACKSTOP_FACTOR = 5
+
+# Comma separated pids of submission 0, 1, ..., set by the match simulator
+SUBMISSION_PIDS = [
+    int(pid)
+    for pid in os.environ.get("GAME_ENGINE_SUBMISSION_PIDS", "").split(",")
+    if pid
+]
 MAX_CHARACTERS_READ = 4096
-READ_CHUNK_SIZE = 1024
-PIPE_LEN_DELIM = ","
+
+# Encoding of queries sent to bots, "json" or "compact" (see lib.interface.io.wire)
+WIRE_PROTOCOL = os.environ.get("GAME_ENGINE_WIRE_PROTOCOL", "json")
+
+# How the recording and the visualiser's differential are written to the output directory,
+# "json" (game.json), "jsonl" (game.jsonl), "jsonl.gz" or "jsonl.xz" (see RecordingWriter)
+RECORDING_FORMAT = os.environ.get("GAME_ENGINE_RECORDING_FORMAT", "json")
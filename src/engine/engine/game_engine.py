@@ -1,32 +1,35 @@
-from typing import cast
+from typing import Any, Callable, Generator, Literal, Union
 from lib.interface.events.typing import EventPlayerTurnStarted, EventPlayerWon
 from engine.config.game_config import (
+    SEED,
     MAX_ROUNDS,
     NUM_TILES_DRAWN_PER_ROUND,
     NUM_PLAYERS,
     NUM_TILES_IN_HAND,
 )
-from engine.interface.io.censor_event import CensorEvent
+from engine.interface.io.base_connection import BaseConnection
 from engine.interface.io.exceptions import PlayerException
 from engine.interface.io.game_result import (
     GameBanResult,
     GameCancelledResult,
+    GameCrashedResult,
     GameSuccessResult,
 )
 from engine.interface.io.input_validator import MoveValidator
+from engine.interface.io.player_connection import PlayerConnection
 from engine.interface.logging.event_factory import event_banned_factory
 from engine.interface.logging.event_inspector import EventInspector
+from engine.interface.logging.recording_writer import RecordingWriter
 from engine.state.game_state import GameState
 from engine.config.io_config import CORE_DIRECTORY
-from engine.game.tile_subscriber import MonastaryNeighbourSubsciber
 
 from engine.state.player_state import PlayerState
 from engine.state.state_mutator import StateMutator
 
 from lib.config.expansion import EXPANSION
 from lib.config.map_config import MAP_CENTER, TILE_EDGE_IDS, TILE_EXTERNAL_POS
+from lib.game.scoring import final_rewards
 from lib.interact.structure import StructureType
-from lib.interact.tile import MONASTARY_IDENTIFIER, NO_POINTS, Tile
 from lib.interface.events.event_game_ended import (
     EventGameEndedStaleMate,
 )
@@ -35,23 +38,35 @@ from lib.interface.events.event_player_drew_tiles import EventPlayerDrewTiles
 from lib.interface.events.event_player_meeple_freed import EventPlayerMeepleFreed
 from lib.interface.events.event_river_phase_completed import EventRiverPhaseCompleted
 from lib.interface.events.event_tile_placed import EventStartingTilePlaced
+from lib.interface.events.moves.typing import MoveType
 
-from random import sample
 import shutil
 
+# A move the game needs from a player, to place a tile or then a meeple
+MoveRequest = tuple[PlayerState, Literal["tile", "meeple"]]
+
 
 class GameEngine:
-    def __init__(self, print_recording_interactive: bool = False) -> None:
+    def __init__(
+        self,
+        print_recording_interactive: bool = False,
+        connection_factory: Callable[[int], BaseConnection] = PlayerConnection,
+        catalog: list[dict[str, Any]] | None = None,
+        seed: int | None = SEED,
+        core_directory: str = CORE_DIRECTORY,
+    ) -> None:
         print("Intialising game engine!")
 
-        self.state = GameState()
+        self.state = GameState(catalog, seed)
         self.validator = MoveValidator(self.state)
         self.mutator = StateMutator(self.state)
-        self.censor = CensorEvent(self.state)
+        self.connection_factory = connection_factory
+        self.core_directory = core_directory
 
     def start(self) -> None:
+        self.open_recording()
         try:
-            self.state._connect_players()
+            self.state._connect_players(self.connection_factory)
             self.run_game()
         except PlayerException as e:
             event = event_banned_factory(e)
@@ -59,9 +74,38 @@ class GameEngine:
         finally:
             self.finish()
 
+    def open_recording(self) -> None:
+        # Events are written out as they are committed, finish only closes the files
+        self.mutator.recording = RecordingWriter(f"{self.core_directory}/output")
+
     def run_game(self) -> None:
+        turns = self.play()
+        try:
+            player, query = next(turns)
+            while True:
+                move: MoveType
+                if query == "tile":
+                    move = player.connection.query_place_tile(
+                        self.state, self.validator
+                    )
+                else:
+                    move = player.connection.query_place_meeple(
+                        self.state, self.validator
+                    )
+                player, query = turns.send(move)
+        except StopIteration:
+            pass
+
+    def play(self) -> Generator[MoveRequest, MoveType, None]:
+        """
+        The game itself, without any I/O
+        - Yields each move it needs from a player and expects it sent back, run_game
+          asks blocking connections for it and engine.aio awaits it
+        """
         assert NUM_PLAYERS == len(self.state.players)
-        turn_order = sample(list(self.state.players.keys()), k=NUM_PLAYERS)
+        turn_order = self.state.random.sample(
+            list(self.state.players.keys()), k=NUM_PLAYERS
+        )
         self.state.turn_order = turn_order
 
         while not self.state.is_game_over():
@@ -82,7 +126,7 @@ class GameEngine:
                 self.state.map.place_river_start(MAP_CENTER)
                 self.mutator.commit(
                     EventStartingTilePlaced(
-                        tile_placed=Tile.get_starting_tile()._to_model()
+                        tile_placed=self.state.map.placed_tiles[-1]._to_model()
                     )
                 )
 
@@ -101,7 +145,7 @@ class GameEngine:
                 player = self.state.players[player_id]
 
                 # If we are drawing the end of the river/base phase
-                if not self.state.map.available_tiles:
+                if not self.state.map.deck:
                     self.state.tiles_exhausted = True
 
                     if self.state.river_phase:
@@ -113,17 +157,10 @@ class GameEngine:
 
                     # No more draws but players can place tiles
                     else:
-                        self.start_player_turn(player)
+                        yield from self.start_player_turn(player)
                         continue
 
-                tiles_drawn = sample(
-                    list(self.state.map.available_tiles), NUM_TILES_DRAWN_PER_ROUND
-                )
-
-                for tile in tiles_drawn:
-                    self.state.map.available_tiles.remove(tile)
-                    self.state.map.available_tiles_by_type[tile.tile_type].remove(tile)
-
+                tiles_drawn = self.state.map.deck.draw(NUM_TILES_DRAWN_PER_ROUND)
                 player.tiles.extend(tiles_drawn)
                 self.mutator.commit(
                     EventPlayerDrewTiles(
@@ -133,7 +170,7 @@ class GameEngine:
                     )
                 )
 
-                self.start_player_turn(player)
+                yield from self.start_player_turn(player)
 
             # If mutator ended game
             if self.state.game_over:
@@ -174,21 +211,19 @@ class GameEngine:
                 self.state.finalise_game()
                 self.calc_final_points()
 
-    def start_player_turn(self, player: PlayerState) -> None:
+    def start_player_turn(
+        self, player: PlayerState
+    ) -> Generator[MoveRequest, MoveType, None]:
         self.mutator.commit(EventPlayerTurnStarted(player_id=player.id))
 
-        response = player.connection.query_place_tile(
-            self.state, self.validator, self.censor
-        )
+        response = yield player, "tile"
         self.mutator.commit(response)
 
         # Tile placed ended the game
         if self.state.game_over:
             return
 
-        response2 = player.connection.query_place_meeple(
-            self.state, self.validator, self.censor
-        )
+        response2 = yield player, "meeple"
         self.mutator.commit(response2)
 
     def complete_river_phase(self) -> None:
@@ -199,8 +234,8 @@ class GameEngine:
         for e, s in tile.internal_edges.items():
             assert tile.placed_pos is not None
 
-            if s == StructureType.RIVER and not Tile.get_external_tile(
-                e, tile.placed_pos, self.state.map._grid
+            if s == StructureType.RIVER and not self.state.map.get_neighbour(
+                tile.placed_pos, e
             ):
                 edge = e
                 break
@@ -211,13 +246,10 @@ class GameEngine:
         assert tile.placed_pos is not None
         x, y = tile.placed_pos
 
-        river_end = Tile.get_river_end_tile()
-        river_end.rotate_clockwise(TILE_EDGE_IDS[edge])
-        x1, y1 = TILE_EXTERNAL_POS[edge](x, y)
-        river_end.placed_pos = x1, y1
-
-        self.state.map._grid[y1][x1] = river_end
-        self.state.map.placed_tiles.append(river_end)
+        self.state.map.place_river_end(
+            TILE_EXTERNAL_POS[edge](x, y), TILE_EDGE_IDS[edge]
+        )
+        river_end = self.state.map.placed_tiles[-1]
 
         self.mutator.commit(EventRiverPhaseCompleted(end_tile=river_end._to_model()))
 
@@ -226,14 +258,7 @@ class GameEngine:
 
         # Replinishes cards if moving to base phase or new game (river phase) this is before player draws tile for the round
         for player in self.state.players.values():
-            tiles_drawn = sample(
-                list(self.state.map.available_tiles), NUM_TILES_IN_HAND
-            )
-            self.state.map.available_tiles.difference_update(tiles_drawn)
-
-            for tile in tiles_drawn:
-                self.state.map.available_tiles_by_type[tile.tile_type].remove(tile)
-
+            tiles_drawn = self.state.map.deck.draw(NUM_TILES_IN_HAND)
             player.tiles.extend(tiles_drawn)
 
             self.mutator.commit(
@@ -248,105 +273,28 @@ class GameEngine:
         self.state.river_phase = False
 
     def calc_final_points(self) -> None:
-        tiles_unclaimed: list[tuple["Tile", str]] = [
-            (meeple.placed, meeple.placed_edge)
-            for player in self.state.players.values()
-            for meeple in player.meeples
-            if meeple.placed is not None
-        ]
-
-        # Players may have multiple meepls per connected structure component
-        structures_visited: set[tuple["Tile", str]] = set()
-
-        for tile, edge in tiles_unclaimed:
-            if edge == MONASTARY_IDENTIFIER:
-                assert tile.placed_pos
-
-                meeple = tile.internal_claims[edge]
-                subsribers = [
-                    cast(MonastaryNeighbourSubsciber, s)
-                    for s in self.state.tile_publisher.watchers[tile.placed_pos]
-                    if isinstance(s, MonastaryNeighbourSubsciber)
-                    and cast(MonastaryNeighbourSubsciber, s).center == tile.placed_pos
-                ]
-
-                assert len(subsribers) == 1
-
-                assert meeple is not None
-
-                reward = len(subsribers[0].filled)
-                self.state.players[meeple.player_id].points += reward
+        # Scored in one pass before any meeple is freed, then applied as a batch
+        rewards = final_rewards(
+            self.state.map,
+            (
+                meeple
+                for player in self.state.players.values()
+                for meeple in player.meeples
+            ),
+        )
 
-                meeple._free_meeple()
-                self.mutator.commit(
-                    EventPlayerMeepleFreed(
-                        player_id=meeple.player_id,
-                        reward=reward,
-                        tile=tile._to_model(),
-                        placed_on=edge,
-                    )
+        for meeple, reward in rewards:
+            assert meeple.placed is not None
+            self.state.players[meeple.player_id].points += reward
+            self.mutator.commit(
+                EventPlayerMeepleFreed(
+                    player_id=meeple.player_id,
+                    reward=reward,
+                    tile=meeple.placed._to_model(),
+                    placed_on=meeple.placed_edge,
                 )
-
-                continue
-
-            # Only check reward once
-            if (tile, edge) in structures_visited:
-                continue
-
-            # Redundant safe add
-            structures_visited.add((tile, edge))
-
-            players = self.state._get_claims_objs(tile, edge)
-            players_meeples = sorted(players.values(), key=len, reverse=True)
-            for player_meeples in players_meeples:
-                for m in player_meeples:
-                    assert m.placed is not None
-                    structures_visited.add((m.placed, m.placed_edge))
-
-            partial_rewarded_meeples = [players_meeples[0][0]]
-            returning_meeples = []
-
-            assert (
-                partial_rewarded_meeples[0].placed is not None
-                and partial_rewarded_meeples[0].placed_edge != ""
             )
-
-            for pm in players_meeples[1:]:
-                if pm and len(pm) == len(players_meeples[0]):
-                    partial_rewarded_meeples.append(pm[0])
-
-                elif pm:
-                    returning_meeples.append(pm[0])
-
-                for m in pm:
-                    assert m.placed is not None and m.placed_edge != ""
-
-            reward = self.state._get_reward(tile, edge, partial=True)
-
-            for meeple in partial_rewarded_meeples:
-                self.state.players[meeple.player_id].points += reward
-                assert meeple.placed
-                self.mutator.commit(
-                    EventPlayerMeepleFreed(
-                        player_id=meeple.player_id,
-                        reward=reward,
-                        tile=meeple.placed._to_model(),
-                        placed_on=edge,
-                    )
-                )
-                meeple._free_meeple()
-
-            for meeple in returning_meeples:
-                assert meeple.placed
-                self.mutator.commit(
-                    EventPlayerMeepleFreed(
-                        player_id=meeple.player_id,
-                        reward=NO_POINTS,
-                        tile=meeple.placed._to_model(),
-                        placed_on=edge,
-                    )
-                )
-                meeple._free_meeple()
+            self.state.map.free_meeple(meeple)
 
         player, points = self.state.get_player_points()[0]
         self.mutator.commit(EventPlayerWon(player_id=player, points=points))
@@ -356,33 +304,37 @@ class GameEngine:
             flush=True,
         )
 
-    def finish(self) -> None:
-        # Write the result.
-        inspector = EventInspector(
+    def get_inspector(self) -> EventInspector:
+        return EventInspector(
             self.state.event_history,
             {i: j for i, j in self.state.get_player_points()},
             self.state.get_rankings(),
         )
+
+    def get_result(
+        self,
+    ) -> Union[
+        GameBanResult, GameSuccessResult, GameCancelledResult, GameCrashedResult
+    ]:
+        return self.get_inspector().get_result()
+
+    def finish(self) -> None:
+        # Write the result.
+        inspector = self.get_inspector()
         result = inspector.get_result()
 
-        with open(f"{CORE_DIRECTORY}/output/results.json", "w") as f:
+        with open(f"{self.core_directory}/output/results.json", "w") as f:
             f.write(result.model_dump_json())
 
-        # Write the game log.
-        with open(f"{CORE_DIRECTORY}/output/game.json", "w") as f:
-            f.write(inspector.get_recording_json())
-
-        visualiser_data = inspector.get_visualiser_json()
-        with open(
-            f"{CORE_DIRECTORY}/output/visualiser_forwards_differential.json", "w"
-        ) as f:
-            f.write(visualiser_data)
+        # Complete the game log.
+        if self.mutator.recording is not None:
+            self.mutator.recording.close()
 
         def copy_stdout_stderr_player(player: int) -> None:
-            stderr_path = f"{CORE_DIRECTORY}/submission{player}/io/submission.err"
-            stderr_path_new = f"{CORE_DIRECTORY}/output/submission_{player}.err"
-            stdout_path = f"{CORE_DIRECTORY}/submission{player}/io/submission.log"
-            stdout_path_new = f"{CORE_DIRECTORY}/output/submission_{player}.log"
+            stderr_path = f"{self.core_directory}/submission{player}/io/submission.err"
+            stderr_path_new = f"{self.core_directory}/output/submission_{player}.err"
+            stdout_path = f"{self.core_directory}/submission{player}/io/submission.log"
+            stdout_path_new = f"{self.core_directory}/output/submission_{player}.log"
 
             try:
                 shutil.copy(stderr_path, stderr_path_new, follow_symlinks=False)
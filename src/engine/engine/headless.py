@@ -0,0 +1,178 @@
+"""
+Headless
+_Runs whole matches inside one process with bots as in-process objects (see helper.bot.Bot)_
+- No named pipes, no subprocesses and no JSON round trips
+- Nothing is written to the output directory, the result is returned instead
+- Every match has its own state, so matches can run on several threads at once
+"""
+
+from contextlib import contextmanager, nullcontext
+from importlib.util import module_from_spec, spec_from_file_location
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Iterator, Sequence, TextIO, Union
+import os
+import sys
+
+from engine.config.game_config import NUM_PLAYERS, SEED
+from engine.game_engine import GameEngine
+from engine.interface.io.game_result import (
+    GameBanResult,
+    GameCancelledResult,
+    GameCrashedResult,
+    GameSuccessResult,
+)
+from engine.interface.io.inprocess_connection import InProcessConnection
+
+from helper.bot import Bot
+from helper.game import Game
+from helper.interface import LocalConnection
+
+BotFactory = Callable[[Game], Bot]
+GameResult = Union[
+    GameBanResult, GameSuccessResult, GameCancelledResult, GameCrashedResult
+]
+
+
+# stdout is process wide, it is only restored once the last quiet match ends
+_quiet_lock = Lock()
+_quiet_matches = 0
+_stdout: TextIO = sys.stdout
+
+
+@contextmanager
+def silenced() -> Iterator[None]:
+    global _quiet_matches, _stdout
+
+    with _quiet_lock:
+        if _quiet_matches == 0:
+            _stdout = sys.stdout
+            sys.stdout = open(os.devnull, "w")
+        _quiet_matches += 1
+
+    try:
+        yield
+    finally:
+        with _quiet_lock:
+            _quiet_matches -= 1
+            if _quiet_matches == 0:
+                sys.stdout.close()
+                sys.stdout = _stdout
+
+
+class HeadlessGameEngine(GameEngine):
+    def open_recording(self) -> None:
+        pass
+
+    def finish(self) -> None:
+        # Results are read back with get_result, there is no output directory
+        pass
+
+
+def run_match(
+    bot_factories: Sequence[BotFactory],
+    catalog: list[dict[str, Any]] | None = None,
+    quiet: bool = True,
+    seed: int | None = SEED,
+) -> GameResult:
+    assert len(bot_factories) == NUM_PLAYERS
+
+    def connect(player_id: int) -> InProcessConnection:
+        bot = bot_factories[player_id](Game(LocalConnection()))
+        return InProcessConnection(player_id, bot)
+
+    if catalog is None:
+        catalog = [{"team_id": i} for i in range(NUM_PLAYERS)]
+
+    with silenced() if quiet else nullcontext():
+        engine = HeadlessGameEngine(
+            connection_factory=connect, catalog=catalog, seed=seed
+        )
+        engine.start()
+
+    return engine.get_result()
+
+
+def load_bot_factory(path: str, name: str) -> BotFactory:
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    spec = spec_from_file_location(module_name, path)
+    assert spec is not None and spec.loader is not None
+
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    factory: BotFactory = getattr(module, name)
+    return factory
+
+
+def print_usage() -> None:
+    print(
+        "Usage: python3 -m engine.headless [options]\n"
+        "   options:\n"
+        "       --bots <count>:<path>:<class> ...     Bots to play in the match, <class> is called with a helper Game\n"
+        "                                               and must implement helper.bot.Bot.\n"
+        "       --games <n>                           Number of matches to play back to back (default 1).\n"
+        "       --seed <n>                            Seed of the first match, the next ones use <n>+1, <n>+2, ... so\n"
+        "                                               runs can be repeated (default GAME_ENGINE_SEED, else random).\n"
+        "\n"
+        "   examples:\n"
+        "       python3 -m engine.headless --bots 4:example_submissions/complex.py:ComplexBot --games 10\n"
+    )
+    sys.exit(0)
+
+
+def main(args: list[str]) -> None:
+    factories: list[BotFactory] = []
+    games = 1
+    seed = SEED
+
+    try:
+        i = 0
+        while i < len(args):
+            match args[i]:
+                case "--games":
+                    games = int(args[i + 1])
+                    i += 2
+
+                case "--seed":
+                    seed = int(args[i + 1])
+                    i += 2
+
+                case "--bots":
+                    i += 1
+                    while i < len(args) and not args[i].startswith("--"):
+                        count, path, name = args[i].split(":")
+                        factories.extend([load_bot_factory(path, name)] * int(count))
+                        i += 1
+
+                case _:
+                    print_usage()
+
+    except (ValueError, IndexError):
+        print_usage()
+
+    if len(factories) != NUM_PLAYERS:
+        print(f"Total players in the match must be {NUM_PLAYERS}.")
+        print_usage()
+
+    wins = [0 for _ in range(NUM_PLAYERS)]
+    start = perf_counter()
+
+    for game in range(games):
+        game_start = perf_counter()
+        result = run_match(factories, seed=None if seed is None else seed + game)
+        elapsed = perf_counter() - game_start
+
+        if isinstance(result, GameSuccessResult):
+            wins[result.ranking[0]] += 1
+
+        print(f"[headless]: game {game} took {elapsed * 1000:.1f}ms - {result}")
+
+    total = perf_counter() - start
+    print(
+        f"[headless]: {games} games in {total:.2f}s ({total / games * 1000:.1f}ms per game), wins {wins}"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Type, TypeVar, Union
+
+from engine.interface.io.input_validator import MoveValidator
+
+from lib.interface.events.typing import EventType
+from lib.interface.queries.query_place_meeple import QueryPlaceMeeple
+from lib.interface.queries.query_place_tile import QueryPlaceTile
+from lib.interface.queries.typing import QueryType
+from lib.interface.events.moves.typing import MoveType
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+
+if TYPE_CHECKING:
+    from engine.state.game_state import GameState
+
+
+T2 = TypeVar("T2", bound=MoveType)
+T3 = TypeVar("T3", bound=MoveType)
+
+
+class BaseConnection(ABC):
+    """
+    BaseConnection
+    _How the engine queries a single player for a move_
+    - PlayerConnection talks to a submission over its named pipes
+    - InProcessConnection calls a bot living in the engine process (headless)
+    """
+
+    def __init__(self, player_id: int) -> None:
+        self.player_id: int = player_id
+
+    @abstractmethod
+    def _query_move(
+        self, query: QueryType, response_type: Type[T2], validator: MoveValidator
+    ) -> T2:
+        pass
+
+    @abstractmethod
+    def _query_move_union(
+        self,
+        query: QueryType,
+        response_type_1: Type[T2],
+        response_type_2: Type[T3],
+        validator: MoveValidator,
+    ) -> Union[T2, T3]:
+        pass
+
+    def _get_record_update_dict(self, state: "GameState") -> dict[int, EventType]:
+        return state.players[self.player_id].take_outbound()
+
+    def query_place_tile(
+        self, state: "GameState", validator: MoveValidator
+    ) -> MovePlaceTile:
+        query = QueryPlaceTile(update=self._get_record_update_dict(state))
+        return self._query_move(query, MovePlaceTile, validator)
+
+    def query_place_meeple(
+        self, state: "GameState", validator: MoveValidator
+    ) -> MovePlaceMeeple | MovePlaceMeeplePass:
+        query = QueryPlaceMeeple(update=self._get_record_update_dict(state))
+        return self._query_move_union(
+            query, MovePlaceMeeple, MovePlaceMeeplePass, validator
+        )
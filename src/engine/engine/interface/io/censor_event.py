@@ -18,28 +18,30 @@ class CensorEvent:
     def __init__(self, state: "GameState") -> None:
         self.state = state
 
-    def censor(self, event: EventType, player_id: int) -> EventType:
+    def censor(self, event: EventType) -> dict[int, EventType]:
+        """
+        Censor
+        _What each player gets to see of an event_
+        - The public variant is built once and shared by every player it is sent to
+        """
         match event:
-            case MovePlaceTile() as e:
-                if e.player_id == player_id:
-                    return e
-
-                return e.get_public()
-
-            case EventPlayerDrewTiles() as e:
-                if e.player_id == player_id:
-                    return e
-
-                return e.get_public()
+            case MovePlaceTile() | EventPlayerDrewTiles() as e:
+                public = e.get_public()
+                return {
+                    player_id: e if player_id == e.player_id else public
+                    for player_id in self.state.players
+                }
 
             case EventGameStarted() as e:
-                return PublicEventGameStarted(
-                    turn_order=e.turn_order,
-                    players=[player.get_public() for player in e.players],
-                    num_starting_meeples=NUM_MEEPLES,
-                    you=filter(
-                        lambda x: x.player_id == player_id, e.players
-                    ).__next__(),
-                )
-
-        return event
+                players = [player.get_public() for player in e.players]
+                return {
+                    player.player_id: PublicEventGameStarted(
+                        turn_order=e.turn_order,
+                        players=players,
+                        num_starting_meeples=NUM_MEEPLES,
+                        you=player,
+                    )
+                    for player in e.players
+                }
+
+        return dict.fromkeys(self.state.players, event)
@@ -0,0 +1,83 @@
+from errno import ENXIO
+from math import inf
+from selectors import EVENT_READ, EVENT_WRITE, DefaultSelector
+from time import monotonic, sleep
+import os
+
+# How often opening the write end of a pipe is retried, waiting for its reader
+OPEN_RETRY_SECONDS = 0.002
+
+
+def try_open_writer(path: str) -> int | None:
+    """Opens the write end of a named pipe without blocking, None while it has no reader"""
+    try:
+        return os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+    except OSError as e:
+        if e.errno != ENXIO:
+            raise
+
+    return None
+
+
+class DeadlinePipe:
+    """
+    DeadlinePipe
+    _One end of a named pipe, non-blocking, that waits for it to be ready up to a deadline_
+    - Waits with a selector instead of a SIGALRM alarm, so connections can be used
+      from any thread and several matches can share a process
+    - Raises TimeoutError once `deadline` (time.monotonic) passes, inf never times out
+    - Raises BrokenPipeError writing to a pipe with no reader, reading returns 0 at EOF
+    """
+
+    def __init__(self, fd: int, events: int) -> None:
+        os.set_blocking(fd, False)
+        self.fd = fd
+        self.deadline = inf
+
+        self._selector = DefaultSelector()
+        self._selector.register(fd, events)
+
+    @staticmethod
+    def open_reader(path: str) -> "DeadlinePipe":
+        """Opens straight away, the writer may connect later"""
+        return DeadlinePipe(os.open(path, os.O_RDONLY | os.O_NONBLOCK), EVENT_READ)
+
+    @staticmethod
+    def open_writer(path: str, deadline: float) -> "DeadlinePipe":
+        """
+        Opens once a reader has the pipe open
+        - Selectors do not report a reader connecting, so the open is retried
+        """
+        while True:
+            fd = try_open_writer(path)
+            if fd is not None:
+                return DeadlinePipe(fd, EVENT_WRITE)
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"no reader opened {path}")
+            sleep(min(OPEN_RETRY_SECONDS, remaining))
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        while True:
+            try:
+                return os.readv(self.fd, [buffer])
+            except BlockingIOError:
+                self._wait()
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(self.fd, view) :]
+            except BlockingIOError:
+                self._wait()
+
+    def close(self) -> None:
+        self._selector.close()
+        os.close(self.fd)
+
+    def _wait(self) -> None:
+        remaining = self.deadline - monotonic()
+        if remaining <= 0 or not self._selector.select(remaining):
+            raise TimeoutError("pipe not ready before the deadline")
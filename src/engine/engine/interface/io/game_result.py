@@ -1,10 +1,14 @@
 from typing import Literal, Mapping, Sequence
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from lib.interface.io.ban_type import BanType
 
+# Results are only made once a match ends, so their validators are built then (defer_build)
+# instead of while the engine starts
+
 
 class GameBanResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     result_type: Literal["PLAYER_BANNED"] = "PLAYER_BANNED"
     ban_type: BanType
     player: int
@@ -12,16 +16,19 @@ class GameBanResult(BaseModel):
 
 
 class GameSuccessResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     result_type: Literal["SUCCESS"] = "SUCCESS"
     ranking: Sequence[int]
     score: Mapping[int, int]
 
 
 class GameCancelledResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     result_type: Literal["CANCELLED"] = "CANCELLED"
     reason: str
 
 
 class GameCrashedResult(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     result_type: Literal["CRASHED"] = "CRASHED"
     reason: str
@@ -0,0 +1,87 @@
+from typing import Type, Union, final
+
+from engine.interface.io.base_connection import BaseConnection, T2, T3
+from engine.interface.io.exceptions import (
+    BrokenPipeException,
+    InvalidMessageException,
+    InvalidMoveException,
+)
+from engine.interface.io.input_validator import MoveValidator
+
+from helper.bot import Bot
+from helper.interface import LocalConnection
+
+from lib.interface.queries.typing import QueryType
+from lib.interface.events.moves.typing import MoveType
+
+
+@final
+class InProcessConnection(BaseConnection):
+    """
+    InProcessConnection
+    _Hands queries straight to a bot object living in the engine process_
+    - No pipes, no subprocess and no JSON round trip, the bot receives the same
+      pydantic objects the engine recorded so it must treat them as read only
+    - There is no time limit, a bot raising is treated like a closed pipe
+    """
+
+    def __init__(self, player_id: int, bot: Bot) -> None:
+        super().__init__(player_id)
+        self.bot = bot
+
+        if not isinstance(bot.game.connection, LocalConnection):
+            raise RuntimeError(
+                "In-process bots must be created with a helper.interface.LocalConnection"
+            )
+
+        self._local_connection: LocalConnection = bot.game.connection
+
+    def _choose_move(self, query: QueryType) -> MoveType:
+        self._local_connection.put_query(query)
+
+        try:
+            return self.bot.choose_move(self.bot.game.get_next_query())
+        except Exception as e:
+            raise BrokenPipeException(
+                self.player_id, f"Your bot raised an exception - {e!r}", query
+            )
+
+    def _validate(
+        self, move: MoveType, query: QueryType, validator: MoveValidator
+    ) -> None:
+        try:
+            validator.validate(move, query, self.player_id)
+        except ValueError as e:
+            raise InvalidMoveException(self.player_id, str(e), move)
+
+    def _query_move(
+        self, query: QueryType, response_type: Type[T2], validator: MoveValidator
+    ) -> T2:
+        move = self._choose_move(query)
+
+        if not isinstance(move, response_type):
+            raise InvalidMessageException(
+                self.player_id,
+                f"You sent an invalid message to the game engine - expected {response_type.__name__}, got {type(move).__name__}",
+            )
+
+        self._validate(move, query, validator)
+        return move
+
+    def _query_move_union(
+        self,
+        query: QueryType,
+        response_type_1: Type[T2],
+        response_type_2: Type[T3],
+        validator: MoveValidator,
+    ) -> Union[T2, T3]:
+        move = self._choose_move(query)
+
+        if not isinstance(move, (response_type_1, response_type_2)):
+            raise InvalidMessageException(
+                self.player_id,
+                f"You sent an invalid message to the game engine - expected {response_type_1.__name__} or {response_type_2.__name__}, got {type(move).__name__}",
+            )
+
+        self._validate(move, query, validator)
+        return move
@@ -1,8 +1,6 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 # from helper.utils import print_map
-from lib.game.game_logic import TileModifier
 from engine.config.game_config import MAX_NUM_TILES_IN_HAND
 from lib.config.map_config import MONASTARY_IDENTIFIER, NUM_PLACEABLE_TILE_TYPES
 from lib.interface.events.moves.move_place_meeple import (
@@ -12,8 +10,16 @@ from lib.interface.events.moves.move_place_meeple import (
 from lib.interface.events.moves.move_place_tile import MovePlaceTile
 from lib.interface.events.moves.typing import MoveType
 from lib.interface.queries.base_query import BaseQuery
-from lib.interact.tile import Tile
+from lib.interact.tile import EDGES, Tile, TileModifier
 from lib.interact.structure import StructureType
+from lib.rules import (
+    CLAIMABLE,
+    EDGE_INDEX,
+    OPPOSITE,
+    compile_tile,
+    edge_code,
+    is_compatible,
+)
 
 import string
 
@@ -23,13 +29,7 @@ VALID_PLACEABLE_TILE_TYPES.extend(
 )
 
 VALID_ROTATIONS = [0, 1, 2, 3]
-VALID_MEEPLE_PLACEMENTS = Tile.get_starting_tile().internal_claims.keys()
-VALID_STRUCTURE_CLAIMS = [
-    StructureType.MONASTARY,
-    StructureType.CITY,
-    StructureType.ROAD,
-    StructureType.ROAD_START,
-]
+VALID_MEEPLE_PLACEMENTS = frozenset([*EDGES, MONASTARY_IDENTIFIER])
 
 if TYPE_CHECKING:
     from engine.state.game_state import GameState
@@ -67,10 +67,7 @@ class MoveValidator:
 
         # print_map(self.state.map._grid, range(75, 96))
 
-        neighbouring_tiles = {
-            edge: Tile.get_external_tile(edge, (x, y), self.state.map._grid)
-            for edge in Tile.get_edges()
-        }
+        neighbouring_tiles = self.state.map.get_neighbours((x, y))
 
         # Validate Tile Type
         if e.tile.tile_type not in VALID_PLACEABLE_TILE_TYPES:
@@ -102,38 +99,37 @@ class MoveValidator:
                 f"You tried placing with an invalid rotation - Recieved Tile Rotation {e.tile.rotation}"
             )
 
-        if self.state.map._grid[y][x]:
+        if self.state.map.get_tile(x, y):
             raise ValueError(f"You placed a tile in an occupied space - at {x, y}")
 
-        if not any(neighbouring_tiles.values()):
+        if (x, y) not in self.state.map.frontier:
             raise ValueError(
                 f"You placed a tile in an empty space - no neighbours at {x, y}"
             )
 
-        tile = deepcopy(tile)
-        while tile.rotation != e.tile.rotation:
-            tile.rotate_clockwise(1)
-
         # Validating each edge is alighed with a corrrect structure
+        edges = tile.get_rotated_edges(e.tile.rotation)
         river_flag = False
         for edge, neighbour_tile in neighbouring_tiles.items():
-            edge_structure = tile.internal_edges[edge]
+            edge_structure = edges[edge]
             # Flag if there is an edge with a river on this tile.
             if not river_flag:
                 river_flag = edge_structure == StructureType.RIVER
 
             if neighbour_tile:
                 # Check if edges are aligned with correct structures
-                neighbouring_structure = neighbour_tile.internal_edges[
-                    Tile.get_opposite(edge)
-                ]
-                if not StructureType.is_compatible(
-                    edge_structure, neighbouring_structure
+                i = EDGE_INDEX[edge]
+                if not is_compatible(
+                    compile_tile(tile.definition).codes[e.tile.rotation][i],
+                    edge_code(neighbour_tile, OPPOSITE[i]),
                 ):
+                    neighbouring_structure = neighbour_tile.internal_edges[
+                        Tile.get_opposite(edge)
+                    ]
                     # print(tile.tile_type, tile.rotation)
                     # print(neighbour_tile.tile_type, neighbour_tile.rotation)
                     raise ValueError(
-                        f"You placed a tile in an mismatched position - {edge} mismatch, your edge is {edge_structure} on rotation {tile.rotation} at coordinates {e.tile.pos} != {neighbouring_structure} on rotation {neighbour_tile.rotation} at position {neighbour_tile.placed_pos}"
+                        f"You placed a tile in an mismatched position - {edge} mismatch, your edge is {edge_structure} on rotation {e.tile.rotation} at coordinates {e.tile.pos} != {neighbouring_structure} on rotation {neighbour_tile.rotation} at position {neighbour_tile.placed_pos}"
                     )
 
             # Handling the case where the edge does not have a tile next to it
@@ -143,7 +139,7 @@ class MoveValidator:
         # Check if there is at least one river edge that is connected
         if river_flag:
             # print("river tile")
-            match self.state.map.river_validation(tile, x, y):
+            match self.state.map.river_validation(tile, x, y, e.tile.rotation):
                 case "disjoint":
                     raise ValueError(
                         "You placed a river tile without connecting it to the rest of the river."
@@ -158,11 +154,12 @@ class MoveValidator:
     def _validate_place_meeple(
         self, e: MovePlaceMeeple, query: BaseQuery, player_id: int
     ) -> None:
-        assert self.state.tile_placed is not None
-        if self.state.tile_placed.placed_pos != e.tile.pos:
+        turn = self.state.turn
+        assert turn is not None
+        if turn.tile.placed_pos != e.tile.pos:
             raise ValueError(f"You placed a meeple on an invalid tile - {e.tile.pos}")
 
-        if self.state.tile_placed.rotation != e.tile.rotation:
+        if turn.tile.rotation != e.tile.rotation:
             raise ValueError(
                 f"You placed a meeple on a valid tile with an invalid/mismatched rotation - {e.tile.rotation}"
             )
@@ -177,28 +174,25 @@ class MoveValidator:
             )
 
         if e.placed_on not in [MONASTARY_IDENTIFIER]:
-            if self.state._get_claims(self.state.tile_placed, e.placed_on):
+            if turn.get_claims(e.placed_on):
                 raise ValueError(
                     "You tried placing a meeple on an unclaimable Structure - \
                     adjacent structure claimed by an opponent"
                 )
 
-            if (
-                self.state.tile_placed.internal_edges[e.placed_on]
-                not in VALID_STRUCTURE_CLAIMS
-            ):
+            if not CLAIMABLE[edge_code(turn.tile, EDGE_INDEX[e.placed_on])]:
                 raise ValueError(
-                    f"You placed a meeple on a invalid edge - Edge Strcuture is {self.state.tile_placed.internal_edges[e.placed_on]}"
+                    f"You placed a meeple on a invalid edge - Edge Strcuture is {turn.tile.internal_edges[e.placed_on]}"
                 )
 
         if e.placed_on == MONASTARY_IDENTIFIER:
-            if TileModifier.MONASTARY not in self.state.tile_placed.modifiers:
+            if TileModifier.MONASTARY not in turn.tile.modifiers:
                 raise ValueError(
                     "You tried placing a meeple on a Monastary - \
                     There is no Monastary on the tile "
                 )
 
-        elif e.placed_on in self.state.tile_placed_claims:
+        elif e.placed_on in turn.freed:
             raise ValueError(
                 f"You tried placing a meeple on a edge/structure that is completed - \
                     {e.placed_on} "
@@ -5,10 +5,12 @@ from engine.config.io_config import (
     CORE_DIRECTORY,
     CUMULATIVE_TIMEOUT_SECONDS,
     OPEN_PIPE_TIMEOUT_SECONDS,
-    PIPE_LEN_DELIM,
     MAX_CHARACTERS_READ,
-    READ_CHUNK_SIZE,
+    SUBMISSION_PIDS,
+    TIMEOUT_CLOCK,
     TIMEOUT_SECONDS,
+    WALL_BACKSTOP_FACTOR,
+    WIRE_PROTOCOL,
 )
 
 
@@ -20,32 +22,27 @@ from engine.interface.io.exceptions import (
     TimeoutException,
 )
 
+from engine.interface.io.base_connection import BaseConnection, T2, T3
+from engine.interface.io.deadline_pipe import DeadlinePipe
 from engine.interface.io.input_validator import MoveValidator
-from engine.interface.io.censor_event import CensorEvent
+from engine.interface.io.process_clock import ProcessClock
 
-from lib.interface.events.typing import EventType
-from lib.interface.queries.query_place_meeple import QueryPlaceMeeple
-from lib.interface.queries.query_place_tile import QueryPlaceTile
+from lib.interface.io.wire import FrameReader, WireProtocol, compact_loads, dump_frame
 from lib.interface.queries.typing import QueryType
 from lib.interface.queries.base_query import BaseQuery
 from lib.interface.events.moves.typing import MoveType
-from lib.interface.events.moves.move_place_tile import MovePlaceTile
 from lib.interface.events.moves.move_place_meeple import (
     MovePlaceMeeple,
     MovePlaceMeeplePass,
 )
 
-from io import TextIOWrapper
 import json
-from math import log10, floor
-from signal import SIGALRM, alarm, signal
-from time import time
-from itertools import islice
+from math import inf
+from time import monotonic, time
+import sys
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
-    NoReturn,
     Optional,
     ParamSpec,
     Type,
@@ -54,11 +51,17 @@ from typing import (
     final,
 )
 
-# performance boost on deserializing unions.
-cached_type_adapters: dict[frozenset[str], TypeAdapter[Any]] = {}
+# The only union the engine asks for, built on import so the first timed query does not pay for it
+PLACE_MEEPLE_ADAPTER: TypeAdapter[MovePlaceMeeple | MovePlaceMeeplePass] = TypeAdapter(
+    MovePlaceMeeple | MovePlaceMeeplePass
+)
 
-if TYPE_CHECKING:
-    from engine.state.game_state import GameState
+# performance boost on deserializing unions.
+cached_type_adapters: dict[frozenset[str], TypeAdapter[Any]] = {
+    frozenset(
+        [MovePlaceMeeple.__name__, MovePlaceMeeplePass.__name__]
+    ): PLACE_MEEPLE_ADAPTER,
+}
 
 
 class InvalidMoveError(ValueError):
@@ -123,18 +126,33 @@ def time_limited(
             if len(args) >= 2 and isinstance(args[1], BaseQuery):
                 query = args[1]  # type: ignore
 
-            def on_timeout_alarm(*_) -> NoReturn:  # type: ignore
+            # Under CPU timing the deadline is only a backstop, the limit is checked below.
+            # It is also cut short by what is left of the cumulative backstop, so a bot
+            # waiting on something that uses no CPU can not stall every move.
+            limit = OPEN_PIPE_TIMEOUT_SECONDS if initial else TIMEOUT_SECONDS
+            wall_left = (
+                CUMULATIVE_TIMEOUT_SECONDS * self._backstop - self._cumulative_wall
+            )
+            wall_start = monotonic()
+            self._deadline = wall_start + min(limit * self._backstop, wall_left)
+            start = self._clock()
+
+            try:
+                result = fn(*args, **kwargs)
+            except TimeoutError:
+                if wall_left < limit * self._backstop:
+                    raise CumulativeTimeoutException(
+                        self.player_id, error_message, query
+                    )
                 raise TimeoutException(self.player_id, error_message, query)
+            finally:
+                self._deadline = inf
+                self._cumulative_wall += monotonic() - wall_start
 
-            signal(SIGALRM, on_timeout_alarm)
-
-            alarm(OPEN_PIPE_TIMEOUT_SECONDS if initial else TIMEOUT_SECONDS)
-            start = time()
+            end = self._clock()
 
-            result = fn(*args, **kwargs)
-
-            end = time()
-            alarm(0)
+            if end - start > limit:
+                raise TimeoutException(self.player_id, error_message, query)
 
             self._cumulative_time += end - start
             if self._cumulative_time > CUMULATIVE_TIMEOUT_SECONDS:
@@ -147,18 +165,32 @@ def time_limited(
     return dfn1
 
 
-T2 = TypeVar("T2", bound=MoveType)
-T3 = TypeVar("T3", bound=MoveType)
-
-
 @final
-class PlayerConnection:
-    def __init__(self, player_id: int) -> None:
-        self.player_id: int = player_id
-        self._to_engine_pipe: TextIOWrapper
-        self._from_engine_pipe: TextIOWrapper
+class PlayerConnection(BaseConnection):
+    def __init__(
+        self,
+        player_id: int,
+        protocol: WireProtocol | None = None,
+        pid: int | None = None,
+    ) -> None:
+        super().__init__(player_id)
+        self._to_engine_pipe: DeadlinePipe
+        self._from_engine_pipe: DeadlinePipe
+        self._reader: FrameReader
         self._cumulative_time: float = 0
-        self._record_update_watermark: int = 0
+        self._cumulative_wall: float = 0
+
+        # Set by time_limited, pipes give up waiting with a TimeoutError after it
+        self._deadline = inf
+
+        if protocol is None:
+            protocol = "compact" if WIRE_PROTOCOL == "compact" else "json"
+        self.protocol: WireProtocol = protocol
+
+        self._clock: Callable[[], float] = time
+        self._backstop = 1
+        if TIMEOUT_CLOCK == "cpu":
+            self._use_cpu_clock(pid)
 
         self._open_pipes()
 
@@ -167,65 +199,75 @@ class PlayerConnection:
         initial=True,
     )
     def _open_pipes(self) -> None:
-        self._to_engine_pipe = open(
-            f"{CORE_DIRECTORY}/submission{self.player_id}/io/to_engine.pipe", "r"
+        # Submissions open to_engine first, so it must be open before from_engine
+        self._to_engine_pipe = DeadlinePipe.open_reader(
+            f"{CORE_DIRECTORY}/submission{self.player_id}/io/to_engine.pipe"
         )
-        self._from_engine_pipe = open(
-            f"{CORE_DIRECTORY}/submission{self.player_id}/io/from_engine.pipe", "w"
+        self._reader = FrameReader(self._to_engine_pipe, MAX_CHARACTERS_READ)
+        self._from_engine_pipe = DeadlinePipe.open_writer(
+            f"{CORE_DIRECTORY}/submission{self.player_id}/io/from_engine.pipe",
+            self._deadline,
         )
 
+    def _use_cpu_clock(self, pid: int | None) -> None:
+        if pid is None and self.player_id < len(SUBMISSION_PIDS):
+            pid = SUBMISSION_PIDS[self.player_id]
+
+        if pid is None or not ProcessClock.available(pid):
+            print(
+                f"Player {self.player_id} has no process to time, using the wall clock.",
+                file=sys.stderr,
+                flush=True,
+            )
+            return
+
+        self._clock = ProcessClock(pid)
+        self._backstop = WALL_BACKSTOP_FACTOR
+
     def query_move(self) -> None:
         pass
 
-    def _send(self, data: str) -> None:
-        self._from_engine_pipe.write(str(len(data)) + PIPE_LEN_DELIM)
-        self._from_engine_pipe.write(data)
-        self._from_engine_pipe.flush()
-
-    def _receive(self) -> str:
-        # Read size of message.
-        buffer = bytearray()
-        while len(buffer) < floor(log10(MAX_CHARACTERS_READ)) + 1 and (
-            len(buffer) == 0 or buffer[-1] != ord(",")
-        ):
-            buffer.extend(self._to_engine_pipe.read(1).encode())
-
-        if buffer[-1] == ord(","):
-            size = int(buffer[0:-1].decode())
-        else:
+    def _send(self, query: QueryType) -> None:
+        self._from_engine_pipe.deadline = self._deadline
+        self._from_engine_pipe.write(dump_frame(query, self.protocol))
+
+    def _receive(self) -> tuple[WireProtocol, memoryview]:
+        """Reads a move in either format, whatever the engine sent"""
+        self._to_engine_pipe.deadline = self._deadline
+        try:
+            return self._reader.read()
+        except EOFError:
+            raise BrokenPipeException(
+                self.player_id, "You closed 'to_engine.pipe'.", None
+            )
+        except ValueError as e:
             raise InvalidMessageException(
                 player_id=self.player_id,
-                error_message="You send a message with a malformed message size.",
+                error_message=f"You sent a malformed message - {e}.",
             )
 
-        if size > MAX_CHARACTERS_READ:
+    def _decode_compact(self, data: memoryview) -> Any:
+        try:
+            return compact_loads(data)
+        except ValueError as e:
             raise InvalidMessageException(
                 player_id=self.player_id,
-                error_message=f"You send a message that was too long, {size} > {MAX_CHARACTERS_READ} maximum.",
-            )
-
-        # Read message.
-        buffer = bytearray()
-        while len(buffer) < size:
-            buffer.extend(
-                bytearray(
-                    self._to_engine_pipe.read(
-                        min((size - len(buffer)), READ_CHUNK_SIZE)
-                    ).encode()
-                )
+                error_message=f"You sent a malformed message - {e}.",
             )
 
-        return buffer.decode()
-
     @handle_invalid
     @handle_sigpipe
     @time_limited()
     def _query_move(
         self, query: QueryType, response_type: Type[T2], validator: MoveValidator
     ) -> T2:
-        self._send(query.model_dump_json())
+        self._send(query)
 
-        move = response_type.model_validate_json(self._receive())
+        protocol, data = self._receive()
+        if protocol == "json":
+            move = response_type.model_validate_json(bytes(data))
+        else:
+            move = response_type.model_validate(self._decode_compact(data))
         try:
             validator.validate(move, query, self.player_id)
         except ValueError as e:
@@ -242,7 +284,7 @@ class PlayerConnection:
         response_type_2: Type[T3],
         validator: MoveValidator,
     ) -> Union[T2, T3]:
-        self._send(query.model_dump_json())
+        self._send(query)
 
         types = frozenset([response_type_1.__name__, response_type_2.__name__])
         if types in cached_type_adapters:
@@ -253,41 +295,13 @@ class PlayerConnection:
             )
             adapter = cached_type_adapters[types]
 
-        move = adapter.validate_json(self._receive())
+        protocol, data = self._receive()
+        if protocol == "json":
+            move = adapter.validate_json(bytes(data))
+        else:
+            move = adapter.validate_python(self._decode_compact(data))
         try:
             validator.validate(move, query, self.player_id)
         except ValueError as e:
             raise InvalidMoveError(str(e), move)
         return move  # type: ignore[no-any-return]
-
-    def _get_record_update_dict(
-        self, state: "GameState", censor: CensorEvent
-    ) -> dict[int, EventType]:
-        if self._record_update_watermark >= len(state.event_history):
-            raise RuntimeError(
-                "Record update watermark out of sync with state, did you try to send two queries without committing the first?"
-            )
-        result = dict(
-            [
-                (i, censor.censor(x, self.player_id))
-                for i, x in islice(
-                    enumerate(state.event_history), self._record_update_watermark, None
-                )
-            ]
-        )
-        self._record_update_watermark = len(state.event_history)
-        return result
-
-    def query_place_tile(
-        self, state: "GameState", validator: MoveValidator, censor: CensorEvent
-    ) -> MovePlaceTile:
-        query = QueryPlaceTile(update=self._get_record_update_dict(state, censor))
-        return self._query_move(query, MovePlaceTile, validator)
-
-    def query_place_meeple(
-        self, state: "GameState", validator: MoveValidator, censor: CensorEvent
-    ) -> MovePlaceMeeple | MovePlaceMeeplePass:
-        query = QueryPlaceMeeple(update=self._get_record_update_dict(state, censor))
-        return self._query_move_union(
-            query, MovePlaceMeeple, MovePlaceMeeplePass, validator
-        )
@@ -0,0 +1,95 @@
+import os
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def read_stat(pid: int) -> tuple[int, int] | None:
+    """Parent pid and clock ticks used by the process and the children it waited for"""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+
+    # The command name may hold spaces and brackets, the fields start after its last ")"
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    return int(fields[1]), sum(int(field) for field in fields[11:15])
+
+
+class ProcessClock:
+    """
+    ProcessClock
+    _CPU time a submission has used, read from /proc/<pid>/stat of it and its descendants_
+    - User and system time of all their threads, in seconds, to a clock tick (usually 10ms)
+    - Children count while they run and, once waited for, through their parent, so work
+      handed to a subprocess or a multiprocessing pool is charged to the bot
+    - Unlike the wall clock it does not move while the processes wait to be scheduled,
+      so a loaded machine does not count against the bot
+    - Never goes back, it keeps returning the last reading once the process is gone
+      or a child it did not wait for disappears
+    """
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self._last = 0.0
+
+        # Without CONFIG_PROC_CHILDREN descendants are found by scanning /proc
+        self._list_children = os.path.exists(f"/proc/{pid}/task/{pid}/children")
+
+    @staticmethod
+    def available(pid: int) -> bool:
+        return os.path.exists(f"/proc/{pid}/stat")
+
+    def __call__(self) -> float:
+        ticks = self._tree_ticks()
+        if ticks is not None:
+            self._last = max(self._last, ticks / CLOCK_TICKS)
+        return self._last
+
+    def _tree_ticks(self) -> int | None:
+        if self._list_children:
+            return self._listed_tree_ticks()
+
+        ppids: dict[int, int] = {}
+        ticks: dict[int, int] = {}
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            stat = read_stat(int(name))
+            if stat is not None:
+                ppids[int(name)], ticks[int(name)] = stat
+
+        if self.pid not in ticks:
+            return None
+
+        children: dict[int, list[int]] = {}
+        for pid, ppid in ppids.items():
+            children.setdefault(ppid, []).append(pid)
+
+        total = 0
+        pending = [self.pid]
+        while pending:
+            pid = pending.pop()
+            total += ticks[pid]
+            pending.extend(children.get(pid, []))
+        return total
+
+    def _listed_tree_ticks(self) -> int | None:
+        total = 0
+        pending = [self.pid]
+        while pending:
+            pid = pending.pop()
+            stat = read_stat(pid)
+            if stat is None:
+                if pid == self.pid:
+                    return None
+                continue
+            total += stat[1]
+
+            try:
+                for task in os.listdir(f"/proc/{pid}/task"):
+                    with open(f"/proc/{pid}/task/{task}/children") as f:
+                        pending.extend(map(int, f.read().split()))
+            except (FileNotFoundError, ProcessLookupError):
+                pass
+        return total
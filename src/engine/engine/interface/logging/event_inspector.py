@@ -1,32 +1,24 @@
-from typing import Union
+from typing import Sequence, Union
 from engine.interface.io.game_result import (
     GameBanResult,
     GameCancelledResult,
     GameCrashedResult,
     GameSuccessResult,
 )
+from engine.interface.logging.recording_writer import VISUALISER_EVENTS
 from lib.interface.events.event_game_ended import (
     EventGameEndedCancelled,
 )
 from lib.interface.events.event_player_bannned import EventPlayerBanned
 from lib.interface.events.event_player_won import EventPlayerWon
-from lib.interface.events.typing import EventPlayerMeepleFreed, EventType
-from lib.interface.events.event_game_started import EventGameStarted
-from lib.interface.events.event_river_phase_completed import EventRiverPhaseCompleted
-from lib.interface.events.event_tile_placed import (
-    EventStartingTilePlaced,
-)
-from lib.interface.events.moves.move_place_meeple import (
-    MovePlaceMeeple,
-)
-from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.typing import EventType
 
 from pydantic import RootModel
 
 
 class EventInspector:
     def __init__(
-        self, history: list[EventType], score: dict[int, int], ranking: list[int]
+        self, history: Sequence[EventType], score: dict[int, int], ranking: list[int]
     ) -> None:
         self.history = history
         self.score = score
@@ -50,28 +42,10 @@ class EventInspector:
                 return GameCrashedResult(reason="Game engine crashed.")
 
     def get_recording_json(self) -> str:
-        return RootModel(self.history).model_dump_json()
+        return RootModel(list(self.history)).model_dump_json()
 
     def get_visualiser_json(self) -> str:
-        visualiser_json: list[EventType] = []
-        for i, event in enumerate(self.history):
-            match event:
-                case EventGameStarted() as e:
-                    visualiser_json.append(e)
-
-                case EventRiverPhaseCompleted() as e:
-                    visualiser_json.append(e)
-
-                case EventStartingTilePlaced() as e:
-                    visualiser_json.append(e)
-
-                case MovePlaceTile() as e:
-                    visualiser_json.append(e)
-
-                case MovePlaceMeeple() as e:
-                    visualiser_json.append(e)
-
-                case EventPlayerMeepleFreed() as e:
-                    visualiser_json.append(e)
-
+        visualiser_json: list[EventType] = [
+            e for e in self.history if isinstance(e, VISUALISER_EVENTS)
+        ]
         return RootModel(visualiser_json).model_dump_json()
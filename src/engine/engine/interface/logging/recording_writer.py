@@ -0,0 +1,94 @@
+from engine.config.io_config import RECORDING_FORMAT
+
+from lib.interface.events.event_game_started import EventGameStarted
+from lib.interface.events.event_player_meeple_freed import EventPlayerMeepleFreed
+from lib.interface.events.event_river_phase_completed import EventRiverPhaseCompleted
+from lib.interface.events.event_tile_placed import EventStartingTilePlaced
+from lib.interface.events.moves.move_place_meeple import MovePlaceMeeple
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.typing import EventType
+
+from typing import TextIO
+import gzip
+import lzma
+
+# Events the visualiser replays the board from
+VISUALISER_EVENTS = (
+    EventGameStarted,
+    EventRiverPhaseCompleted,
+    EventStartingTilePlaced,
+    MovePlaceTile,
+    MovePlaceMeeple,
+    EventPlayerMeepleFreed,
+)
+
+RECORDING_FORMATS = ("json", "jsonl", "jsonl.gz", "jsonl.xz")
+
+
+class RecordingWriter:
+    """
+    RecordingWriter
+    _Writes the game recording and the visualiser's differential as events are committed_
+    - "json" writes the same arrays as `game.json` and `visualiser_forwards_differential.json`
+      always had, "jsonl" one event per line, "jsonl.gz" and "jsonl.xz" compress those
+    - Each event is serialised once for both files
+    - Uncompressed recordings are flushed after every event, so a match that dies
+      leaves every event before it on disk
+    """
+
+    def __init__(self, directory: str, format: str = RECORDING_FORMAT) -> None:
+        if format not in RECORDING_FORMATS:
+            raise ValueError(
+                f"Unknown recording format {format}, expected one of {RECORDING_FORMATS}"
+            )
+
+        self.format = format
+        self.array = format == "json"
+        self.flush = format in ("json", "jsonl")
+        self.empty = True
+
+        self.recording = self._open(f"{directory}/game.{format}")
+        self.visualiser = self._open(
+            f"{directory}/visualiser_forwards_differential.{format}"
+        )
+        self.visualiser_empty = True
+
+        if self.array:
+            self.recording.write("[")
+            self.visualiser.write("[")
+
+    def _open(self, path: str) -> TextIO:
+        if self.format.endswith(".gz"):
+            return gzip.open(path, "wt")
+        if self.format.endswith(".xz"):
+            return lzma.open(path, "wt")
+        return open(path, "w")
+
+    def write(self, event: EventType) -> None:
+        data = event.model_dump_json()
+
+        self._append(self.recording, data, self.empty)
+        self.empty = False
+
+        if isinstance(event, VISUALISER_EVENTS):
+            self._append(self.visualiser, data, self.visualiser_empty)
+            self.visualiser_empty = False
+
+    def _append(self, f: TextIO, data: str, first: bool) -> None:
+        if not self.array:
+            f.write(data + "\n")
+        elif first:
+            f.write(data)
+        else:
+            f.write("," + data)
+
+        if self.flush:
+            f.flush()
+
+    def close(self) -> None:
+        for f in (self.recording, self.visualiser):
+            if f.closed:
+                continue
+            if self.array:
+                f.write("]")
+            f.close()
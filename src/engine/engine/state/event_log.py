@@ -0,0 +1,198 @@
+from lib.interface.events.event_player_drew_tiles import EventPlayerDrewTiles
+from lib.interface.events.event_player_meeple_freed import EventPlayerMeepleFreed
+from lib.interface.events.event_player_turn_started import EventPlayerTurnStarted
+from lib.interface.events.event_player_won import EventPlayerWon
+from lib.interface.events.event_river_phase_completed import EventRiverPhaseCompleted
+from lib.interface.events.event_tile_placed import EventStartingTilePlaced
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.typing import EventType
+from lib.models.tile_model import TileModel
+
+from array import array
+from enum import IntEnum, auto
+from typing import Iterator, Sequence, overload
+
+
+class EventKind(IntEnum):
+    """Kinds of events kept as rows, anything else is kept as its model"""
+
+    OTHER = 0
+    TURN_STARTED = auto()
+    PLACE_TILE = auto()
+    DREW_TILE = auto()
+    PLACE_MEEPLE_PASS = auto()
+    PLACE_MEEPLE = auto()
+    MEEPLE_FREED = auto()
+    PLAYER_WON = auto()
+    STARTING_TILE_PLACED = auto()
+    RIVER_PHASE_COMPLETED = auto()
+
+
+class EventLog(Sequence[EventType]):
+    """
+    EventLog
+    _The engine's event history, stored as columns of small integers_
+    - The events of every turn (turn started, tile drawn, tile and meeple moves,
+      meeples freed) are one row each, their models are built again when read
+    - Events that do not fit a row (game started, bans, game ended, drawing
+      several tiles) are kept as they were committed
+    - Tile types and edges are interned, the row keeps their index
+    """
+
+    def __init__(self) -> None:
+        self.kind = array("B")
+        self.player = array("b")
+        self.tile_type = array("H")
+        self.x = array("h")
+        self.y = array("h")
+        self.rotation = array("b")
+        self.edge = array("H")
+        self.value = array("i")
+
+        self.others: dict[int, EventType] = {}
+
+        self.strings: list[str] = []
+        self.string_ids: dict[str, int] = {}
+
+    def _intern(self, string: str) -> int:
+        if string not in self.string_ids:
+            self.string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return self.string_ids[string]
+
+    def _row(
+        self,
+        kind: EventKind,
+        player: int = -1,
+        tile: TileModel | None = None,
+        edge: str = "",
+        value: int = 0,
+    ) -> None:
+        self.kind.append(kind)
+        self.player.append(player)
+        if tile is None:
+            self.tile_type.append(0)
+            self.x.append(0)
+            self.y.append(0)
+            self.rotation.append(0)
+        else:
+            self.tile_type.append(self._intern(tile.tile_type))
+            self.x.append(tile.pos[0])
+            self.y.append(tile.pos[1])
+            self.rotation.append(tile.rotation)
+        self.edge.append(self._intern(edge))
+        self.value.append(value)
+
+    def append(self, event: EventType) -> None:
+        match event:
+            case EventPlayerTurnStarted() as e:
+                self._row(EventKind.TURN_STARTED, e.player_id)
+
+            case MovePlaceTile() as e:
+                self._row(
+                    EventKind.PLACE_TILE, e.player_id, e.tile, value=e.player_tile_index
+                )
+
+            case EventPlayerDrewTiles() as e if len(e.tiles) == 1:
+                self._row(
+                    EventKind.DREW_TILE, e.player_id, e.tiles[0], value=e.num_tiles
+                )
+
+            case MovePlaceMeeplePass() as e:
+                self._row(EventKind.PLACE_MEEPLE_PASS, e.player_id)
+
+            case MovePlaceMeeple() as e:
+                self._row(EventKind.PLACE_MEEPLE, e.player_id, e.tile, e.placed_on)
+
+            case EventPlayerMeepleFreed() as e:
+                self._row(
+                    EventKind.MEEPLE_FREED, e.player_id, e.tile, e.placed_on, e.reward
+                )
+
+            case EventPlayerWon() as e:
+                self._row(EventKind.PLAYER_WON, e.player_id, value=e.points)
+
+            case EventStartingTilePlaced() as e:
+                self._row(EventKind.STARTING_TILE_PLACED, tile=e.tile_placed)
+
+            case EventRiverPhaseCompleted() as e:
+                self._row(EventKind.RIVER_PHASE_COMPLETED, tile=e.end_tile)
+
+            case _:
+                self.others[len(self.kind)] = event
+                self._row(EventKind.OTHER)
+
+    def _tile(self, i: int) -> TileModel:
+        return TileModel(
+            tile_type=self.strings[self.tile_type[i]],
+            pos=(self.x[i], self.y[i]),
+            rotation=self.rotation[i],
+        )
+
+    def _event(self, i: int) -> EventType:
+        player = self.player[i]
+        match self.kind[i]:
+            case EventKind.OTHER:
+                return self.others[i]
+            case EventKind.TURN_STARTED:
+                return EventPlayerTurnStarted(player_id=player)
+            case EventKind.PLACE_TILE:
+                return MovePlaceTile(
+                    player_id=player,
+                    tile=self._tile(i),
+                    player_tile_index=self.value[i],
+                )
+            case EventKind.DREW_TILE:
+                return EventPlayerDrewTiles(
+                    player_id=player, num_tiles=self.value[i], tiles=[self._tile(i)]
+                )
+            case EventKind.PLACE_MEEPLE_PASS:
+                return MovePlaceMeeplePass(player_id=player)
+            case EventKind.PLACE_MEEPLE:
+                return MovePlaceMeeple(
+                    player_id=player,
+                    tile=self._tile(i),
+                    placed_on=self.strings[self.edge[i]],
+                )
+            case EventKind.MEEPLE_FREED:
+                return EventPlayerMeepleFreed(
+                    player_id=player,
+                    reward=self.value[i],
+                    tile=self._tile(i),
+                    placed_on=self.strings[self.edge[i]],
+                )
+            case EventKind.PLAYER_WON:
+                return EventPlayerWon(player_id=player, points=self.value[i])
+            case EventKind.STARTING_TILE_PLACED:
+                return EventStartingTilePlaced(tile_placed=self._tile(i))
+            case EventKind.RIVER_PHASE_COMPLETED:
+                return EventRiverPhaseCompleted(end_tile=self._tile(i))
+
+        raise ValueError(f"Unknown event kind {self.kind[i]}")
+
+    @overload
+    def __getitem__(self, i: int) -> EventType: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[EventType]: ...
+
+    def __getitem__(self, i: int | slice) -> EventType | list[EventType]:
+        if isinstance(i, slice):
+            return [self._event(j) for j in range(*i.indices(len(self)))]
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("event log index out of range")
+        return self._event(i)
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def __iter__(self) -> Iterator[EventType]:
+        for i in range(len(self)):
+            yield self._event(i)
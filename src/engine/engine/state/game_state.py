@@ -1,43 +1,55 @@
 from engine.config.expansion_config import EXPANSION_PACKS
 from engine.config.game_config import NUM_PLAYERS
-from engine.game.tile_subscriber import TilePublisherBus
+from engine.state.event_log import EventLog
 from engine.state.player_state import PlayerState
+from engine.state.turn_analysis import TurnAnalysis
 from engine.config.io_config import CORE_DIRECTORY
+from engine.interface.io.base_connection import BaseConnection
+from engine.interface.io.player_connection import PlayerConnection
 
 from lib.game.game_logic import GameLogic
-from lib.interact.tile import Tile
 from lib.interact.map import Map
-from lib.interface.events.typing import EventType
 
+from random import Random
+from typing import Any, Callable
 import json
 
 
 class GameState(GameLogic):
-    def __init__(self) -> None:
-        with open(f"{CORE_DIRECTORY}/input/catalog.json", "r") as f:
-            self.catalog = json.load(f)
+    def __init__(
+        self, catalog: list[dict[str, Any]] | None = None, seed: int | None = None
+    ) -> None:
+        if catalog is None:
+            with open(f"{CORE_DIRECTORY}/input/catalog.json", "r") as f:
+                catalog = json.load(f)
+
+        self.catalog = catalog
 
         self.round = -1
         self.players: dict[int, PlayerState] = {
             i: PlayerState(i, self.catalog[i]["team_id"]) for i in range(NUM_PLAYERS)
         }
-        self.map = Map()
+
+        # Everything random in a match comes from here, the deck gets its own seed
+        self.random = Random(seed)
+        self.map = Map(self.random.getrandbits(64))
 
         self.game_over = False
         self.tiles_exhausted = True
 
-        self.tile_placed: Tile | None = None
-        self.tile_placed_claims: set[str] = set()
-        self.tile_publisher = TilePublisherBus()
+        # The tile placed this turn, until its meeple move is committed
+        self.turn: TurnAnalysis | None = None
 
-        self.event_history: list[EventType] = []
+        self.event_history = EventLog()
         self.turn_order: list[int] = []
 
         self.river_phase = True
 
-    def _connect_players(self) -> None:
+    def _connect_players(
+        self, connection_factory: Callable[[int], BaseConnection] = PlayerConnection
+    ) -> None:
         for player in self.players.values():
-            player.connect()
+            player.connect(connection_factory)
 
     def start_river_phase(self) -> None:
         self.map.start_river_phase()
@@ -1,8 +1,12 @@
+from typing import Callable
+
 from engine.config.game_config import NUM_MEEPLES
+from engine.interface.io.base_connection import BaseConnection
 from engine.interface.io.player_connection import PlayerConnection
 
 from lib.interact.meeple import Meeple
 from lib.interact.tile import Tile
+from lib.interface.events.typing import EventType
 from lib.models.player_model import PlayerModel
 
 
@@ -13,10 +17,26 @@ class PlayerState:
         self.points = 0
         self.tiles: list[Tile] = []
         self.meeples: list["Meeple"] = [Meeple(player_id) for _ in range(NUM_MEEPLES)]
-        self.connection: PlayerConnection
-
-    def connect(self) -> None:
-        self.connection = PlayerConnection(self.id)
+        self.connection: BaseConnection
+
+        # Censored events not yet sent to the player, by index in the event history
+        self.outbound: dict[int, EventType] = {}
+
+    def connect(
+        self, connection_factory: Callable[[int], BaseConnection] = PlayerConnection
+    ) -> None:
+        self.connection = connection_factory(self.id)
+
+    def take_outbound(self) -> dict[int, EventType]:
+        """Events to send with the next query, by index in the event history"""
+        if not self.outbound:
+            raise RuntimeError(
+                "No events queued for the player, did you try to send two queries without committing the first?"
+            )
+
+        # Events are censored and queued as they are committed, see StateMutator.commit
+        update, self.outbound = self.outbound, {}
+        return update
 
     def _get_available_meeple(self) -> Meeple | None:
         available_meeples = [m for m in self.meeples if m.placed is None]
@@ -1,11 +1,10 @@
-from typing import cast
-
-from lib.interact.tile import NO_POINTS, TileModifier, StructureType
-from engine.game.tile_subscriber import MonastaryNeighbourSubsciber
+from engine.interface.io.censor_event import CensorEvent
+from engine.interface.logging.recording_writer import RecordingWriter
 from engine.state.game_state import GameState
+from engine.state.turn_analysis import TurnAnalysis
 
 from lib.config.map_config import MONASTARY_IDENTIFIER
-from lib.config.scoring import POINT_LIMIT
+from lib.config.scoring import MONASTARY_POINTS, NO_POINTS, POINT_LIMIT
 from lib.interface.events.event_player_bannned import EventPlayerBanned
 from lib.interface.events.event_player_turn_started import EventPlayerTurnStarted
 from lib.interface.events.event_player_won import EventPlayerWon
@@ -35,9 +34,18 @@ from lib.interface.events.typing import EventType
 class StateMutator:
     def __init__(self, state: GameState) -> None:
         self.state = state
+        self.censor = CensorEvent(state)
+        self.recording: RecordingWriter | None = None
 
     def commit(self, event: EventType) -> None:
+        index = len(self.state.event_history)
         self.state.event_history.append(event)
+        if self.recording is not None:
+            self.recording.write(event)
+
+        # Censored once here, each player's next query sends what queued up
+        for player_id, censored in self.censor.censor(event).items():
+            self.state.players[player_id].outbound[index] = censored
 
         match event:
             case EventGameStarted() as e:
@@ -91,49 +99,27 @@ class StateMutator:
         """
         # Get tile from player hand
         tile = self.state.players[move.player_id].tiles.pop(move.player_tile_index)
-        while tile.rotation != move.tile.rotation:
-            tile.rotate_clockwise(1)
-
-        self.state.map._grid[move.tile.pos[1]][move.tile.pos[0]] = tile
-        self.state.map.placed_tiles.append(tile)
-        if tile.straight_river():
-            self.state.map.straight_rivers -= 1
+        tile.rotation = move.tile.rotation
 
-        # Keep track of tile placed for meeple placement
-        self.state.tile_placed = tile
-        tile.placed_pos = move.tile.pos
+        self.state.map.place_tile(tile, move.tile.pos)
 
-        # Check for any complete connected componentes
-        completed_components = self.state.get_completed_components(tile)
+        # Everything the meeple move needs to know about the tile, worked out once
+        turn = self.state.turn = TurnAnalysis(self.state.map, tile)
 
         player_point_limit = -1
 
-        internal_edges_visited: set[str] = set()
-
         # Check for base/regular connected components
-        for internal_edge, connected_component in completed_components.items():
-            if internal_edge in internal_edges_visited:
-                continue
-
-            unique_connected_tiles = set([t for t, _ in connected_component])
-            # Get number of unique tiles
-            reward = StructureType.get_points(tile.internal_edges[internal_edge]) * len(
-                unique_connected_tiles
-            )
-
-            structure_type = tile.internal_edges[internal_edge]
-
-            for t in unique_connected_tiles:
-                reward = TileModifier.apply_point_modifiers(t, structure_type, reward)
+        for internal_edge, component in turn.completed.items():
+            reward = turn.rewards[internal_edge]
 
             players_rewarded: set[int] = set()
 
-            for connected_tile, connected_edge in connected_component:
-                connected_meeple = connected_tile.internal_claims[connected_edge]
-
-                if connected_meeple is None:
-                    continue
+            # Freeing a meeple removes it from the component's claims
+            connected_meeples = [
+                meeple for meeples in component.claims.values() for meeple in meeples
+            ]
 
+            for connected_meeple in connected_meeples:
                 assert connected_meeple.placed
 
                 if connected_meeple.player_id in players_rewarded:
@@ -145,7 +131,7 @@ class StateMutator:
                             placed_on=connected_meeple.placed_edge,
                         )
                     )
-                    connected_meeple._free_meeple()
+                    self.state.map.free_meeple(connected_meeple)
                     continue
 
                 self.state.players[connected_meeple.player_id].points += reward
@@ -157,7 +143,7 @@ class StateMutator:
                         placed_on=connected_meeple.placed_edge,
                     )
                 )
-                connected_meeple._free_meeple()
+                self.state.map.free_meeple(connected_meeple)
 
                 if (
                     player_point_limit < 0
@@ -170,33 +156,33 @@ class StateMutator:
 
             # If meeples freed -> don't reclaim later
             if players_rewarded:
-                self.state.tile_placed_claims.add(internal_edge)
-
-            internal_edges_visited.add(internal_edge)
+                turn.freed.add(internal_edge)
 
-        # Check for monastary/special completed componentes
-        for subscribed_complete in self.state.tile_publisher.check_notify(tile):
-            for player_id, reward, t, reward_edge in subscribed_complete._reward():
-                self.state.players[player_id].points += reward
+        # Check for claimed monastaries this tile completed
+        assert tile.placed_pos
+        for monastary in self.state.map.monastaries.completed_by(tile.placed_pos):
+            meeple = monastary.internal_claims[MONASTARY_IDENTIFIER]
+            if meeple is None:
+                continue
 
-                if (
-                    self.state.players[player_id].points >= POINT_LIMIT
-                    and player_point_limit < 0
-                ):
-                    player_point_limit = player_id
+            player_id = meeple.player_id
+            self.state.players[player_id].points += MONASTARY_POINTS
 
-                meeple = t.internal_claims[reward_edge]
-                assert meeple is not None
+            if (
+                self.state.players[player_id].points >= POINT_LIMIT
+                and player_point_limit < 0
+            ):
+                player_point_limit = player_id
 
-                self.commit(
-                    EventPlayerMeepleFreed(
-                        player_id=player_id,
-                        reward=reward,
-                        tile=t._to_model(),
-                        placed_on=reward_edge,
-                    )
+            self.commit(
+                EventPlayerMeepleFreed(
+                    player_id=player_id,
+                    reward=MONASTARY_POINTS,
+                    tile=monastary._to_model(),
+                    placed_on=MONASTARY_IDENTIFIER,
                 )
-                meeple._free_meeple()
+            )
+            self.state.map.free_meeple(meeple)
 
         if player_point_limit >= 0:
             self.commit(EventGameEndedPointLimitReached(player_id=player_point_limit))
@@ -206,88 +192,53 @@ class StateMutator:
         Player Meeple Placed Event
         """
         player = self.state.players[move.player_id]
-        assert self.state.tile_placed
+        turn = self.state.turn
+        assert turn is not None
 
-        # self.state.tile_placed.internal_claims[move.placed_on] = move.player_id
         meeple = player._get_available_meeple()
         assert meeple is not None
 
-        meeple._place_meeple(self.state.tile_placed, move.placed_on)
-
-        completed_components = self.state.get_completed_components(
-            self.state.tile_placed
-        )
+        self.state.map.place_meeple(meeple, turn.tile, move.placed_on)
 
         # This segment checks if player placed a meeple on a completed tile
         if move.placed_on == MONASTARY_IDENTIFIER:
-            tile_subsciber = MonastaryNeighbourSubsciber(
-                move.tile.pos, player.id, self.state.tile_placed, move.placed_on
-            )
-            tile_subsciber.register_to(self.state.tile_publisher, self.state.map._grid)
-
-            for subscribed_complete in self.state.tile_publisher.check_notify(
-                self.state.tile_placed
-            ):
-                if not isinstance(subscribed_complete, MonastaryNeighbourSubsciber):
-                    continue
-
-                subscribed_complete = cast(
-                    MonastaryNeighbourSubsciber, subscribed_complete
-                )
-
-                if move.tile.pos != subscribed_complete.center:
-                    assert False
-                    continue
-
-                rewarded_set = subscribed_complete._reward()
-
-                # In meeple placement phase only one should be rewarded
-                assert len(rewarded_set) == 1
-                player_id, reward, t, e = rewarded_set[0]
-                self.state.players[player_id].points += reward
-
-                meeple = t.internal_claims[e]
-                assert meeple is not None
-                assert player_id == move.player_id
-
+            if turn.monastary_complete:
+                player.points += MONASTARY_POINTS
                 self.commit(
                     EventPlayerMeepleFreed(
-                        player_id=player_id,
-                        reward=reward,
-                        tile=t._to_model(),
-                        placed_on=e,
+                        player_id=player.id,
+                        reward=MONASTARY_POINTS,
+                        tile=turn.tile._to_model(),
+                        placed_on=move.placed_on,
                     )
                 )
-                meeple._free_meeple()
+                self.state.map.free_meeple(meeple)
 
         # Check the player completed a reguar component and claimed
-        elif move.placed_on in completed_components:
-            reward = StructureType.get_points(
-                self.state.tile_placed.internal_edges[move.placed_on]
-            ) * len(set([t for t, _ in completed_components[move.placed_on]]))
+        elif move.placed_on in turn.completed:
+            # No emblem bonus when claiming an already completed structure
+            reward = turn.completed[move.placed_on].get_claim_reward()
 
             player.points += reward
             self.commit(
                 EventPlayerMeepleFreed(
                     player_id=player.id,
                     reward=reward,
-                    tile=self.state.tile_placed._to_model(),
+                    tile=turn.tile._to_model(),
                     placed_on=move.placed_on,
                 )
             )
-            meeple._free_meeple()
+            self.state.map.free_meeple(meeple)
 
         # Cleanup intermeidate state variables
-        self.state.tile_placed = None
-        self.state.tile_placed_claims = set()
+        self.state.turn = None
 
         if self.state.players[move.player_id].points >= POINT_LIMIT:
             self.commit(EventGameEndedPointLimitReached(player_id=move.player_id))
 
     def _commit_move_place_meeple_pass(self, move: MovePlaceMeeplePass) -> None:
         # Cleanup intermeidate state variables
-        self.state.tile_placed = None
-        self.state.tile_placed_claims = set()
+        self.state.turn = None
 
     def _commit_event_game_started(self, e: EventGameStarted) -> None:
         """
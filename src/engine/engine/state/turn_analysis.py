@@ -0,0 +1,61 @@
+from lib.interact.map import Map
+from lib.interact.structure_tracker import StructureComponent
+from lib.interact.tile import EDGES, Tile, TileModifier
+
+
+class TurnAnalysis:
+    """
+    TurnAnalysis
+    _The structures around the tile placed this turn, looked up once_
+    - Built by StateMutator when the tile is placed and read again by the
+      MoveValidator and StateMutator for the meeple move of the same turn
+    - Components are the tracker's own objects, their claims stay live as
+      meeples are freed
+    - `completed` keeps the first edge of every structure the tile completed,
+      with its reward in `rewards`, like GameLogic.get_completed_structures
+    - `freed` holds the completed edges that paid out, they can not be claimed
+    """
+
+    __slots__ = (
+        "tile",
+        "components",
+        "completed",
+        "rewards",
+        "monastary_complete",
+        "freed",
+    )
+
+    def __init__(self, map: Map, tile: Tile) -> None:
+        find_component = map.structures.get_component
+
+        self.tile = tile
+        self.components: dict[str, StructureComponent | None] = {}
+        self.completed: dict[str, StructureComponent] = {}
+        self.rewards: dict[str, int] = {}
+
+        for edge in EDGES:
+            component = self.components[edge] = find_component(tile, edge)
+
+            # A complete structure has tiles on all its edges, this one included
+            if component is None or not component.is_complete:
+                continue
+
+            if any(component is c for c in self.completed.values()):
+                continue
+
+            self.completed[edge] = component
+            self.rewards[edge] = component.get_reward()
+
+        self.monastary_complete = (
+            TileModifier.MONASTARY in tile.modifiers
+            and map.monastaries.is_complete(tile)
+        )
+        self.freed: set[str] = set()
+
+    def get_claims(self, edge: str) -> list[int]:
+        """Players with meeples on the structure at the edge, like GameLogic._get_claims"""
+        component = self.components.get(edge)
+        if component is None:
+            return []
+
+        return list(component.claims)
@@ -1,2 +1,15 @@
+import sys
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--startup-report":
+        from lib.startup import startup_report
+
+        # A submission is imported without running its main(), like helper.pool does
+        code = "import helper.game"
+        if len(sys.argv) > 2:
+            code += f"; import runpy; runpy.run_path({sys.argv[2]!r}, run_name='submission')"
+
+        print(startup_report(code))
+        sys.exit(0)
+
     print("Carcassonne Helper Module Sucessfully Intalled")
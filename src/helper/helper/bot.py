@@ -0,0 +1,25 @@
+from typing import Protocol
+
+from helper.game import Game
+from lib.interface.queries.typing import QueryType
+from lib.interface.events.moves.typing import MoveType
+
+
+class Bot(Protocol):
+    """
+    Bot
+    _A bot written as an object so the same code can be run as a submission or in-process_
+    - `game.state` is kept up to date before `choose_move` is called
+    - As a submission, create it with `Game()` and hand it to `run`
+    - Headless (engine.headless), it is created with `Game(LocalConnection())`
+    """
+
+    game: Game
+
+    def choose_move(self, query: QueryType) -> MoveType: ...
+
+
+def run(bot: Bot) -> None:
+    while True:
+        query = bot.game.get_next_query()
+        bot.game.send_move(bot.choose_move(query))
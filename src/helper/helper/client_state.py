@@ -1,14 +1,23 @@
-from lib.config.map_config import MAX_MAP_LENGTH, MONASTARY_IDENTIFIER
+from lib.config.map_config import MONASTARY_IDENTIFIER
+from lib.config.scoring import MONASTARY_POINTS
 from lib.game.game_logic import GameLogic
+from lib.game.scoring import final_points
 from lib.interact.meeple import Meeple
 from lib.interact.map import Map
 from lib.interact.tile import Tile, TileModifier
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import (
+    MovePlaceTile,
+    PublicMovePlaceTile,
+)
 from lib.interface.events.typing import EventType
 from lib.models.player_model import PlayerModel, PublicPlayerModel
 from lib.models.tile_model import TileModel
 from lib.interact.structure import StructureType
-
-from copy import deepcopy
+from lib.rules import CLAIMABLE, STRUCTURE_CODE
 
 
 class ClientSate(GameLogic):
@@ -28,53 +37,189 @@ class ClientSate(GameLogic):
         self.me: PlayerModel
         self.my_tiles: list[Tile] = []
 
+        # Marks of the moves applied with apply_moves, most recent last
+        self._applied: list[int] = []
+
+    def snapshot(self) -> int:
+        """
+        Snapshot
+        _Marks the current state so it can be restored, without copying anything_
+        - Changes made through apply_moves (or the map) after this are logged
+        - Snapshots can be nested and must be restored most recent first
+        - The state must not be updated from the engine until it is restored
+        """
+        return self.map.checkpoint()
+
+    def restore(self, mark: int) -> None:
+        # Moves applied since the snapshot are always logged after it
+        while self._applied and self._applied[-1] >= mark:
+            self.undo_moves()
+
+        self.map.rollback(mark)
+
+    def apply_moves(
+        self,
+        tile_move: MovePlaceTile | PublicMovePlaceTile,
+        meeple_move: MovePlaceMeeple | MovePlaceMeeplePass,
+    ) -> None:
+        """
+        Apply Moves
+        _Plays a tile and meeple move on this state and scores them like the engine would_
+        - The moves are not validated, see Game.can_place_tile_at
+        - My tiles are taken from my hand by index, anyone else's from the unplayed tiles
+        - The game is not ended when a player reaches the point limit
+        - Undo with undo_moves, which is much cheaper than copying the state
+        """
+        self._applied.append(self.map.checkpoint())
+        journal = self.map.journal
+        assert journal is not None
+
+        player_id = tile_move.player_id
+        x, y = tile_move.tile.pos
+
+        if player_id == self.me.player_id:
+            assert isinstance(tile_move, MovePlaceTile)
+            index = tile_move.player_tile_index
+            tile = self.my_tiles.pop(index)
+            journal.append((self.my_tiles.insert, (index, tile)))
+        else:
+            tile = self.map.get_tile_by_type(tile_move.tile.tile_type, pop=True)
+            journal.append((self.map.deck.add, (tile,)))
+
+        self._set_logged(self.players[player_id], "num_tiles", -1)
+        journal.append((setattr, (tile, "rotation", tile.rotation)))
+        tile.rotation = tile_move.tile.rotation
+        self.map.place_tile(tile, (x, y))
+
+        # Completed structures reward each player on them once and free every meeple
+        for structure in self.get_completed_structures(tile).values():
+            reward = structure.get_reward()
+            for claimant, claimed in list(structure.claims.items()):
+                self._reward_logged(claimant, reward)
+                for connected_meeple in list(claimed):
+                    self._free_logged(connected_meeple)
+
+        for monastary in self._completed_monastaries(x, y):
+            monastary_meeple = monastary.internal_claims[MONASTARY_IDENTIFIER]
+            assert monastary_meeple is not None
+            self._reward_logged(monastary_meeple.player_id, MONASTARY_POINTS)
+            self._free_logged(monastary_meeple)
+
+        if not isinstance(meeple_move, MovePlaceMeeple):
+            return
+
+        meeple = Meeple(player_id)
+        edge = meeple_move.placed_on
+        self.map.place_meeple(meeple, tile, edge)
+        journal.append(
+            (
+                self.players_meeples.__setitem__,
+                (player_id, self.players_meeples[player_id]),
+            )
+        )
+        self.players_meeples[player_id] -= 1
+        if player_id == self.me.player_id:
+            self._set_logged(self.me, "num_meeples", -1)
+
+        # A meeple claiming a finished structure scores straight away
+        if edge == MONASTARY_IDENTIFIER:
+            if self.map.monastaries.is_complete(tile):
+                self._reward_logged(player_id, MONASTARY_POINTS)
+                self._free_logged(meeple)
+            return
+
+        component = self.map.structures.get_component(tile, edge)
+        if component is not None and component.is_complete:
+            # No emblem bonus when claiming an already completed structure
+            self._reward_logged(player_id, component.get_claim_reward())
+            self._free_logged(meeple)
+
+    def undo_moves(self) -> None:
+        """Undoes the most recent apply_moves"""
+        self.map.rollback(self._applied.pop())
+
+    def _completed_monastaries(self, x: int, y: int) -> list[Tile]:
+        """Claimed monastaries around (x, y) with all 9 tiles of their 3x3 placed"""
+        return [
+            tile
+            for tile in self.map.monastaries.completed_by((x, y))
+            if tile.internal_claims[MONASTARY_IDENTIFIER] is not None
+        ]
+
+    def _set_logged(
+        self, model: PlayerModel | PublicPlayerModel, field: str, change: int
+    ) -> None:
+        assert self.map.journal is not None
+        value = getattr(model, field)
+        self.map.journal.append((setattr, (model, field, value)))
+        setattr(model, field, value + change)
+
+    def _reward_logged(self, player_id: int, reward: int) -> None:
+        self._set_logged(self.players[player_id], "points", reward)
+        if player_id == self.me.player_id:
+            self._set_logged(self.me, "points", reward)
+
+    def _free_logged(self, meeple: Meeple) -> None:
+        assert self.map.journal is not None
+        player_id = meeple.player_id
+        self.map.free_meeple(meeple)
+
+        self.map.journal.append(
+            (
+                self.players_meeples.__setitem__,
+                (player_id, self.players_meeples[player_id]),
+            )
+        )
+        self.players_meeples[player_id] += 1
+        if player_id == self.me.player_id:
+            self._set_logged(self.me, "num_meeples", 1)
+
     def get_meeples_placed_by(self, player_id: int | None) -> list[Meeple]:
         """
         Get Meeples Placed
         Giving None as player id retruns all placed meeples
         """
         meeples = []
-        for x in range(MAX_MAP_LENGTH):
-            for y in range(MAX_MAP_LENGTH):
-                tile = self.map._grid[y][x]
-
-                if tile is None:
-                    continue
-
-                for edge, meeple in tile.internal_claims.items():
-                    if meeple and (meeple.player_id == player_id or player_id is None):
-                        meeples.append(meeple)
+        for _, tile in self.map.iter_tiles():
+            for edge, meeple in tile.internal_claims.items():
+                if meeple and (meeple.player_id == player_id or player_id is None):
+                    meeples.append(meeple)
 
         return meeples
 
+    def get_final_points(self) -> dict[int, int]:
+        """
+        Get Final Points
+        Points of every player if the game ended now, with claimed structures
+        scored the way the engine scores them at the end of the game
+        """
+        return final_points(
+            self.map,
+            {player_id: player.points for player_id, player in self.players.items()},
+            self.get_meeples_placed_by(None),
+        )
+
     def get_tile_structures(self, tile: TileModel) -> dict[str, StructureType]:
         # Does not return monastary
         found_tile: Tile | None = None
-        for t in self.map.available_tiles.union(set(self.map.placed_tiles)):
+        for t in [*self.map.deck, *self.map.placed_tiles]:
             if tile.tile_type == t.tile_type:
                 found_tile = t
 
         assert found_tile
-        found_tile = deepcopy(found_tile)
-
-        while found_tile.rotation != tile.rotation:
-            found_tile.rotate_clockwise(1)
-
-        return {
-            edge: structure for edge, structure in found_tile.internal_edges.items()
-        }
+        return dict(found_tile.get_rotated_edges(tile.rotation))
 
     def get_placeable_structures(self, my_tile: TileModel) -> dict[str, StructureType]:
         placable_structures: dict[str, StructureType] = {
             e: s
             for e, s in self.get_tile_structures(my_tile).items()
-            if StructureType.can_claim(s)
+            if CLAIMABLE[STRUCTURE_CODE[s]]
         }
 
         print(placable_structures, flush=True)
 
         x, y = my_tile.pos
-        tile = self.map._grid[y][x]
+        tile = self.map.get_tile(x, y)
 
         assert tile is not None
 
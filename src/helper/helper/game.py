@@ -1,4 +1,5 @@
 from lib.interact.tile import StructureType, Tile
+from lib.rules import EDGE_INDEX, OPPOSITE, edge_code, is_compatible
 from lib.interface.queries.query_place_tile import QueryPlaceTile
 from lib.interface.queries.query_place_meeple import QueryPlaceMeeple
 from lib.interface.queries.typing import QueryType
@@ -10,15 +11,15 @@ from lib.interface.events.moves.move_place_tile import MovePlaceTile
 from lib.interface.events.moves.typing import MoveType
 from helper.client_state import ClientSate
 from helper.state_mutator import StateMutator
-from helper.interface import Connection
+from helper.interface import Connection, LocalConnection
 from lib.models.tile_model import TileModel
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, connection: Connection | LocalConnection | None = None) -> None:
         self.state = ClientSate()
         self.mutator = StateMutator(self.state)
-        self.connection = Connection()
+        self.connection = connection if connection is not None else Connection()
 
     def get_next_query(self) -> QueryType:
         query = self.connection.get_next_query()
@@ -53,7 +54,7 @@ class Game:
         )
 
     def can_place_tile_at(self, tile: Tile, x: int, y: int) -> bool:
-        if self.state.map._grid[y][x]:
+        if self.state.map.get_tile(x, y):
             return False  # Already occupied
 
         directions = {
@@ -63,13 +64,6 @@ class Game:
             (-1, 0): "left_edge",
         }
 
-        edge_opposite = {
-            "top_edge": "bottom_edge",
-            "bottom_edge": "top_edge",
-            "left_edge": "right_edge",
-            "right_edge": "left_edge",
-        }
-
         print(f"Checking if tile can be placed {x, y}")
         has_any_neighbour = False
 
@@ -83,13 +77,7 @@ class Game:
                     f"Checking if tile neighbour compatible - {nx, ny} with rotation {tile.rotation}"
                 )
 
-                if not (
-                    0 <= ny < len(self.state.map._grid)
-                    and 0 <= nx < len(self.state.map._grid[0])
-                ):
-                    continue
-
-                neighbour_tile = self.state.map._grid[ny][nx]
+                neighbour_tile = self.state.map.get_tile(nx, ny)
 
                 if neighbour_tile is None:
                     continue
@@ -97,9 +85,9 @@ class Game:
                 has_any_neighbour = True
                 # print(tile.internal_edges[edge], edge, tile.rotation, tile.tile_type)
                 # print(neighbour_tile.internal_edges[edge_opposite[edge]])
-                if not StructureType.is_compatible(
-                    tile.internal_edges[edge],
-                    neighbour_tile.internal_edges[edge_opposite[edge]],
+                i = EDGE_INDEX[edge]
+                if not is_compatible(
+                    edge_code(tile, i), edge_code(neighbour_tile, OPPOSITE[i])
                 ):
                     print("Edge Missmatch")
                     break  # mismatch, try next rotation
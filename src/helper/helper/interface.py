@@ -1,54 +1,61 @@
-import math
+from collections import deque
 
+from lib.interface.io.wire import FrameReader, WireProtocol, compact_loads, dump_frame
 from lib.interface.queries.typing import QueryType, QueryTypeAdapter
 from lib.interface.events.moves.typing import MoveType
 
 MAX_CHARACTERS_READ = 1000000
-READ_CHUNK_SIZE = 1024
 
 
 class Connection:
     def __init__(self) -> None:
-        self._to_engine_pipe = open("./io/to_engine.pipe", "w")
-        self._from_engine_pipe = open("./io/from_engine.pipe", "r")
+        self._to_engine_pipe = open("./io/to_engine.pipe", "wb")
+        self._from_engine_pipe = open("./io/from_engine.pipe", "rb", buffering=0)
+        self._reader = FrameReader(self._from_engine_pipe, MAX_CHARACTERS_READ)
+
+        # Moves are sent in the format of the last query, see lib.interface.io.wire
+        self._protocol: WireProtocol = "json"
+
+    def _receive(self) -> memoryview:
+        try:
+            self._protocol, data = self._reader.read()
+        except ValueError as e:
+            print(e)
+            raise RuntimeError("Please send us a discord message with this error log.")
+
+        return data
+
+    def get_next_query(self) -> QueryType:
+        data = self._receive()
+        if self._protocol == "compact":
+            return QueryTypeAdapter.model_validate(compact_loads(data)).root
+
+        return QueryTypeAdapter.model_validate_json(bytes(data)).root
 
-    def _send(self, data: str) -> None:
-        self._to_engine_pipe.write(str(len(data)) + ",")
-        self._to_engine_pipe.write(data)
+    def send_move(self, move: MoveType) -> None:
+        self._to_engine_pipe.write(dump_frame(move, self._protocol))
         self._to_engine_pipe.flush()
 
-    def _receive(self) -> str:
-        # Read size of message.
-        buffer = bytearray()
-        while len(buffer) < math.floor(math.log10(MAX_CHARACTERS_READ)) + 1 and (
-            len(buffer) == 0 or buffer[-1] != ord(",")
-        ):
-            buffer.extend(self._from_engine_pipe.read(1).encode())
-
-        if buffer[-1] == ord(","):
-            size = int(buffer[0:-1].decode())
-        else:
-            print(buffer)
-            raise RuntimeError("Please send us a discord message with this error log.")
 
-        if size > MAX_CHARACTERS_READ:
-            raise RuntimeError("Please send us a discord message with this error log.")
+class LocalConnection:
+    """
+    LocalConnection
+    _Stand in for Connection when the bot is hosted inside the engine process (see engine.headless)_
+    - Queries are handed over as objects, no pipes are opened
+    """
 
-        # Read message.
-        buffer = bytearray()
-        while len(buffer) < size:
-            buffer.extend(
-                bytearray(
-                    self._from_engine_pipe.read(
-                        min((size - len(buffer)), READ_CHUNK_SIZE)
-                    ).encode()
-                )
-            )
+    def __init__(self) -> None:
+        self._queries: deque[QueryType] = deque()
+        self._moves: deque[MoveType] = deque()
 
-        return buffer.decode()
+    def put_query(self, query: QueryType) -> None:
+        self._queries.append(query)
 
     def get_next_query(self) -> QueryType:
-        return QueryTypeAdapter.model_validate_json(self._receive()).root
+        return self._queries.popleft()
 
     def send_move(self, move: MoveType) -> None:
-        self._send(move.model_dump_json())
+        self._moves.append(move)
+
+    def take_move(self) -> MoveType:
+        return self._moves.popleft()
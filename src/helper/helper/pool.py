@@ -0,0 +1,69 @@
+"""
+Pool
+_Runs a submission as a long lived worker playing match after match (see match_simulator.SubmissionPool)_
+- The submission is imported once, each match then calls its `main()` again, which creates
+  a new Game (new ClientSate, new connection) in the sandbox it was sent
+- Sandboxes (`<root>/submission<n>`) are read from stdin, one per line, and "done" is written
+  back once the engine closed the pipes
+- Anything the submission keeps in module globals survives from one match to the next
+"""
+
+from importlib.util import module_from_spec, spec_from_file_location
+from types import ModuleType
+import os
+import sys
+import traceback
+
+
+def load_submission(path: str) -> ModuleType:
+    # Not imported as __main__, so the submission does not start playing on import
+    spec = spec_from_file_location("submission", path)
+    assert spec is not None and spec.loader is not None
+
+    module = module_from_spec(spec)
+    sys.modules["submission"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def play(submission: ModuleType, directory: str) -> None:
+    """Plays one match in the sandbox, logging to its io directory like a fresh process"""
+    os.chdir(directory)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with (
+        open("io/submission.log", "w") as f_log,
+        open("io/submission.err", "w") as f_err,
+    ):
+        os.dup2(f_log.fileno(), 1)
+        os.dup2(f_err.fileno(), 2)
+
+    try:
+        submission.main()
+    except (EOFError, BrokenPipeError):
+        # The engine closed the pipes, the match is over
+        pass
+    except Exception:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def main(path: str) -> None:
+    # stdout is the submission's log during a match, replies go to a copy of the original
+    control = os.fdopen(os.dup(1), "w")
+    submission = load_submission(path)
+
+    while directory := sys.stdin.readline().strip():
+        play(submission, directory)
+        control.write("done\n")
+        control.flush()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m helper.pool <submission.py>")
+        sys.exit(0)
+
+    main(os.path.abspath(sys.argv[1]))
@@ -118,9 +118,10 @@ class StateMutator:
         raise RuntimeError("Please send us a discord message with this error log.")
 
     def _commit_public_event_game_started(self, e: PublicEventGameStarted) -> None:
-        self.state.me = e.you
+        # Headless bots share event objects with the engine and each other, keep our own copy to mutate
+        self.state.me = e.you.model_copy(deep=True)
         self.state.turn_order = e.turn_order
-        self.state.players = {p.player_id: p for p in e.players}
+        self.state.players = {p.player_id: p.model_copy() for p in e.players}
         self.state.players_meeples = {
             p.player_id: e.num_starting_meeples for p in e.players
         }
@@ -130,10 +131,13 @@ class StateMutator:
 
     def _commit_event_player_meeple_freed(self, e: EventPlayerMeepleFreed) -> None:
         x, y = e.tile.pos
-        tile = self.state.map._grid[y][x]
+        tile = self.state.map.get_tile(x, y)
 
         assert tile is not None
-        tile.internal_claims[e.placed_on] = None
+        meeple = tile.internal_claims[e.placed_on]
+        assert meeple is not None
+
+        self.state.map.free_meeple(meeple)
         self.state.players_meeples[e.player_id] += 1
         self.state.players[e.player_id].points += e.reward
 
@@ -150,12 +154,8 @@ class StateMutator:
 
         x, y = e.tile.pos
         tile = self.state.my_tiles.pop(e.player_tile_index)
-        tile.placed_pos = x, y
 
-        self.state.map._grid[y][x] = tile
-        self.state.map.placed_tiles.append(tile)
-        if tile.straight_river():
-            self.state.map.straight_rivers -= 1
+        self.state.map.place_tile(tile, (x, y))
         self.state.players[e.player_id].num_tiles -= 1
 
         assert tile.rotation == e.tile.rotation
@@ -166,22 +166,18 @@ class StateMutator:
         x, y = e.tile.pos
         tile = self.state.map.get_tile_by_type(e.tile.tile_type, pop=True)
 
-        tile.placed_pos = x, y
-        self.state.map._grid[y][x] = tile
-        self.state.map.placed_tiles.append(tile)
-        if tile.straight_river():
-            self.state.map.straight_rivers -= 1
-        while tile.rotation != e.tile.rotation:
-            tile.rotate_clockwise(1)
+        tile.rotation = e.tile.rotation
+
+        self.state.map.place_tile(tile, (x, y))
 
     def _commit_move_place_meeple(self, e: MovePlaceMeeple) -> None:
         self.state.players_meeples[e.player_id] -= 1
 
         x, y = e.tile.pos
-        tile = self.state.map._grid[y][x]
+        tile = self.state.map.get_tile(x, y)
 
         assert tile is not None
-        tile.internal_claims[e.placed_on] = Meeple(e.player_id)
+        self.state.map.place_meeple(Meeple(e.player_id), tile, e.placed_on)
 
         if e.player_id == self.state.me.player_id:
             self.state.me.num_meeples -= 1
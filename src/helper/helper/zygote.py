@@ -0,0 +1,92 @@
+"""
+Zygote
+_Starts submissions by forking an interpreter that already imported lib and helper (see match_simulator.Zygote)_
+- Commands are read from stdin, one per line, and answered with one line:
+  `launch <root>/submission<n>` forks a submission and answers its pid,
+  `kill <pid>` kills one of its forks, waits for it and answers its exit status
+- The fork runs `submission.py` as __main__ from its directory, logging to its io directory,
+  like `python3 submission.py` would, without paying for the imports again
+- Forks are only reaped on `kill`, so their pid can not be reused by another process before
+  the caller is done with them. Only the zygote signals them, callers can not
+- Forks still running when stdin closes are killed
+"""
+
+from signal import SIGKILL
+import os
+import runpy
+import sys
+import traceback
+
+# Imported once here, every fork starts with them loaded
+import helper.game  # noqa: F401
+import lib.interface.events.typing  # noqa: F401
+import lib.interface.queries.typing  # noqa: F401
+
+
+def launch(directory: str) -> int:
+    pid = os.fork()
+    if pid != 0:
+        return pid
+
+    code = 0
+    try:
+        os.chdir(directory)
+
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        log = os.open("io/submission.log", os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        err = os.open("io/submission.err", os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        for fd, target in ((devnull, 0), (log, 1), (err, 2)):
+            os.dup2(fd, target)
+            os.close(fd)
+
+        sys.argv = ["submission.py"]
+        sys.path[0] = os.getcwd()
+        runpy.run_path("submission.py", run_name="__main__")
+
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def kill(pid: int) -> int:
+    try:
+        os.kill(pid, SIGKILL)
+    except ProcessLookupError:
+        pass
+    return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+
+
+def main() -> None:
+    forks: set[int] = set()
+
+    while line := sys.stdin.readline().strip():
+        command, _, argument = line.partition(" ")
+        match command:
+            case "launch":
+                pid = launch(argument)
+                forks.add(pid)
+                print(pid, flush=True)
+
+            case "kill" if argument.isdigit() and int(argument) in forks:
+                forks.remove(int(argument))
+                print(kill(int(argument)), flush=True)
+
+            case _:
+                print(f"unknown command {line}", flush=True)
+
+    for pid in forks:
+        kill(pid)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 from typing import Callable
 
-from dotmap import DotMap
+
+class TileCounts(dict[str, int]):
+    """Number of tiles of each type, also readable as attributes (`tile_counts.A`)"""
+
+    def __getattr__(self, tile_type: str) -> int:
+        try:
+            return self[tile_type]
+        except KeyError:
+            raise AttributeError(tile_type)
 
 
 MAX_MAP_LENGTH = 169
 MAP_CENTER = (85, 85)
 MONASTARY_IDENTIFIER = "MONASTARY"
 
-tile_counts = DotMap(
+tile_counts = TileCounts(
     {
         "A": 2,
         "B": 4,
@@ -44,8 +52,7 @@ tile_counts = DotMap(
         "R8": 1,
         "R9": 1,
         "RE": 1,
-    },
-    _dynamic=False,
+    }
 )
 
 NUM_PLACEABLE_TILE_TYPES = 9
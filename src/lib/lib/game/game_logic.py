@@ -1,10 +1,23 @@
 from lib.config.map_config import MONASTARY_IDENTIFIER
 from lib.interact.map import Map
 from lib.interact.meeple import Meeple
-from lib.interact.structure import StructureType
-from lib.interact.tile import Tile, TileModifier
-
-from collections import defaultdict, deque
+from lib.interact.structure_tracker import StructureComponent
+from lib.interact.tile import EDGES, Tile
+from lib.rules import (
+    ADJACENT,
+    BRIDGE,
+    BROKEN_CITY_FLAG,
+    CITY,
+    COMPATIBLE,
+    EDGE_INDEX,
+    OFFSETS,
+    OPPOSITE,
+    ROAD,
+    ROAD_START,
+    compile_tile,
+)
+
+from collections import deque
 from typing import Callable, Iterator, Protocol
 
 
@@ -14,8 +27,6 @@ class SharedGameState(Protocol):
 
 class GameLogic(SharedGameState):
     def _get_claims_objs(self, tile: "Tile", edge: str) -> dict[int, list[Meeple]]:
-        players = defaultdict(list)
-
         if edge == MONASTARY_IDENTIFIER:
             m = tile.internal_claims[edge]
             if not m:
@@ -23,16 +34,15 @@ class GameLogic(SharedGameState):
 
             return {m.player_id: [m]}
 
-        for connected_tile, e in self._traverse_connected_component(tile, edge):
-            meeple = connected_tile.internal_claims[e]
-            if meeple is not None:
-                players[meeple.player_id].append(meeple)
+        component = self.map.structures.get_component(tile, edge)
+        if component is None:
+            return {}
 
-        return players
+        return {
+            player_id: list(meeples) for player_id, meeples in component.claims.items()
+        }
 
     def _get_claims(self, tile: "Tile", edge: str) -> list[int]:
-        players: set[int] = set()
-
         if edge == MONASTARY_IDENTIFIER:
             m = tile.internal_claims[edge]
             if not m:
@@ -40,36 +50,18 @@ class GameLogic(SharedGameState):
 
             return [m.player_id]
 
-        for connected_tile, e in self._traverse_connected_component(tile, edge):
-            meeple = connected_tile.internal_claims[e]
-            if meeple is not None:
-                players.add(meeple.player_id)
+        component = self.map.structures.get_component(tile, edge)
+        if component is None:
+            return []
 
-        return list(players)
+        return list(component.claims)
 
     def _get_reward(self, tile: "Tile", edge: str, partial: bool = False) -> int:
-        visited_tiles = set()
-        structure_type = tile.internal_edges[edge]
-
-        total_points = 0
-
-        for connected_tile, _ in self._traverse_connected_component(tile, edge):
-            if connected_tile in visited_tiles:
-                continue
-
-            visited_tiles.add(connected_tile)
-
-            if not partial:
-                total_points += StructureType.get_points(structure_type)
+        component = self.map.structures.get_component(tile, edge)
+        if component is None:
+            return 0
 
-            else:
-                total_points += StructureType.get_partial_points(structure_type)
-
-            total_points = TileModifier.apply_point_modifiers(
-                connected_tile, structure_type, total_points
-            )
-
-        return total_points
+        return component.get_reward(partial)
 
     def _check_completed_component(self, start_tile: Tile, edge: str) -> bool:
         print("THIS IS DEPRECATED")
@@ -77,7 +69,7 @@ class GameLogic(SharedGameState):
 
         for tile, edge in component:
             assert tile.placed_pos is not None
-            if tile.get_external_tile(edge, tile.placed_pos, self.map._grid) is None:
+            if self.map.get_neighbour(tile.placed_pos, edge) is None:
                 return False
 
         return True
@@ -91,52 +83,50 @@ class GameLogic(SharedGameState):
 
         return edges_complete
 
-    def get_completed_components(
+    def get_completed_structures(
         self, start_tile: "Tile"
-    ) -> dict[str, set[tuple["Tile", str]]]:
+    ) -> dict[str, StructureComponent]:
         """
-        Get Completed Components
-        _Takes a starting tile and returns a map of internal edge to connected component if complete_
-        - Does not include internal edge if this was found earlier as part of another connected component
+        Get Completed Structures
+        _Takes a starting tile and returns a map of internal edge to its structure if complete_
+        - Does not include internal edge if its structure was found through an earlier edge
         """
-        edge_to_connected_component: dict[str, set[tuple["Tile", str]]] = {}
-        internal_visited_edges: set[str] = set()
+        completed: dict[str, StructureComponent] = {}
+        visited: list[StructureComponent] = []
 
-        for internal_edge, tile in start_tile.get_external_tiles(
-            self.map._grid
+        assert start_tile.placed_pos is not None
+        for internal_edge, tile in self.map.get_neighbours(
+            start_tile.placed_pos
         ).items():
             if tile is None:
                 continue
 
-            if internal_edge in internal_visited_edges:
+            component = self.map.structures.get_component(start_tile, internal_edge)
+            if component is None or not component.is_complete:
                 continue
 
-            connected_component = list(
-                self._traverse_connected_component(start_tile, internal_edge)
-            )
-
-            for connected_tile, connected_edge in connected_component:
-                assert connected_tile.placed_pos
-                external_tile = Tile.get_external_tile(
-                    connected_edge, connected_tile.placed_pos, self.map._grid
-                )
-                external_edge = Tile.get_opposite(connected_edge)
-
-                # Break if no neighbour
-                if not external_tile:
-                    break
-
-                assert (external_tile, external_edge) in connected_component
+            if any(component is c for c in visited):
+                continue
 
-                # Check if we are revisiting tile
-                if connected_tile == start_tile and internal_edge != connected_edge:
-                    internal_visited_edges.add(connected_edge)
+            visited.append(component)
+            completed[internal_edge] = component
 
-            # Runs if code didn't break
-            else:
-                edge_to_connected_component[internal_edge] = set(connected_component)
+        return completed
 
-        return edge_to_connected_component
+    def get_completed_components(
+        self, start_tile: "Tile"
+    ) -> dict[str, set[tuple["Tile", str]]]:
+        """
+        Get Completed Components
+        _Takes a starting tile and returns a map of internal edge to connected component if complete_
+        - Does not include internal edge if this was found earlier as part of another connected component
+        """
+        return {
+            internal_edge: set(component.members)
+            for internal_edge, component in self.get_completed_structures(
+                start_tile
+            ).items()
+        }
 
     def _traverse_connected_component(
         self,
@@ -145,89 +135,87 @@ class GameLogic(SharedGameState):
         yield_cond: Callable[[Tile, str], bool] = lambda _1, _2: True,
         modify: Callable[[Tile, str], None] = lambda _1, _2: None,
     ) -> Iterator[tuple["Tile", str]]:
-        visited = set()
+        visited: set[tuple[Tile, int]] = set()
 
         # Not a traversable edge - ie monastary etc
-        if edge not in start_tile.internal_edges.keys():
+        if edge not in EDGE_INDEX:
             return
 
-        structure_type = start_tile.internal_edges[edge]
-        structure_bridge = TileModifier.get_bridge_modifier(structure_type)
+        get_tile = self.map.get_tile
+        start_edge = EDGE_INDEX[edge]
+        structure = compile_tile(start_tile.definition).codes[start_tile.rotation][
+            start_edge
+        ]
+        bridge = BRIDGE[structure]
 
-        queue = deque([(start_tile, edge)])
+        queue = deque([(start_tile, start_edge)])
 
         while queue:
-            tile, edge = queue.popleft()
+            tile, e = queue.popleft()
 
-            if (tile, edge) in visited:
+            if (tile, e) in visited:
                 continue
 
             # Visiting portion of traversal
-            visited.add((tile, edge))
-            modify(tile, edge)
+            visited.add((tile, e))
+            modify(tile, EDGES[e])
+
+            if yield_cond(tile, EDGES[e]):
+                yield tile, EDGES[e]
 
-            if yield_cond(tile, edge):
-                yield tile, edge
+            rules = compile_tile(tile.definition)
+            codes = rules.codes[tile.rotation]
 
-            connected_internal_edges = [edge]
-            opposite_edge = Tile.get_opposite(edge)
+            connected_internal_edges = [e]
+            opposite_edge = OPPOSITE[e]
 
             # Check directly adjacent edges
-            for adjacent_edge in Tile.adjacent_edges(edge):
-                if (
-                    structure_type == StructureType.CITY
-                    and TileModifier.BROKEN_CITY in tile.modifiers
-                ):
+            for adjacent_edge in ADJACENT[e]:
+                if structure == CITY and rules.flags & BROKEN_CITY_FLAG:
                     continue
 
-                if structure_type == StructureType.ROAD_START and (
-                    tile.internal_edges[adjacent_edge] == StructureType.ROAD_START
-                ):
+                if structure == ROAD_START and codes[adjacent_edge] == ROAD_START:
                     continue
 
-                if tile.internal_edges[adjacent_edge] == structure_type:
+                if codes[adjacent_edge] == structure:
                     connected_internal_edges.append(adjacent_edge)
 
             # Opposite edge if adajcent connection
-            if (
-                len(connected_internal_edges) > 1
-                and tile.internal_edges[opposite_edge] == structure_type
-            ):
+            if len(connected_internal_edges) > 1 and codes[opposite_edge] == structure:
                 connected_internal_edges.append(opposite_edge)
 
             # Caes of opposite bridge
-            elif (
-                tile.internal_edges[opposite_edge] == structure_type
-                and structure_bridge
-                and structure_bridge in tile.modifiers
-            ):
+            elif codes[opposite_edge] == structure and rules.flags & bridge:
                 connected_internal_edges.append(opposite_edge)
 
-            if structure_type == StructureType.ROAD_START:
-                structure_type = StructureType.ROAD
-                structure_bridge = TileModifier.get_bridge_modifier(structure_type)
+            if structure == ROAD_START:
+                structure = ROAD
+                bridge = BRIDGE[structure]
 
             for adjacent_edge in connected_internal_edges[1:]:
                 visited.add((tile, adjacent_edge))
-                modify(tile, adjacent_edge)
+                modify(tile, EDGES[adjacent_edge])
 
-                if yield_cond(tile, adjacent_edge):
-                    yield tile, adjacent_edge
+                if yield_cond(tile, EDGES[adjacent_edge]):
+                    yield tile, EDGES[adjacent_edge]
 
             # External Tiles
+            assert tile.placed_pos
+            x, y = tile.placed_pos
             for ce in connected_internal_edges:
-                assert tile.placed_pos
-                ce_neighbour = Tile.get_opposite(ce)
+                ce_neighbour = OPPOSITE[ce]
 
-                external_tile = Tile.get_external_tile(
-                    ce, tile.placed_pos, self.map._grid
-                )
+                dx, dy = OFFSETS[ce]
+                external_tile = get_tile(x + dx, y + dy)
 
                 if external_tile is None:
                     continue
 
-                if not StructureType.is_compatible(
-                    structure_type, external_tile.internal_edges[ce_neighbour]
+                external_codes = compile_tile(external_tile.definition).codes
+                if (
+                    not COMPATIBLE[structure]
+                    >> external_codes[external_tile.rotation][ce_neighbour]
+                    & 1
                 ):
                     continue
 
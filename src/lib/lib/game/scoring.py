@@ -0,0 +1,71 @@
+from lib.config.map_config import MONASTARY_IDENTIFIER
+from lib.config.scoring import NO_POINTS
+from lib.interact.map import Map
+from lib.interact.meeple import Meeple
+from lib.interact.structure_tracker import StructureComponent
+
+from typing import Iterable
+
+# A meeple returned when the game ends and the points it brings its player
+FinalReward = tuple[Meeple, int]
+
+
+def final_rewards(map: Map, meeples: Iterable[Meeple]) -> list[FinalReward]:
+    """
+    final_rewards
+    _Scores every structure still claimed by the meeples when the game ends_
+    - Does not change the map, the caller frees the meeples it gets back
+    - Each structure is scored once from its tracked component, in the order its
+      first meeple comes up in `meeples`
+    - Players with the most meeples on a structure get its partial reward for one
+      meeple each, one meeple of every other player on it gets no points
+    - A monastary is worth a point for every filled position around it
+    """
+    rewards: list[FinalReward] = []
+    scored: set[StructureComponent] = set()
+
+    for meeple in meeples:
+        tile, edge = meeple.placed, meeple.placed_edge
+        if tile is None:
+            continue
+
+        if edge == MONASTARY_IDENTIFIER:
+            rewards.append((meeple, map.monastaries.count(tile)))
+            continue
+
+        component = map.structures.get_component(tile, edge)
+        assert component is not None
+        if component in scored:
+            continue
+
+        scored.add(component)
+
+        # Stable, so tied players keep the order they claimed the structure in
+        players_meeples = sorted(component.claims.values(), key=len, reverse=True)
+        most = len(players_meeples[0])
+        reward = component.get_reward(partial=True)
+
+        for player_meeples in players_meeples:
+            rewards.append(
+                (
+                    player_meeples[0],
+                    reward if len(player_meeples) == most else NO_POINTS,
+                )
+            )
+
+    return rewards
+
+
+def final_points(
+    map: Map, points: dict[int, int], meeples: Iterable[Meeple]
+) -> dict[int, int]:
+    """
+    final_points
+    _Points of every player if the game ended now, for evaluating a position_
+    - `points` are the players' current points, they are not changed
+    """
+    totals = dict(points)
+    for meeple, reward in final_rewards(map, meeples):
+        totals[meeple.player_id] = totals.get(meeple.player_id, 0) + reward
+
+    return totals
@@ -0,0 +1,108 @@
+from lib.interact.tile import Tile
+
+from random import Random
+from typing import Any, Iterable, Iterator
+
+DeckSnapshot = tuple[tuple[Tile, ...], tuple[Any, ...]]
+
+
+class Deck:
+    """
+    Deck
+    _The tiles left to draw, shuffled once from a seed when they are added_
+    - Draws take from the end of the shuffled order in O(1)
+    - Tiles can be taken out by type (a bot tracking what is left), in the deck and
+      in the tiles of its type the last tile fills the gap so this is O(1) as well
+    - A seed of None draws differently every game
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.random = Random(seed)
+
+        self._tiles: list[Tile] = []
+        self._positions: dict[Tile, int] = {}
+        self._by_type: dict[str, list[Tile]] = {}
+        self._type_positions: dict[Tile, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __iter__(self) -> Iterator[Tile]:
+        return iter(self._tiles)
+
+    def __contains__(self, tile: object) -> bool:
+        return tile in self._positions
+
+    def count(self, tile_type: str) -> int:
+        return len(self._by_type.get(tile_type, ()))
+
+    def extend(self, tiles: Iterable[Tile]) -> None:
+        """Adds the tiles and shuffles the whole deck"""
+        for tile in tiles:
+            self.add(tile)
+
+        self.random.shuffle(self._tiles)
+        self._positions = {tile: i for i, tile in enumerate(self._tiles)}
+
+    def add(self, tile: Tile) -> None:
+        """
+        Puts a tile back on top of the deck
+        - Not where it was drawn or taken from, so undoing ClientSate.apply_moves leaves
+          the other players' tile back in the deck but the deck in a different order
+        """
+        assert tile not in self._positions
+        self._positions[tile] = len(self._tiles)
+        self._tiles.append(tile)
+
+        same_type = self._by_type.setdefault(tile.tile_type, [])
+        self._type_positions[tile] = len(same_type)
+        same_type.append(tile)
+
+    def draw(self, count: int) -> list[Tile]:
+        if count > len(self._tiles):
+            raise ValueError(f"Can not draw {count} tiles, {len(self._tiles)} left")
+
+        drawn = self._tiles[len(self._tiles) - count :]
+        for tile in drawn:
+            self.remove(tile)
+
+        return drawn
+
+    def peek(self, tile_type: str) -> Tile:
+        return self._by_type[tile_type][0]
+
+    def take(self, tile_type: str) -> Tile:
+        """Takes any tile of the type out of the deck"""
+        tile = self._by_type[tile_type][-1]
+        self.remove(tile)
+        return tile
+
+    def remove(self, tile: Tile) -> None:
+        position = self._positions.pop(tile)
+        last = self._tiles.pop()
+        if last is not tile:
+            self._tiles[position] = last
+            self._positions[last] = position
+
+        position = self._type_positions.pop(tile)
+        same_type = self._by_type[tile.tile_type]
+        last = same_type.pop()
+        if last is not tile:
+            same_type[position] = last
+            self._type_positions[last] = position
+
+    def snapshot(self) -> DeckSnapshot:
+        return tuple(self._tiles), self.random.getstate()
+
+    def restore(self, snapshot: DeckSnapshot) -> None:
+        tiles, random_state = snapshot
+        self._tiles = list(tiles)
+        self._positions = {tile: i for i, tile in enumerate(self._tiles)}
+        self._by_type = {}
+        self._type_positions = {}
+        for tile in self._tiles:
+            same_type = self._by_type.setdefault(tile.tile_type, [])
+            self._type_positions[tile] = len(same_type)
+            same_type.append(tile)
+
+        self.random.setstate(random_state)
@@ -1,76 +1,423 @@
-from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Iterator, overload
+
 from lib.interact.tile import (
+    OPPOSITE_EDGES,
     Tile,
     create_base_tiles,
+    create_river_end_tile,
+    create_river_start_tile,
     create_river_tiles,
     # create_expansion_tiles,
 )
 
 from lib.config.map_config import MAX_MAP_LENGTH
+from lib.interact.deck import Deck
+from lib.interact.meeple import Meeple
+from lib.interact.monastary_tracker import MonastaryTracker
 from lib.interact.structure import StructureType
+from lib.interact.structure_tracker import Journal, StructureTracker
+from lib.rules import COMPATIBLE, EDGE_INDEX, RIVER, STRUCTURE_CODE, compile_tile
+
+
+# Same order as Tile.get_edges
+EDGE_OFFSETS: dict[str, tuple[int, int]] = {
+    "left_edge": (-1, 0),
+    "right_edge": (1, 0),
+    "top_edge": (0, -1),
+    "bottom_edge": (0, 1),
+}
+
+
+class MapRow(Sequence["Tile | None"]):
+    """
+    MapRow
+    _A single row of MapGrid, created on access_
+    """
+
+    __slots__ = ("_map", "_y")
+
+    def __init__(self, map: "Map", y: int) -> None:
+        self._map = map
+        self._y = y
+
+    @overload
+    def __getitem__(self, x: int) -> "Tile | None": ...
+
+    @overload
+    def __getitem__(self, x: slice) -> list["Tile | None"]: ...
+
+    def __getitem__(self, x: int | slice) -> "Tile | None | list[Tile | None]":
+        if isinstance(x, slice):
+            return [
+                self._map._tiles.get((i, self._y)) for i in range(MAX_MAP_LENGTH)[x]
+            ]
+
+        return self._map._tiles.get((x, self._y))
+
+    def __setitem__(self, x: int, tile: "Tile | None") -> None:
+        self._map._set_tile((x, self._y), tile)
+
+    def __len__(self) -> int:
+        return MAX_MAP_LENGTH
+
+
+class MapGrid(Sequence[MapRow]):
+    """
+    MapGrid
+    _Keeps the `grid[y][x]` access of the old MAX_MAP_LENGTH^2 list of lists over the sparse board_
+    - Prefer Map.get_tile / Map.get_neighbour, they skip the row object
+    """
+
+    __slots__ = ("_map",)
+
+    def __init__(self, map: "Map") -> None:
+        self._map = map
+
+    @overload
+    def __getitem__(self, y: int) -> MapRow: ...
+
+    @overload
+    def __getitem__(self, y: slice) -> list[MapRow]: ...
+
+    def __getitem__(self, y: int | slice) -> MapRow | list[MapRow]:
+        if isinstance(y, slice):
+            return [MapRow(self._map, i) for i in range(MAX_MAP_LENGTH)[y]]
+
+        return MapRow(self._map, y)
+
+    def __len__(self) -> int:
+        return MAX_MAP_LENGTH
 
 
 class Map:
-    def __init__(self) -> None:
+    def __init__(self, seed: int | None = None) -> None:
         self.placed_tiles: list[Tile] = []
-        self.available_tiles: set[Tile] = set()
-        self.available_tiles_by_type: dict[str, list[Tile]] = defaultdict(list)
 
-        self._grid: list[list[Tile | None]] = [
-            [None for _ in range(MAX_MAP_LENGTH)] for _ in range(MAX_MAP_LENGTH)
-        ]
+        # Tiles left to draw, shuffled from the seed at the start of each phase
+        self.deck = Deck(seed)
+
+        # Sparse board, only placed tiles are stored
+        self._tiles: dict[tuple[int, int], Tile] = {}
+        self._grid = MapGrid(self)
+
+        # Bounding box of placed tiles (min_x, min_y, max_x, max_y)
+        self.bounds: tuple[int, int, int, int] | None = None
+
+        # Empty positions next to a placed tile, with the structure each side
+        # must be compatible with (edge of the empty position -> neighbour's facing edge)
+        self.frontier: dict[tuple[int, int], dict[str, StructureType]] = {}
+
+        # Connected structures, kept up to date as tiles and meeples are placed
+        self.structures = StructureTracker()
+        self.monastaries = MonastaryTracker(self._tiles)
         self.straight_rivers: int = 6
 
-    def start_base_phase(self) -> None:
-        assert not self.available_tiles
-        self.available_tiles.update(set(create_base_tiles()))
+        # Undo log shared with the structure tracker, only kept after a checkpoint
+        self.journal: Journal | None = None
+        self._checkpoints: list[int] = []
 
-        for tile in self.available_tiles:
-            self.available_tiles_by_type[tile.tile_type].append(tile)
+    def get_tile(self, x: int, y: int) -> Tile | None:
+        return self._tiles.get((x, y))
 
-    def start_river_phase(self) -> None:
-        assert not self.available_tiles
+    def get_neighbour(self, pos: tuple[int, int], edge: str) -> Tile | None:
+        dx, dy = EDGE_OFFSETS[edge]
+        return self._tiles.get((pos[0] + dx, pos[1] + dy))
 
-        self.available_tiles.update(set(create_river_tiles()))
+    def get_neighbours(self, pos: tuple[int, int]) -> dict[str, Tile | None]:
+        x, y = pos
+        return {
+            edge: self._tiles.get((x + dx, y + dy))
+            for edge, (dx, dy) in EDGE_OFFSETS.items()
+        }
 
-        for tile in self.available_tiles:
-            self.available_tiles_by_type[tile.tile_type].append(tile)
+    def iter_tiles(self) -> Iterator[tuple[tuple[int, int], Tile]]:
+        """Iterates the board, O(placed tiles)"""
+        return iter(self._tiles.items())
 
-    def place_river_start(self, pos: tuple[int, int]) -> None:
-        starting_tile = Tile.get_starting_tile()
-        starting_tile.placed_pos = pos
+    def checkpoint(self) -> int:
+        """
+        Checkpoint
+        _Starts logging changes so they can be undone with rollback_
+        - Returns a mark to roll back to, checkpoints can be nested
+        - Only placing tiles on empty positions and placing or freeing meeples
+          through this class is logged, anything else must be undone by the caller
+        - Callers may log their own changes with `map.journal.append((fn, args))`
+        - Logging stops once every checkpoint has been rolled back
+        """
+        if self.journal is None:
+            self.journal = []
+            self.structures.journal = self.journal
+            self.monastaries.journal = self.journal
+
+        self._checkpoints.append(len(self.journal))
+        return len(self.journal)
+
+    def rollback(self, mark: int) -> None:
+        """Undoes every logged change since the checkpoint that returned mark, and any nested in it"""
+        journal = self.journal
+        assert journal is not None
+
+        while self._checkpoints[-1] > mark:
+            self._checkpoints.pop()
+        assert self._checkpoints.pop() == mark
+
+        for _ in range(len(journal) - mark):
+            fn, args = journal.pop()
+            fn(*args)
+
+        if not self._checkpoints:
+            self.journal = None
+            self.structures.journal = None
+            self.monastaries.journal = None
+
+    def place_tile(self, tile: Tile, pos: tuple[int, int]) -> None:
+        if self.journal is not None:
+            assert pos not in self._tiles
+            x, y = pos
+            self.journal.append(
+                (
+                    self._unplace_tile,
+                    (
+                        tile,
+                        tile.placed_pos,
+                        self.bounds,
+                        self.straight_rivers,
+                        [
+                            (p, self.frontier.get(p))
+                            for p in (
+                                pos,
+                                (x - 1, y),
+                                (x + 1, y),
+                                (x, y - 1),
+                                (x, y + 1),
+                            )
+                        ],
+                    ),
+                )
+            )
+
+        tile.placed_pos = pos
+        self._set_tile(pos, tile)
+        self.placed_tiles.append(tile)
+
+        if tile.straight_river():
+            self.straight_rivers -= 1
 
-        self._grid[pos[1]][pos[0]] = starting_tile
-        self.placed_tiles.append(starting_tile)
+    def place_meeple(self, meeple: Meeple, tile: Tile, edge: str) -> None:
+        if self.journal is not None:
+            self.journal.append((meeple._free_meeple, ()))
+
+        meeple._place_meeple(tile, edge)
+        self.structures.claim(tile, edge, meeple)
+
+    def free_meeple(self, meeple: Meeple) -> None:
+        assert meeple.placed
+        tile, edge = meeple.placed, meeple.placed_edge
+
+        if self.journal is not None:
+            self.journal.append((meeple._place_meeple, (tile, edge)))
+
+        meeple._free_meeple()
+        self.structures.free(tile, edge, meeple)
+
+    def _unplace_tile(
+        self,
+        tile: Tile,
+        placed_pos: tuple[int, int] | None,
+        bounds: tuple[int, int, int, int] | None,
+        straight_rivers: int,
+        frontier: list[tuple[tuple[int, int], dict[str, StructureType] | None]],
+    ) -> None:
+        assert tile.placed_pos is not None
+        del self._tiles[tile.placed_pos]
+        self.placed_tiles.pop()
+
+        tile.placed_pos = placed_pos
+        self.bounds = bounds
+        self.straight_rivers = straight_rivers
+
+        # Frontier entries are never changed in place, so the old ones can be put back
+        for pos, required in frontier:
+            if required is None:
+                self.frontier.pop(pos, None)
+            else:
+                self.frontier[pos] = required
+
+    def legal_placements(self, tile: Tile) -> list[tuple[int, int, int]]:
+        """
+        Legal Placements
+        _Every (x, y, rotation) the tile can be placed at, following the same rules as the engine's validator_
+        - Runs over the frontier, not the board
+        - The tile is not modified
+        """
+        rules = compile_tile(tile.definition)
+        river_tile = RIVER in rules.codes[0]
+        straight_river = tile.straight_river()
+        rotations = [
+            (
+                rotation,
+                tile.get_rotated_edges(rotation),
+                tuple(COMPATIBLE[code] for code in rules.codes[rotation]),
+            )
+            for rotation in range(4)
+        ]
+
+        placements: list[tuple[int, int, int]] = []
+        for (x, y), required in self.frontier.items():
+            # Edge index and structure bit the neighbours need
+            needs = [
+                (EDGE_INDEX[edge], 1 << STRUCTURE_CODE[structure])
+                for edge, structure in required.items()
+            ]
+
+            for rotation, edges, accepts in rotations:
+                if not all(accepts[i] & bit for i, bit in needs):
+                    continue
+
+                if (
+                    river_tile
+                    and self._river_validation(edges, straight_river, x, y) != "pass"
+                ):
+                    continue
+
+                placements.append((x, y, rotation))
+
+        return placements
+
+    def _set_tile(self, pos: tuple[int, int], tile: Tile | None) -> None:
+        x, y = pos
+        replaced = self._tiles.get(pos)
+
+        if tile is None:
+            self._tiles.pop(pos, None)
+
+        else:
+            self._tiles[pos] = tile
+
+            if self.bounds is None:
+                self.bounds = (x, y, x, y)
+            else:
+                min_x, min_y, max_x, max_y = self.bounds
+                if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                    self.bounds = (
+                        min(min_x, x),
+                        min(min_y, y),
+                        max(max_x, x),
+                        max(max_y, y),
+                    )
+
+        # Structures can only grow, anything else is rebuilt from the board
+        if replaced is not None or tile is None:
+            self._update_frontier(pos)
+            for dx, dy in EDGE_OFFSETS.values():
+                self._update_frontier((x + dx, y + dy))
+
+            if replaced is not None:
+                self._rebuild_structures()
+            return
+
+        self.frontier.pop(pos, None)
+        edges = tile.internal_edges
+        for edge, (dx, dy) in EDGE_OFFSETS.items():
+            neighbour_pos = (x + dx, y + dy)
+            if neighbour_pos in self._tiles:
+                continue
+
+            # Entries are replaced rather than updated so undo logs can hold on to old ones
+            required = dict(self.frontier.get(neighbour_pos, ()))
+            required[OPPOSITE_EDGES[edge]] = edges[edge]
+            self.frontier[neighbour_pos] = required
+
+        self.structures.add_tile(tile, self.get_neighbours(pos))
+        self.monastaries.add_tile(tile, pos)
+
+    def _rebuild_structures(self) -> None:
+        assert self.journal is None, "Tiles can not be replaced after a checkpoint"
+        self.structures = StructureTracker()
+        self.monastaries = MonastaryTracker(self._tiles)
+
+        added: set[tuple[int, int]] = set()
+        for (x, y), tile in self._tiles.items():
+            self.structures.add_tile(
+                tile,
+                {
+                    edge: self._tiles[(x + dx, y + dy)]
+                    if (x + dx, y + dy) in added
+                    else None
+                    for edge, (dx, dy) in EDGE_OFFSETS.items()
+                },
+            )
+            added.add((x, y))
+
+            self.monastaries.add_monastary(tile, (x, y))
+
+    def _update_frontier(self, pos: tuple[int, int]) -> None:
+        if pos in self._tiles:
+            self.frontier.pop(pos, None)
+            return
+
+        x, y = pos
+        required: dict[str, StructureType] = {}
+        for edge, (dx, dy) in EDGE_OFFSETS.items():
+            neighbour = self._tiles.get((x + dx, y + dy))
+            if neighbour is not None:
+                required[edge] = neighbour.internal_edges[OPPOSITE_EDGES[edge]]
+
+        if required:
+            self.frontier[pos] = required
+        else:
+            self.frontier.pop(pos, None)
+
+    def start_base_phase(self) -> None:
+        assert not self.deck
+        self.deck.extend(create_base_tiles())
+
+    def start_river_phase(self) -> None:
+        assert not self.deck
+        self.deck.extend(create_river_tiles())
+
+    def place_river_start(self, pos: tuple[int, int]) -> None:
+        # Each map gets its own copy, the engine and in-process bots may share a process
+        starting_tile = create_river_start_tile()
+        self.place_tile(starting_tile, pos)
 
     def place_river_end(self, pos: tuple[int, int], rotation: int) -> None:
-        river_end_tile = Tile.get_river_end_tile()
+        river_end_tile = create_river_end_tile()
         river_end_tile.rotate_clockwise(rotation)
-        river_end_tile.placed_pos = pos
-
-        self._grid[pos[1]][pos[0]] = river_end_tile
-        self.placed_tiles.append(river_end_tile)
+        self.place_tile(river_end_tile, pos)
 
     def add_expansion_pack(self, expansion_pack: None) -> None:
         pass
 
     def get_tile_by_type(self, type: str, pop: bool) -> "Tile":
         if pop:
-            tile = self.available_tiles_by_type[type].pop()
-            self.available_tiles.remove(tile)
-            return tile
+            return self.deck.take(type)
 
-        return self.available_tiles_by_type[type][0]
+        return self.deck.peek(type)
 
     # Returns if a river tile can be placed at position (x,y)
-    def river_validation(self, tile: Tile, x: int, y: int) -> str:
-        neighbouring_tiles = {
-            edge: Tile.get_external_tile(edge, (x, y), self._grid)
-            for edge in Tile.get_edges()
-        }
+    def river_validation(
+        self, tile: Tile, x: int, y: int, rotation: int | None = None
+    ) -> str:
+        edges = (
+            tile.internal_edges
+            if rotation is None
+            else tile.get_rotated_edges(rotation)
+        )
+        return self._river_validation(edges, tile.straight_river(), x, y)
+
+    def _river_validation(
+        self,
+        edges: Mapping[str, StructureType],
+        straight_river: bool,
+        x: int,
+        y: int,
+    ) -> str:
+        neighbouring_tiles = self.get_neighbours((x, y))
         river_connections = 0
         for edge, neighbour_tile in neighbouring_tiles.items():
-            edge_structure = tile.internal_edges[edge]
+            edge_structure = edges[edge]
 
             if neighbour_tile:
                 # Check if we successfully connected a river structure
@@ -88,7 +435,7 @@ class Map:
                     "left_edge": (-1, 0),
                 }
                 # Check if we are placing a turn piece
-                if not tile.straight_river():
+                if not straight_river:
                     # Look at the tile i tiles away from the direction the turn is facing on our current tile
                     for i in range(1, self.straight_rivers + 2):
                         extension = forcast_coordinates[edge]
@@ -99,7 +446,7 @@ class Map:
                             checking_x = forecast_x + coords[0]
                             checking_y = forecast_y + coords[1]
                             if not (checking_x == x and checking_y == y):
-                                if self._grid[checking_y][checking_x] is not None:
+                                if (checking_x, checking_y) in self._tiles:
                                     return "uturn"
 
         # Check if there is at least one river edge that is connected
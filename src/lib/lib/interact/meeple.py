@@ -10,6 +10,8 @@ class Meeple:
     Meeple
     """
 
+    __slots__ = ("is_special", "player_id", "placed", "placed_edge")
+
     def __init__(self, player_id: int, is_special: bool = False) -> None:
         if not EXPANSION:
             assert not is_special
@@ -0,0 +1,109 @@
+from lib.interact.structure_tracker import Journal
+from lib.interact.tile import Tile, TileModifier
+
+from typing import Iterator, Mapping
+
+MONASTARY_AREA = 9
+
+# The 3x3 area of a monastary, itself included
+AREA_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+
+class MonastaryTracker:
+    """
+    MonastaryTracker
+    _How many of the 9 positions around every monastary on the map are filled_
+    - Counts include the monastary itself, it is complete at 9
+    - Positions map to the monastaries watching them, so placing a tile is O(1)
+    - Claimed or not, every monastary is tracked so bots can look up how close
+      one is to completion
+    """
+
+    def __init__(self, board: Mapping[tuple[int, int], Tile]) -> None:
+        self._board = board
+        self._tiles: list[Tile] = []
+        self._counts: list[int] = []
+        self._slots: dict[Tile, int] = {}
+        self._watching: dict[tuple[int, int], list[int]] = {}
+        self.journal: Journal | None = None
+
+    def __iter__(self) -> Iterator[Tile]:
+        return iter(self._tiles)
+
+    def __contains__(self, tile: object) -> bool:
+        return tile in self._slots
+
+    def count(self, tile: Tile) -> int:
+        return self._counts[self._slots[tile]]
+
+    def is_complete(self, tile: Tile) -> bool:
+        return self._counts[self._slots[tile]] == MONASTARY_AREA
+
+    def missing(self, tile: Tile) -> list[tuple[int, int]]:
+        """Empty positions left around the monastary"""
+        assert tile.placed_pos is not None
+        if self.is_complete(tile):
+            return []
+
+        x, y = tile.placed_pos
+        return [
+            (x + dx, y + dy)
+            for dx, dy in AREA_OFFSETS
+            if (x + dx, y + dy) not in self._board
+        ]
+
+    def completed_by(self, pos: tuple[int, int]) -> list[Tile]:
+        """Monastaries around pos that are complete, after a tile was placed there"""
+        counts = self._counts
+        return [
+            self._tiles[slot]
+            for slot in self._watching.get(pos, ())
+            if counts[slot] == MONASTARY_AREA
+        ]
+
+    def add_tile(self, tile: Tile, pos: tuple[int, int]) -> None:
+        """Counts a tile just placed at pos on the board"""
+        counts = self._counts
+        slots = self._watching.get(pos, ())
+        for slot in slots:
+            counts[slot] += 1
+
+        if self.journal is not None:
+            self.journal.append((self._remove_tile, (tile, pos)))
+
+        self.add_monastary(tile, pos)
+
+    def add_monastary(self, tile: Tile, pos: tuple[int, int]) -> None:
+        """Starts tracking the tile if it is a monastary, counting what is on the board"""
+        if TileModifier.MONASTARY not in tile.modifiers:
+            return
+
+        x, y = pos
+        slot = len(self._tiles)
+        self._slots[tile] = slot
+        self._tiles.append(tile)
+        self._counts.append(
+            sum((x + dx, y + dy) in self._board for dx, dy in AREA_OFFSETS)
+        )
+
+        for dx, dy in AREA_OFFSETS:
+            self._watching.setdefault((x + dx, y + dy), []).append(slot)
+
+    def _remove_tile(self, tile: Tile, pos: tuple[int, int]) -> None:
+        """Undoes add_tile"""
+        if tile in self._slots:
+            x, y = pos
+            slot = self._slots.pop(tile)
+            self._tiles.pop()
+            self._counts.pop()
+
+            for dx, dy in AREA_OFFSETS:
+                watching = self._watching[(x + dx, y + dy)]
+                watching.pop()
+                if not watching:
+                    del self._watching[(x + dx, y + dy)]
+
+            assert slot == len(self._tiles)
+
+        for slot in self._watching.get(pos, ()):
+            self._counts[slot] -= 1
@@ -18,30 +18,15 @@ class StructureType(Enum):
 
     @staticmethod
     def get_points(structure_type: "StructureType") -> int:
-        return {
-            StructureType.ROAD: ROAD_POINTS,
-            StructureType.ROAD_START: ROAD_POINTS,
-            StructureType.CITY: CITY_POINTS,
-            # StructureType.GRASS: FARM_POINTS,
-        }.get(structure_type, NO_POINTS)
+        return STRUCTURE_POINTS.get(structure_type, NO_POINTS)
 
     @staticmethod
     def get_partial_points(structure_type: "StructureType") -> int:
-        return {
-            StructureType.ROAD: ROAD_POINTS,
-            StructureType.ROAD_START: ROAD_POINTS,
-            StructureType.CITY: CITY_PARTIAL_POINTS,
-            # StructureType.GRASS: FARM_POINTS,
-        }.get(structure_type, NO_POINTS)
+        return STRUCTURE_PARTIAL_POINTS.get(structure_type, NO_POINTS)
 
     @staticmethod
     def can_claim(structure_type: "StructureType") -> bool:
-        return {
-            StructureType.ROAD: True,
-            StructureType.ROAD_START: True,
-            StructureType.CITY: True,
-            # StructureType.GRASS: True,
-        }.get(structure_type, False)
+        return structure_type in CLAIMABLE_STRUCTURES
 
     @staticmethod
     def is_compatible(
@@ -51,10 +36,38 @@ class StructureType(Enum):
         m2: Optional[list["TileModifier"]] = None,
     ) -> bool:
         # Compatibility with ecternal edge
-        return s2 in {
-            StructureType.ROAD: [StructureType.ROAD, StructureType.ROAD_START],
-            StructureType.ROAD_START: [StructureType.ROAD, StructureType.ROAD_START],
-            StructureType.CITY: [StructureType.CITY],
-            StructureType.RIVER: [StructureType.RIVER],
-            StructureType.GRASS: [StructureType.GRASS],
-        }.get(s1, [])
+        return s2 in COMPATIBLE_STRUCTURES.get(s1, ())
+
+
+# Rule tables are built once, lib.rules compiles them further into integer tables
+STRUCTURE_POINTS: dict[StructureType, int] = {
+    StructureType.ROAD: ROAD_POINTS,
+    StructureType.ROAD_START: ROAD_POINTS,
+    StructureType.CITY: CITY_POINTS,
+    # StructureType.GRASS: FARM_POINTS,
+}
+
+STRUCTURE_PARTIAL_POINTS: dict[StructureType, int] = {
+    StructureType.ROAD: ROAD_POINTS,
+    StructureType.ROAD_START: ROAD_POINTS,
+    StructureType.CITY: CITY_PARTIAL_POINTS,
+    # StructureType.GRASS: FARM_POINTS,
+}
+
+CLAIMABLE_STRUCTURES: frozenset[StructureType] = frozenset(
+    [
+        StructureType.ROAD,
+        StructureType.ROAD_START,
+        StructureType.CITY,
+        # StructureType.GRASS,
+    ]
+)
+
+# Structures each edge can be placed against
+COMPATIBLE_STRUCTURES: dict[StructureType, tuple[StructureType, ...]] = {
+    StructureType.ROAD: (StructureType.ROAD, StructureType.ROAD_START),
+    StructureType.ROAD_START: (StructureType.ROAD, StructureType.ROAD_START),
+    StructureType.CITY: (StructureType.CITY,),
+    StructureType.RIVER: (StructureType.RIVER,),
+    StructureType.GRASS: (StructureType.GRASS,),
+}
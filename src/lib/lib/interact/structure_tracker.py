@@ -0,0 +1,266 @@
+from lib.interact.meeple import Meeple
+from lib.interact.structure import StructureType
+from lib.interact.tile import OPPOSITE_EDGES, Tile, TileModifier
+from lib.rules import (
+    EDGE_INDEX,
+    EMBLEM_BONUS,
+    EMBLEM_FLAG,
+    PARTIAL_POINTS,
+    POINTS,
+    STRUCTURE_CODE,
+    compile_tile,
+    edge_code,
+    is_compatible,
+)
+
+from typing import Any, Callable, Iterator
+
+Node = tuple[Tile, str]
+
+# Undo log of (function, arguments) entries, see Map.checkpoint
+Journal = list[tuple[Callable[..., Any], tuple[Any, ...]]]
+
+
+class StructureComponent:
+    """
+    StructureComponent
+    _A connected road, city, grass or river structure and its running totals_
+    - `open_edges` counts member edges with no tile next to them, the structure is
+      complete once it reaches 0
+    - `claims` holds the meeples on the structure per player
+    - `code` is the structure's code in lib.rules, which its reward is looked up by
+    """
+
+    __slots__ = (
+        "structure_type",
+        "code",
+        "members",
+        "tiles",
+        "open_edges",
+        "emblems",
+        "claims",
+    )
+
+    def __init__(self, structure_type: StructureType) -> None:
+        self.structure_type = structure_type
+        self.code = STRUCTURE_CODE[structure_type]
+        self.members: list[Node] = []
+        self.tiles: set[Tile] = set()
+        self.open_edges = 0
+        self.emblems = 0
+        self.claims: dict[int, list[Meeple]] = {}
+
+    @property
+    def is_complete(self) -> bool:
+        return self.open_edges == 0
+
+    def get_reward(self, partial: bool = False) -> int:
+        points = PARTIAL_POINTS[self.code] if partial else POINTS[self.code]
+
+        # Emblems are always worth full points, see GameLogic._get_reward
+        return points * len(self.tiles) + EMBLEM_BONUS[self.code] * self.emblems
+
+    def get_claim_reward(self) -> int:
+        """Reward for claiming the structure once complete, without emblem bonus"""
+        return POINTS[self.code] * len(self.tiles)
+
+    def _add_tile(self, tile: Tile) -> None:
+        if tile in self.tiles:
+            return
+
+        self.tiles.add(tile)
+        if TileModifier.EMBLEM in tile.modifiers:
+            self.emblems += 1
+
+
+class StructureTracker:
+    """
+    StructureTracker
+    _Disjoint sets of the (tile, edge) pairs on the map, merged as tiles are placed_
+    - Completion, claims and rewards of a structure are looked up, not traversed
+    - Tiles can only be added, Map rebuilds the tracker when one is removed
+    - Meeples must be placed and freed through Map so claims stay in sync
+    - While `journal` is set every change is logged so it can be undone, which is
+      why sets are merged by size without path compression
+    """
+
+    def __init__(self) -> None:
+        self._parent: dict[Node, Node] = {}
+        self._components: dict[Node, StructureComponent] = {}
+        self.journal: Journal | None = None
+
+    def find(self, node: Node) -> Node:
+        parent = self._parent
+        while parent[node] != node:
+            node = parent[node]
+
+        return node
+
+    def get_component(self, tile: Tile, edge: str) -> StructureComponent | None:
+        node = (tile, edge)
+        if node not in self._parent:
+            return None
+
+        return self._components[self.find(node)]
+
+    def components(self) -> Iterator[StructureComponent]:
+        return iter(self._components.values())
+
+    def add_tile(self, tile: Tile, neighbours: dict[str, Tile | None]) -> None:
+        edges = tile.internal_edges
+        rules = compile_tile(tile.definition)
+        codes = rules.codes[tile.rotation]
+        emblems = 1 if rules.flags & EMBLEM_FLAG else 0
+        parent = self._parent
+        components = self._components
+
+        for group in tile.get_connected_edges():
+            structure_type = edges[group[0]]
+            if structure_type == StructureType.ROAD_START:
+                structure_type = StructureType.ROAD
+
+            component = StructureComponent(structure_type)
+            component.tiles.add(tile)
+            component.emblems = emblems
+
+            root = (tile, group[0])
+            for edge in group:
+                parent[(tile, edge)] = root
+                component.members.append((tile, edge))
+
+                # Meeples already on the tile when the tracker is rebuilt
+                meeple = tile.internal_claims[edge]
+                if meeple is not None:
+                    component.claims.setdefault(meeple.player_id, []).append(meeple)
+
+                if neighbours[edge] is None:
+                    component.open_edges += 1
+
+            components[root] = component
+
+        journal = self.journal
+        if journal is not None:
+            journal.append((self._remove_tile, (tile,)))
+
+        for edge, neighbour in neighbours.items():
+            if neighbour is None:
+                continue
+
+            node = (tile, edge)
+            neighbour_node = (neighbour, OPPOSITE_EDGES[edge])
+            if neighbour_node in parent:
+                root = self.find(neighbour_node)
+                component = components[root]
+
+                # Components rooted on this tile are dropped on undo, only older ones are logged
+                if journal is not None and root[0] is not tile:
+                    journal.append(
+                        (setattr, (component, "open_edges", component.open_edges))
+                    )
+                component.open_edges -= 1
+
+                if is_compatible(
+                    codes[EDGE_INDEX[edge]],
+                    edge_code(neighbour, EDGE_INDEX[neighbour_node[1]]),
+                ):
+                    self._union(node, neighbour_node)
+
+    def claim(self, tile: Tile, edge: str, meeple: Meeple) -> None:
+        component = self.get_component(tile, edge)
+        if component is None:
+            return
+
+        component.claims.setdefault(meeple.player_id, []).append(meeple)
+        if self.journal is not None:
+            self.journal.append((self._remove_claim, (component, meeple)))
+
+    def free(self, tile: Tile, edge: str, meeple: Meeple) -> None:
+        component = self.get_component(tile, edge)
+        if component is None:
+            return
+
+        self._remove_claim(component, meeple)
+        if self.journal is not None:
+            self.journal.append((self._add_claim, (component, meeple)))
+
+    @staticmethod
+    def _add_claim(component: StructureComponent, meeple: Meeple) -> None:
+        component.claims.setdefault(meeple.player_id, []).append(meeple)
+
+    @staticmethod
+    def _remove_claim(component: StructureComponent, meeple: Meeple) -> None:
+        meeples = component.claims[meeple.player_id]
+        meeples.remove(meeple)
+        if not meeples:
+            del component.claims[meeple.player_id]
+
+    def _remove_tile(self, tile: Tile) -> None:
+        for edge in Tile.get_edges():
+            node = (tile, edge)
+            if self._parent.pop(node) == node:
+                del self._components[node]
+
+    def _union(self, a: Node, b: Node) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+
+        large, small = self._components[root_a], self._components[root_b]
+        if len(large.members) < len(small.members):
+            root_a, root_b = root_b, root_a
+            large, small = small, large
+
+        self._parent[root_b] = root_a
+        del self._components[root_b]
+
+        if self.journal is not None:
+            self.journal.append(
+                (
+                    self._split,
+                    (
+                        root_a,
+                        root_b,
+                        small,
+                        len(large.members),
+                        large.open_edges,
+                        large.emblems,
+                        [t for t in small.tiles if t not in large.tiles],
+                        {p: len(large.claims.get(p, ())) for p in small.claims},
+                    ),
+                )
+            )
+
+        large.members.extend(small.members)
+        large.open_edges += small.open_edges
+        for tile in small.tiles:
+            large._add_tile(tile)
+
+        for player_id, meeples in small.claims.items():
+            large.claims.setdefault(player_id, []).extend(meeples)
+
+    def _split(
+        self,
+        root_a: Node,
+        root_b: Node,
+        small: StructureComponent,
+        members: int,
+        open_edges: int,
+        emblems: int,
+        tiles: list[Tile],
+        claims: dict[int, int],
+    ) -> None:
+        """Undoes _union, restoring the larger component to how it was"""
+        large = self._components[root_a]
+        self._parent[root_b] = root_b
+        self._components[root_b] = small
+
+        del large.members[members:]
+        large.open_edges = open_edges
+        large.emblems = emblems
+        large.tiles.difference_update(tiles)
+
+        for player_id, count in claims.items():
+            if count:
+                del large.claims[player_id][count:]
+            else:
+                del large.claims[player_id]
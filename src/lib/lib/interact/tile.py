@@ -1,14 +1,12 @@
 from lib.config.map_config import MONASTARY_IDENTIFIER, tile_counts
-from lib.config.scoring import EMBLEM_PARTIAL_POINTS, EMBLEM_POINTS, NO_POINTS
+from lib.config.scoring import EMBLEM_PARTIAL_POINTS, EMBLEM_POINTS
 from lib.interact.structure import StructureType
 from lib.interact.meeple import Meeple
 
 from enum import Enum, auto
-from copy import deepcopy
 from collections import namedtuple
-from dotmap import DotMap
 
-from typing import Callable, final, Self
+from typing import Any, Iterator, Mapping, Sequence, final
 
 from lib.models.tile_model import TileModel
 
@@ -33,84 +31,230 @@ class TileModifier(Enum):
     @final
     @staticmethod
     def get_bridge_modifier(structure: StructureType) -> "TileModifier | None":
-        return {
-            StructureType.ROAD: TileModifier.OPP_ROAD_BRIDGE,
-            StructureType.CITY: TileModifier.OPP_CITY_BRIDGE,
-        }.get(structure, None)
+        return BRIDGE_MODIFIERS.get(structure)
 
     @final
     @staticmethod
     def apply_point_modifiers(
         tile: "Tile", s: StructureType, points: int, partial: bool = False
     ) -> int:
-        def _point_modifier_config(_mod: "TileModifier") -> Callable[[int], int]:
-            return {
-                TileModifier.EMBLEM: lambda x: x + EMBLEM_POINTS,
-            }.get(_mod, lambda x: x + NO_POINTS)
+        if s == StructureType.CITY and TileModifier.EMBLEM in tile.modifiers:
+            points += EMBLEM_PARTIAL_POINTS if partial else EMBLEM_POINTS
 
-        def _point_modifier_config_partial(
-            _mod: "TileModifier",
-        ) -> Callable[[int], int]:
-            return {
-                TileModifier.EMBLEM: lambda x: x + EMBLEM_PARTIAL_POINTS,
-            }.get(_mod, lambda x: x + NO_POINTS)
+        return points
 
-        def _apply_mod(mod: "TileModifier", partial: bool, points: int) -> int:
-            if partial:
-                return _point_modifier_config_partial(mod)(points)
 
-            return _point_modifier_config(mod)(points)
+# Modifier letting a structure cross a tile to the opposite edge
+BRIDGE_MODIFIERS: dict[StructureType, TileModifier] = {
+    StructureType.ROAD: TileModifier.OPP_ROAD_BRIDGE,
+    StructureType.CITY: TileModifier.OPP_CITY_BRIDGE,
+}
 
-        match s:
-            case StructureType.CITY:
-                if TileModifier.EMBLEM in tile.modifiers:
-                    points = _apply_mod(TileModifier.EMBLEM, partial, points)
+EDGES = ("left_edge", "right_edge", "top_edge", "bottom_edge")
 
-        return points
+OPPOSITE_EDGES: dict[str, str] = {
+    "left_edge": "right_edge",
+    "right_edge": "left_edge",
+    "top_edge": "bottom_edge",
+    "bottom_edge": "top_edge",
+}
+
+ADJACENT_EDGES: dict[str, tuple[str, str]] = {
+    "left_edge": ("top_edge", "bottom_edge"),
+    "right_edge": ("top_edge", "bottom_edge"),
+    "top_edge": ("left_edge", "right_edge"),
+    "bottom_edge": ("left_edge", "right_edge"),
+}
+
+# Order edges move in on a clockwise rotation, see Tile.rotate_clockwise
+CLOCKWISE_EDGES = ("top_edge", "right_edge", "bottom_edge", "left_edge")
+
+
+class TileEdges(Mapping[str, StructureType]):
+    """
+    TileEdges
+    _Read only structures on each edge of a tile for a single rotation_
+    - Shared by every tile of the same type and rotation, see TileDefinition
+    - Supports `edges["top_edge"]`, `edges.top_edge`, `.items()` etc.
+    """
+
+    __slots__ = ("_edges",)
+
+    def __init__(self, edges: dict[str, StructureType]) -> None:
+        self._edges = edges
+
+    def __getitem__(self, edge: str) -> StructureType:
+        return self._edges[edge]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._edges)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __repr__(self) -> str:
+        return f"TileEdges({self._edges})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "TileEdges":
+        return self
+
+    @property
+    def left_edge(self) -> StructureType:
+        return self._edges["left_edge"]
+
+    @property
+    def right_edge(self) -> StructureType:
+        return self._edges["right_edge"]
+
+    @property
+    def top_edge(self) -> StructureType:
+        return self._edges["top_edge"]
+
+    @property
+    def bottom_edge(self) -> StructureType:
+        return self._edges["bottom_edge"]
+
+
+def _connected_internal_edges(
+    edges: TileEdges, modifiers: Sequence["TileModifier"]
+) -> tuple[tuple[str, ...], ...]:
+    """
+    Groups the edges belonging to the same structure on a tile, following the rules
+    of GameLogic._traverse_connected_component: adjacent edges of the same structure
+    connect (not for a BROKEN_CITY city, never for ROAD_START), the opposite edge
+    connects through an adjacent one or a bridge
+    """
+    groups: list[tuple[str, ...]] = []
+    grouped: set[str] = set()
+
+    for edge in EDGES:
+        if edge in grouped:
+            continue
+
+        structure_type = edges[edge]
+        group = [edge]
+
+        if structure_type != StructureType.ROAD_START and not (
+            structure_type == StructureType.CITY
+            and TileModifier.BROKEN_CITY in modifiers
+        ):
+            group.extend(
+                adjacent_edge
+                for adjacent_edge in ADJACENT_EDGES[edge]
+                if edges[adjacent_edge] == structure_type
+            )
+
+        opposite_edge = OPPOSITE_EDGES[edge]
+        bridge = BRIDGE_MODIFIERS.get(structure_type)
+        if edges[opposite_edge] == structure_type and (
+            len(group) > 1 or (bridge and bridge in modifiers)
+        ):
+            group.append(opposite_edge)
+
+        grouped.update(group)
+        groups.append(tuple(group))
+
+    return tuple(groups)
+
+
+class TileDefinition:
+    """
+    TileDefinition
+    _Immutable description of a tile type, shared by every tile of that type_
+    - Holds the edges and connected edge groups in all four rotations, so rotating
+      a tile is just an index change
+    """
+
+    __slots__ = ("tile_type", "modifiers", "edges", "connections", "straight_river")
+
+    _definitions: dict[
+        tuple[str, tuple[StructureType, ...], tuple["TileModifier", ...]],
+        "TileDefinition",
+    ] = {}
+
+    def __init__(
+        self,
+        tile_type: str,
+        edges: tuple[StructureType, ...],
+        modifiers: tuple["TileModifier", ...],
+    ) -> None:
+        self.tile_type = tile_type
+        self.modifiers = modifiers
+
+        base = dict(zip(EDGES, edges))
+
+        self.edges = tuple(
+            TileEdges(
+                {
+                    edge: base[
+                        CLOCKWISE_EDGES[(CLOCKWISE_EDGES.index(edge) - turns) % 4]
+                    ]
+                    for edge in EDGES
+                }
+            )
+            for turns in range(4)
+        )
+        self.connections = tuple(
+            _connected_internal_edges(rotated, modifiers) for rotated in self.edges
+        )
+
+        # A river running straight through in any rotation, see Map.river_validation
+        self.straight_river = (
+            base["top_edge"] == base["bottom_edge"] == StructureType.RIVER
+            or base["left_edge"] == base["right_edge"] == StructureType.RIVER
+        )
+
+    @staticmethod
+    def get(
+        tile_type: str,
+        edges: tuple[StructureType, ...],
+        modifiers: tuple["TileModifier", ...],
+    ) -> "TileDefinition":
+        key = (tile_type, edges, modifiers)
+        definition = TileDefinition._definitions.get(key)
+        if definition is None:
+            definition = TileDefinition(tile_type, edges, modifiers)
+            TileDefinition._definitions[key] = definition
+
+        return definition
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "TileDefinition":
+        return self
 
 
 class Tile:
     """
     Tile
     Desc: _Stores all Tile Info by internal edges (Structures) and external connections_
+    - Only the rotation, position and claims belong to the tile, everything else
+      is read from its shared TileDefinition
     """
 
+    __slots__ = ("definition", "rotation", "placed_pos", "internal_claims")
+
     EdgeTuple = namedtuple(
         "EdgeTuple", ["left_edge", "right_edge", "top_edge", "bottom_edge"]
     )
 
-    starting_tile: "Tile | None" = None
-    river_end_tile: "Tile | None" = None
-
     @final
     @staticmethod
     def get_opposite(edge: str) -> str:
-        return {
-            "left_edge": "right_edge",
-            "right_edge": "left_edge",
-            "top_edge": "bottom_edge",
-            "bottom_edge": "top_edge",
-        }[edge]
+        return OPPOSITE_EDGES[edge]
 
     @final
     @staticmethod
     def adjacent_edges(edge: str) -> list[str]:
-        return {
-            "left_edge": ["top_edge", "bottom_edge"],
-            "right_edge": ["top_edge", "bottom_edge"],
-            "top_edge": ["left_edge", "right_edge"],
-            "bottom_edge": ["left_edge", "right_edge"],
-        }[edge]
+        return list(ADJACENT_EDGES[edge])
 
     @final
     @staticmethod
     def get_edges() -> list[str]:
-        return ["left_edge", "right_edge", "top_edge", "bottom_edge"]
+        return list(EDGES)
 
     @final
     @staticmethod
     def get_external_tile(
-        edge: str, pos: tuple[int, int], grid: list[list["Tile | None"]]
+        edge: str, pos: tuple[int, int], grid: Sequence[Sequence["Tile | None"]]
     ) -> "Tile | None":
         match edge:
             case "left_edge":
@@ -126,7 +270,7 @@ class Tile:
 
     @final
     def get_external_tiles(
-        self, grid: list[list["Tile | None"]]
+        self, grid: Sequence[Sequence["Tile | None"]]
     ) -> dict[str, "Tile | None"]:
         tiles: dict[str, "Tile | None"] = {}
         for edge in self.internal_edges:
@@ -140,32 +284,6 @@ class Tile:
 
         return tiles
 
-    @staticmethod
-    def get_starting_tile() -> "Tile":
-        if not Tile.starting_tile:
-            Tile.starting_tile = Tile(
-                tile_id="RS",
-                left_edge=StructureType.GRASS,
-                right_edge=StructureType.GRASS,
-                top_edge=StructureType.RIVER,
-                bottom_edge=StructureType.GRASS,
-                modifiers=[TileModifier.RIVER],
-            )
-        return Tile.starting_tile
-
-    @staticmethod
-    def get_river_end_tile() -> "Tile":
-        if not Tile.river_end_tile:
-            Tile.river_end_tile = Tile(
-                tile_id="RE",
-                left_edge=StructureType.GRASS,
-                right_edge=StructureType.GRASS,
-                top_edge=StructureType.GRASS,
-                bottom_edge=StructureType.RIVER,
-                modifiers=[TileModifier.RIVER],
-            )
-        return Tile.river_end_tile
-
     def __init__(
         self,
         tile_id: str,
@@ -175,47 +293,54 @@ class Tile:
         bottom_edge: StructureType,
         modifiers: list[TileModifier] = list(),
     ) -> None:
-        self.internal_edges = DotMap(
-            Tile.EdgeTuple(
-                left_edge=left_edge,
-                right_edge=right_edge,
-                top_edge=top_edge,
-                bottom_edge=bottom_edge,
-            )._asdict(),
-            _dynamic=False,
-        )
-
-        self.internal_claims: dict[str, "Meeple | None"] = DotMap(
-            Tile.EdgeTuple(
-                left_edge=None,
-                right_edge=None,
-                top_edge=None,
-                bottom_edge=None,
-            )._asdict(),
-            _dynamic=False,
+        self._init(
+            TileDefinition.get(
+                tile_id,
+                (left_edge, right_edge, top_edge, bottom_edge),
+                tuple(modifiers),
+            )
         )
 
-        self.internal_claims[MONASTARY_IDENTIFIER] = None
+    @staticmethod
+    def from_definition(definition: TileDefinition) -> "Tile":
+        tile = Tile.__new__(Tile)
+        tile._init(definition)
+        return tile
+
+    def _init(self, definition: TileDefinition) -> None:
+        self.definition = definition
+        self.internal_claims: dict[str, "Meeple | None"] = {
+            "left_edge": None,
+            "right_edge": None,
+            "top_edge": None,
+            "bottom_edge": None,
+            MONASTARY_IDENTIFIER: None,
+        }
 
         self.rotation = 0
-        self.modifiers = modifiers if modifiers else []
-        self.tile_type = tile_id
         self.placed_pos: tuple[int, int] | None = None
 
-    def rotate_clockwise(self, number: int) -> None:
-        for _ in range(number):
-            (
-                self.internal_edges.right_edge,
-                self.internal_edges.bottom_edge,
-                self.internal_edges.left_edge,
-                self.internal_edges.top_edge,
-            ) = (
-                self.internal_edges.top_edge,
-                self.internal_edges.right_edge,
-                self.internal_edges.bottom_edge,
-                self.internal_edges.left_edge,
-            )
+    @property
+    def tile_type(self) -> str:
+        return self.definition.tile_type
+
+    @property
+    def modifiers(self) -> tuple[TileModifier, ...]:
+        return self.definition.modifiers
+
+    @property
+    def internal_edges(self) -> TileEdges:
+        return self.definition.edges[self.rotation]
+
+    def get_rotated_edges(self, rotation: int) -> TileEdges:
+        """Edges of this tile when placed with the given rotation, the tile is not modified"""
+        return self.definition.edges[rotation % 4]
+
+    def get_connected_edges(self) -> tuple[tuple[str, ...], ...]:
+        """Groups of internal edges belonging to the same structure"""
+        return self.definition.connections[self.rotation]
 
+    def rotate_clockwise(self, number: int) -> None:
         self.rotation += number
         self.rotation %= 4
 
@@ -223,8 +348,8 @@ class Tile:
         self.internal_claims[edge] = meeple
 
     @final
-    def clone_add(self, n: int) -> list[Self]:
-        cloned_tiles = [deepcopy(self) for _ in range(n - 1)]
+    def clone_add(self, n: int) -> list["Tile"]:
+        cloned_tiles = [Tile.from_definition(self.definition) for _ in range(n - 1)]
         cloned_tiles.append(self)
         return cloned_tiles
 
@@ -239,18 +364,30 @@ class Tile:
     def __repr__(self) -> str:
         return f"Tile {self.tile_type} - {self.placed_pos}"
 
-    def straight_river(self):
-        top_bottom = (
-            self.internal_edges.top_edge
-            == self.internal_edges.bottom_edge
-            == StructureType.RIVER
-        )
-        left_right = (
-            self.internal_edges.right_edge
-            == self.internal_edges.left_edge
-            == StructureType.RIVER
-        )
-        return top_bottom or left_right
+    def straight_river(self) -> bool:
+        return self.definition.straight_river
+
+
+def create_river_start_tile() -> "Tile":
+    return Tile(
+        tile_id="RS",
+        left_edge=StructureType.GRASS,
+        right_edge=StructureType.GRASS,
+        top_edge=StructureType.RIVER,
+        bottom_edge=StructureType.GRASS,
+        modifiers=[TileModifier.RIVER],
+    )
+
+
+def create_river_end_tile() -> "Tile":
+    return Tile(
+        tile_id="RE",
+        left_edge=StructureType.GRASS,
+        right_edge=StructureType.GRASS,
+        top_edge=StructureType.GRASS,
+        bottom_edge=StructureType.RIVER,
+        modifiers=[TileModifier.RIVER],
+    )
 
 
 def create_river_tiles() -> list["Tile"]:
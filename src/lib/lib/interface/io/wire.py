@@ -0,0 +1,404 @@
+"""
+Wire
+_Framing and encodings of the queries and moves sent over the engine's named pipes_
+- json: `<length>,<json>` with the length in ascii digits, the default
+- compact: a 4 byte big endian length with the top bit set, followed by the
+  model's json data in the binary encoding below
+- The first byte of a frame tells the two apart, so the helper always answers
+  in the format the engine last used
+"""
+
+from pydantic import BaseModel
+
+from struct import Struct
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias
+
+# Only the engine's asyncio host reads frames from streams, bots do not pay for importing it
+if TYPE_CHECKING:
+    from asyncio import StreamReader
+
+WireProtocol: TypeAlias = Literal["json", "compact"]
+
+
+class SupportsReadinto(Protocol):
+    def readinto(self, buffer: memoryview, /) -> int | None: ...
+
+
+JSON_LEN_DELIM = b","
+COMPACT_HEADER = Struct(">I")
+COMPACT_FLAG = 0x80000000
+
+# Most frames fit, larger ones grow the buffer up to the maximum size
+READ_BUFFER_SIZE = 1 << 16
+
+# Compact encoding, every value starts with a tag byte
+#   0x00 - 0x7f  the integer itself
+#   0x80 - 0xbf  a string from INTERNED_STRINGS
+#   0xc0 - 0xcf  a list of up to 15 values, 0xd0 - 0xdf a dict of up to 15 pairs
+#   the tags below followed by their varint length or value
+NONE = 0xE0
+FALSE = 0xE1
+TRUE = 0xE2
+INT = 0xE3  # zigzag varint
+FLOAT = 0xE4  # 8 byte big endian double
+STR = 0xE5  # varint length, utf-8 bytes
+LIST = 0xE6  # varint length, values
+DICT = 0xE7  # varint length, key value pairs
+
+FIX_INT_LIMIT = 0x80
+INTERNED = 0x80
+FIX_LIST = 0xC0
+FIX_DICT = 0xD0
+FIX_LIMIT = 0x10
+
+DOUBLE = Struct(">d")
+
+# Field names and literal values of the queries, events and moves. Only ever
+# append to this, both sides of a pipe must agree on every index (max 64)
+INTERNED_STRINGS: tuple[str, ...] = (
+    "query_type",
+    "update",
+    "event_type",
+    "player_id",
+    "team_id",
+    "points",
+    "tiles",
+    "num_tiles",
+    "num_meeples",
+    "num_starting_meeples",
+    "turn_order",
+    "players",
+    "you",
+    "tile",
+    "tile_type",
+    "pos",
+    "rotation",
+    "player_tile_index",
+    "placed_on",
+    "reward",
+    "reason",
+    "ban_type",
+    "details",
+    "tile_placed",
+    "end_tile",
+    "query_place_tile",
+    "query_place_meeple",
+    "move_place_tile",
+    "public_move_place_tile",
+    "move_place_meeple",
+    "move_place_meeple_pass",
+    "event_game_started",
+    "public_event_game_started",
+    "event_player_drew_tiles",
+    "public_event_player_drew_tiles",
+    "event_player_turn_started",
+    "event_player_meeple_freed",
+    "event_starting_tile_placed",
+    "event_river_phase_completed",
+    "event_player_won",
+    "event_player_banned",
+    "event_game_ended_point_limit_reached",
+    "event_game_ended_stale_mate",
+    "event_game_ended_cancelled",
+    "TIMEOUT",
+    "CUMULATIVE_TIMEOUT",
+    "BROKEN_PIPE",
+    "INVALID_MESSAGE",
+    "INVALID_MOVE",
+    "left_edge",
+    "right_edge",
+    "top_edge",
+    "bottom_edge",
+    "MONASTARY",
+)
+
+assert len(INTERNED_STRINGS) <= FIX_LIST - INTERNED
+_INTERNED_CODES = {s: INTERNED + i for i, s in enumerate(INTERNED_STRINGS)}
+
+
+def dump_frame(model: BaseModel, protocol: WireProtocol) -> bytes:
+    if protocol == "compact":
+        payload = compact_dumps(model.model_dump(mode="json"))
+        return COMPACT_HEADER.pack(COMPACT_FLAG | len(payload)) + payload
+
+    payload = model.model_dump_json().encode()
+    return str(len(payload)).encode() + JSON_LEN_DELIM + payload
+
+
+class FrameReader:
+    """
+    FrameReader
+    _Reads frames of either format from a binary pipe into one reused buffer_
+    - Each `readinto` takes whatever the pipe holds, usually a whole frame, so
+      the header is parsed in memory instead of with a read per byte
+    - `read` returns a view into the buffer, only valid until the next `read`
+    - Raises EOFError if the pipe is closed and ValueError for a malformed or
+      oversized frame
+    """
+
+    def __init__(self, pipe: SupportsReadinto, max_size: int) -> None:
+        self._readinto = pipe.readinto
+        self._max_size = max_size
+        self._max_digits = len(str(max_size))
+
+        self._buffer = bytearray(min(max_size, READ_BUFFER_SIZE) + COMPACT_HEADER.size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def read(self) -> tuple[WireProtocol, memoryview]:
+        self._fill(1)
+        start = self._start
+
+        if self._buffer[start] & 0x80:
+            self._fill(COMPACT_HEADER.size)
+            start = self._start
+            size: int = (
+                COMPACT_HEADER.unpack_from(self._buffer, start)[0] & ~COMPACT_FLAG
+            )
+            header = COMPACT_HEADER.size
+            protocol: WireProtocol = "compact"
+
+        else:
+            delim = self._buffer.find(JSON_LEN_DELIM, start, self._end)
+            while delim == -1:
+                if self._end - self._start > self._max_digits:
+                    raise ValueError("malformed message size")
+                self._fill(self._end - self._start + 1)
+                start = self._start
+                delim = self._buffer.find(JSON_LEN_DELIM, start, self._end)
+
+            digits = bytes(self._view[start:delim])
+            if not 0 < len(digits) <= self._max_digits or not digits.isdigit():
+                raise ValueError("malformed message size")
+            size = int(digits)
+            header = delim + 1 - start
+            protocol = "json"
+
+        if size > self._max_size:
+            raise ValueError(f"message too long, {size} > {self._max_size} maximum")
+
+        self._fill(header + size)
+        start = self._start + header
+        self._start = start + size
+        return protocol, self._view[start : start + size]
+
+    def _fill(self, size: int) -> None:
+        """Reads until at least `size` unread bytes are buffered"""
+        if self._end - self._start >= size:
+            return
+
+        # Move the unread bytes to the front, views handed out before are now stale
+        if self._start + size > len(self._buffer):
+            unread = bytes(self._view[self._start : self._end])
+            if size > len(self._buffer):
+                self._buffer = bytearray(size)
+                self._view = memoryview(self._buffer)
+            self._buffer[: len(unread)] = unread
+            self._start, self._end = 0, len(unread)
+
+        while self._end - self._start < size:
+            count = self._readinto(self._view[self._end :])
+            if not count:
+                raise EOFError("pipe closed mid message")
+            self._end += count
+
+
+async def read_frame(
+    stream: "StreamReader", max_size: int
+) -> tuple[WireProtocol, bytes]:
+    """
+    FrameReader.read for an asyncio stream
+    - Raises EOFError (IncompleteReadError) if the stream ends and ValueError for a
+      malformed or oversized frame
+    """
+    from asyncio import LimitOverrunError
+
+    first = await stream.readexactly(1)
+
+    if first[0] & 0x80:
+        header = first + await stream.readexactly(COMPACT_HEADER.size - 1)
+        size: int = COMPACT_HEADER.unpack(header)[0] & ~COMPACT_FLAG
+        protocol: WireProtocol = "compact"
+
+    else:
+        try:
+            digits = first + (await stream.readuntil(JSON_LEN_DELIM))[:-1]
+        except LimitOverrunError:
+            raise ValueError("malformed message size")
+
+        if len(digits) > len(str(max_size)) or not digits.isdigit():
+            raise ValueError("malformed message size")
+        size = int(digits)
+        protocol = "json"
+
+    if size > max_size:
+        raise ValueError(f"message too long, {size} > {max_size} maximum")
+
+    return protocol, await stream.readexactly(size)
+
+
+def compact_dumps(value: Any) -> bytes:
+    """Encodes json data (None, bool, int, float, str, list, tuple, dict)"""
+    out = bytearray()
+    _dump(value, out)
+    return bytes(out)
+
+
+def compact_loads(data: bytes | memoryview) -> Any:
+    """Decodes compact_dumps, raising ValueError for anything malformed"""
+    try:
+        value, pos = _load(data, 0)
+    except (IndexError, TypeError, UnicodeDecodeError, RecursionError):
+        raise ValueError("malformed compact message")
+
+    if pos != len(data):
+        raise ValueError("trailing data after compact message")
+
+    return value
+
+
+def _dump_varint(n: int, out: bytearray) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _dump(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(NONE)
+
+    elif value is True:
+        out.append(TRUE)
+
+    elif value is False:
+        out.append(FALSE)
+
+    elif isinstance(value, int):
+        if 0 <= value < FIX_INT_LIMIT:
+            out.append(value)
+        else:
+            out.append(INT)
+            _dump_varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+
+    elif isinstance(value, str):
+        code = _INTERNED_CODES.get(value)
+        if code is not None:
+            out.append(code)
+        else:
+            data = value.encode()
+            out.append(STR)
+            _dump_varint(len(data), out)
+            out += data
+
+    elif isinstance(value, (list, tuple)):
+        if len(value) < FIX_LIMIT:
+            out.append(FIX_LIST | len(value))
+        else:
+            out.append(LIST)
+            _dump_varint(len(value), out)
+        for item in value:
+            _dump(item, out)
+
+    elif isinstance(value, dict):
+        if len(value) < FIX_LIMIT:
+            out.append(FIX_DICT | len(value))
+        else:
+            out.append(DICT)
+            _dump_varint(len(value), out)
+        for key, item in value.items():
+            _dump(key, out)
+            _dump(item, out)
+
+    elif isinstance(value, float):
+        out.append(FLOAT)
+        out += DOUBLE.pack(value)
+
+    else:
+        raise TypeError(f"can not encode {type(value).__name__}")
+
+
+def _load_varint(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _load(data: bytes | memoryview, pos: int) -> tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+
+    if tag < FIX_INT_LIMIT:
+        return tag, pos
+
+    if tag < FIX_LIST:
+        try:
+            return INTERNED_STRINGS[tag - INTERNED], pos
+        except IndexError:
+            raise ValueError(f"unknown interned string {tag:#x}")
+
+    if tag < FIX_DICT:
+        return _load_list(data, pos, tag - FIX_LIST)
+
+    if tag < NONE:
+        return _load_dict(data, pos, tag - FIX_DICT)
+
+    if tag == NONE:
+        return None, pos
+
+    if tag == FALSE:
+        return False, pos
+
+    if tag == TRUE:
+        return True, pos
+
+    if tag == INT:
+        n, pos = _load_varint(data, pos)
+        return (n >> 1) ^ -(n & 1), pos
+
+    if tag == FLOAT:
+        if pos + DOUBLE.size > len(data):
+            raise IndexError
+        return DOUBLE.unpack_from(data, pos)[0], pos + DOUBLE.size
+
+    if tag == STR:
+        size, pos = _load_varint(data, pos)
+        if pos + size > len(data):
+            raise IndexError
+        return str(data[pos : pos + size], "utf-8"), pos + size
+
+    if tag == LIST:
+        size, pos = _load_varint(data, pos)
+        return _load_list(data, pos, size)
+
+    if tag == DICT:
+        size, pos = _load_varint(data, pos)
+        return _load_dict(data, pos, size)
+
+    raise ValueError(f"unknown tag {tag:#x}")
+
+
+def _load_list(data: bytes | memoryview, pos: int, size: int) -> tuple[list[Any], int]:
+    items = []
+    for _ in range(size):
+        item, pos = _load(data, pos)
+        items.append(item)
+
+    return items, pos
+
+
+def _load_dict(
+    data: bytes | memoryview, pos: int, size: int
+) -> tuple[dict[Any, Any], int]:
+    items = {}
+    for _ in range(size):
+        key, pos = _load(data, pos)
+        items[key], pos = _load(data, pos)
+
+    return items, pos
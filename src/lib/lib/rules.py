@@ -0,0 +1,108 @@
+from lib.config.scoring import EMBLEM_POINTS
+from lib.interact.structure import StructureType
+from lib.interact.tile import (
+    EDGES,
+    OPPOSITE_EDGES,
+    Tile,
+    TileDefinition,
+    TileModifier,
+)
+
+# Edges are indexed in the order of EDGES
+EDGE_INDEX: dict[str, int] = {edge: i for i, edge in enumerate(EDGES)}
+OPPOSITE: tuple[int, ...] = tuple(EDGE_INDEX[OPPOSITE_EDGES[edge]] for edge in EDGES)
+ADJACENT: tuple[tuple[int, ...], ...] = tuple(
+    tuple(EDGE_INDEX[adjacent] for adjacent in Tile.adjacent_edges(edge))
+    for edge in EDGES
+)
+
+# (dx, dy) to the neighbour on each edge
+OFFSETS: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Structures are coded by their position in StructureType
+STRUCTURES: tuple[StructureType, ...] = tuple(StructureType)
+STRUCTURE_CODE: dict[StructureType, int] = {s: i for i, s in enumerate(STRUCTURES)}
+
+RIVER = STRUCTURE_CODE[StructureType.RIVER]
+ROAD = STRUCTURE_CODE[StructureType.ROAD]
+ROAD_START = STRUCTURE_CODE[StructureType.ROAD_START]
+CITY = STRUCTURE_CODE[StructureType.CITY]
+GRASS = STRUCTURE_CODE[StructureType.GRASS]
+
+# Bit n is set if structure n can be placed against the structure
+COMPATIBLE: tuple[int, ...] = tuple(
+    sum(
+        1 << code
+        for code, other in enumerate(STRUCTURES)
+        if StructureType.is_compatible(structure, other)
+    )
+    for structure in STRUCTURES
+)
+
+# Scoring and claiming rules per structure code
+POINTS: tuple[int, ...] = tuple(map(StructureType.get_points, STRUCTURES))
+PARTIAL_POINTS: tuple[int, ...] = tuple(
+    map(StructureType.get_partial_points, STRUCTURES)
+)
+CLAIMABLE: tuple[bool, ...] = tuple(map(StructureType.can_claim, STRUCTURES))
+
+# Modifiers are bit flags
+MODIFIER_FLAG: dict[TileModifier, int] = {m: 1 << i for i, m in enumerate(TileModifier)}
+
+EMBLEM_FLAG = MODIFIER_FLAG[TileModifier.EMBLEM]
+BROKEN_CITY_FLAG = MODIFIER_FLAG[TileModifier.BROKEN_CITY]
+
+# Flag of the modifier bridging a structure to the opposite edge, 0 if none
+BRIDGE: tuple[int, ...] = tuple(
+    MODIFIER_FLAG[bridge] if bridge else 0
+    for bridge in map(TileModifier.get_bridge_modifier, STRUCTURES)
+)
+
+# Points an emblem adds to a structure, full points even when scored partially
+EMBLEM_BONUS: tuple[int, ...] = tuple(
+    EMBLEM_POINTS if code == CITY else 0 for code in range(len(STRUCTURES))
+)
+
+
+class TileRules:
+    """
+    TileRules
+    _A tile definition compiled down to integers, see compile_tile_
+    - `codes[rotation][edge]` is the structure code on each edge index
+    - `groups[rotation]` are the connected edge indexes, like Tile.get_connected_edges
+    - `flags` has a bit set for every modifier on the tile
+    """
+
+    __slots__ = ("codes", "groups", "flags")
+
+    def __init__(self, definition: TileDefinition) -> None:
+        self.codes = tuple(
+            tuple(STRUCTURE_CODE[edges[edge]] for edge in EDGES)
+            for edges in definition.edges
+        )
+        self.groups = tuple(
+            tuple(tuple(EDGE_INDEX[edge] for edge in group) for group in groups)
+            for groups in definition.connections
+        )
+        self.flags = sum(MODIFIER_FLAG[m] for m in set(definition.modifiers))
+
+
+_compiled: dict[TileDefinition, TileRules] = {}
+
+
+def compile_tile(definition: TileDefinition) -> TileRules:
+    """Compiled once per tile definition, shared by every tile of its type"""
+    rules = _compiled.get(definition)
+    if rules is None:
+        rules = _compiled[definition] = TileRules(definition)
+
+    return rules
+
+
+def edge_code(tile: Tile, edge: int) -> int:
+    """Structure code on an edge index of the tile, in its current rotation"""
+    return compile_tile(tile.definition).codes[tile.rotation][edge]
+
+
+def is_compatible(s1: int, s2: int) -> bool:
+    return COMPATIBLE[s1] >> s2 & 1 == 1
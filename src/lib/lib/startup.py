@@ -0,0 +1,80 @@
+"""
+Startup
+_Where the time goes while a process imports the engine or a bot, from `python -X importtime`_
+- The imports run in a fresh interpreter so nothing is cached from this one
+- Shown by `python3 -m engine --startup-report` and `python3 -m helper --startup-report`
+"""
+
+import subprocess
+import sys
+
+# Top level packages grouped on their own, everything else from the standard library is "stdlib"
+REPO_PACKAGES = ("lib", "engine", "helper")
+
+
+class ImportTime:
+    __slots__ = ("module", "self_us", "cumulative_us", "depth")
+
+    def __init__(self, module: str, self_us: int, cumulative_us: int, depth: int):
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+
+def measure_imports(code: str) -> list[ImportTime]:
+    """Runs the code in a new interpreter with -X importtime and parses its report"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header
+
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append(ImportTime(module, int(self_us), int(cumulative_us), depth))
+
+    return times
+
+
+def package_of(module: str) -> str:
+    package = module.split(".")[0]
+    if package in REPO_PACKAGES:
+        return package
+    if package.startswith(("_", "encodings")) or package in sys.stdlib_module_names:
+        return "stdlib"
+    return package
+
+
+def startup_report(code: str, top: int = 15) -> str:
+    times = measure_imports(code)
+    total = sum(t.self_us for t in times)
+
+    packages: dict[str, int] = {}
+    for t in times:
+        package = package_of(t.module)
+        packages[package] = packages.get(package, 0) + t.self_us
+
+    lines = [
+        f"[startup]: `{code}` imported {len(times)} modules in {total / 1000:.1f}ms"
+    ]
+
+    lines.append("  by package:")
+    for package, us in sorted(packages.items(), key=lambda x: x[1], reverse=True)[:top]:
+        lines.append(f"    {us / 1000:8.1f}ms {us / total:6.1%}  {package}")
+
+    lines.append("  slowest modules (own time, excluding what they import):")
+    for t in sorted(times, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"    {t.self_us / 1000:8.1f}ms  {t.module}")
+
+    return "\n".join(lines)
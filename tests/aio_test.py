@@ -0,0 +1,62 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from engine.aio import run_matches
+from engine.config.game_config import NUM_PLAYERS
+from engine.interface.io.game_result import GameBanResult, GameSuccessResult
+
+GARBAGE_SUBMISSION = """
+to_engine = open("./io/to_engine.pipe", "wb")
+from_engine = open("./io/from_engine.pipe", "rb")
+from_engine.read(1)
+to_engine.write(b"3,abc")
+to_engine.flush()
+"""
+
+
+class TestAio(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def sandbox(self, name: str, submissions: list[str]) -> str:
+        root = f"{self.directory.name}/{name}"
+        os.makedirs(f"{root}/input")
+        os.makedirs(f"{root}/output")
+        with open(f"{root}/input/catalog.json", "w") as f:
+            json.dump([{"team_id": i} for i in range(NUM_PLAYERS)], f)
+
+        for player, source in enumerate(submissions):
+            os.makedirs(f"{root}/submission{player}/io")
+            os.mkfifo(f"{root}/submission{player}/io/to_engine.pipe")
+            os.mkfifo(f"{root}/submission{player}/io/from_engine.pipe")
+            shutil.copy(source, f"{root}/submission{player}/submission.py")
+
+        return root
+
+    def test_concurrent_matches(self) -> None:
+        complex = os.path.abspath("example_submissions/complex.py")
+        garbage = f"{self.directory.name}/garbage.py"
+        with open(garbage, "w") as f:
+            f.write(GARBAGE_SUBMISSION)
+
+        roots = [
+            self.sandbox("match_0", [complex] * NUM_PLAYERS),
+            self.sandbox("match_1", [complex] * NUM_PLAYERS),
+            self.sandbox("match_2", [complex, garbage, complex, complex]),
+        ]
+        results = asyncio.run(run_matches(roots))
+
+        assert isinstance(results[0], GameSuccessResult)
+        assert isinstance(results[1], GameSuccessResult)
+        assert isinstance(results[2], GameBanResult)
+        assert results[2].player == 1 and results[2].ban_type == "INVALID_MESSAGE"
+
+        for root in roots:
+            assert os.path.exists(f"{root}/output/results.json")
@@ -0,0 +1,87 @@
+import unittest
+
+from helper.client_state import ClientSate
+
+from lib.interact.meeple import Meeple
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import (
+    MovePlaceTile,
+    PublicMovePlaceTile,
+)
+from lib.models.player_model import PlayerModel, PublicPlayerModel
+from lib.models.tile_model import TileModel
+
+
+class TestApplyMoves(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = ClientSate()
+        self.state.map.start_base_phase()
+
+        self.state.players = {
+            i: PublicPlayerModel(player_id=i, points=0, num_tiles=3) for i in range(2)
+        }
+        self.state.players_meeples = {0: 7, 1: 7}
+        self.state.me = PlayerModel(
+            player_id=0, team_id=0, points=0, tiles=[], num_meeples=7
+        )
+
+        # City with one open edge, claimed by player 1
+        self.E1 = self.state.map.get_tile_by_type("E", pop=True)
+        self.state.map.place_tile(self.E1, (85, 85))
+        self.state.map.place_meeple(Meeple(1), self.E1, "top_edge")
+        self.state.players_meeples[1] -= 1
+
+        self.E2 = self.state.map.get_tile_by_type("E", pop=True)
+        self.state.my_tiles = [self.E2]
+
+    def test_apply_undo(self) -> None:
+        tile = TileModel(tile_type="E", pos=(85, 84), rotation=2)
+        self.state.apply_moves(
+            MovePlaceTile(player_id=0, tile=tile, player_tile_index=0),
+            MovePlaceMeeple(player_id=0, tile=tile, placed_on="bottom_edge"),
+        )
+
+        # Closing the city rewards player 1, claiming it afterwards scores without emblems
+        assert self.state.players[1].points == 4
+        assert self.state.players_meeples == {0: 7, 1: 7}
+        assert self.state.players[0].points == self.state.me.points == 4
+        assert self.state.me.num_meeples == 7
+        assert self.state.my_tiles == []
+        assert self.state.map.get_tile(85, 84) is self.E2
+
+        self.state.undo_moves()
+
+        assert self.state.players[0].points == self.state.players[1].points == 0
+        assert self.state.players[0].num_tiles == 3
+        assert self.state.players_meeples == {0: 7, 1: 6}
+        assert self.state.me.points == 0 and self.state.me.num_meeples == 7
+        assert self.state.my_tiles == [self.E2] and self.E2.rotation == 0
+        assert self.state.map.get_tile(85, 84) is None
+        assert self.state.map.journal is None
+
+        city = self.state.map.structures.get_component(self.E1, "top_edge")
+        assert city is not None and city.open_edges == 1
+        assert [m.player_id for m in city.claims[1]] == [1]
+
+    def test_snapshot_restore(self) -> None:
+        mark = self.state.snapshot()
+        available = len(self.state.map.deck)
+
+        self.state.apply_moves(
+            PublicMovePlaceTile(
+                player_id=1, tile=TileModel(tile_type="U", pos=(86, 85), rotation=0)
+            ),
+            MovePlaceMeeplePass(player_id=1),
+        )
+        assert len(self.state.map.deck) == available - 1
+        assert self.state.players[1].num_tiles == 2
+
+        self.state.restore(mark)
+
+        assert len(self.state.map.deck) == available
+        assert self.state.players[1].num_tiles == 3
+        assert self.state.map.get_tile(86, 85) is None
+        assert self.state.map.journal is None
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from engine.interface.io.deadline_pipe import DeadlinePipe
+
+
+class TestDeadlinePipe(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.pipe")
+        os.mkfifo(self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        reader = DeadlinePipe.open_reader(self.path)
+        writer = DeadlinePipe.open_writer(self.path, time.monotonic() + 1)
+
+        writer.write(b"hello")
+        buffer = bytearray(16)
+        assert reader.readinto(buffer) == 5
+        assert buffer[:5] == b"hello"
+
+        writer.close()
+        assert reader.readinto(buffer) == 0
+        reader.close()
+
+    def test_open_without_reader(self) -> None:
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            DeadlinePipe.open_writer(self.path, start + 0.1)
+        assert time.monotonic() - start < 1
+
+    def test_read_deadline_off_main_thread(self) -> None:
+        reader = DeadlinePipe.open_reader(self.path)
+        writer = DeadlinePipe.open_writer(self.path, time.monotonic() + 1)
+
+        def read() -> int:
+            reader.deadline = time.monotonic() + 0.1
+            return reader.readinto(bytearray(16))
+
+        with ThreadPoolExecutor(1) as executor:
+            with self.assertRaises(TimeoutError):
+                executor.submit(read).result(timeout=5)
+
+        writer.close()
+        reader.close()
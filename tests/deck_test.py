@@ -0,0 +1,62 @@
+import unittest
+
+from lib.interact.deck import Deck
+from lib.interact.tile import create_base_tiles
+
+
+class TestDeck(unittest.TestCase):
+    def setUp(self) -> None:
+        self.deck = Deck(seed=1)
+        self.deck.extend(create_base_tiles())
+
+    def test_seeded(self) -> None:
+        other = Deck(seed=1)
+        other.extend(create_base_tiles())
+
+        drawn = [tile.tile_type for tile in self.deck.draw(10)]
+        assert drawn == [tile.tile_type for tile in other.draw(10)]
+
+    def test_counts(self) -> None:
+        total = len(self.deck)
+        count = self.deck.count("U")
+
+        U = self.deck.take("U")
+        assert U.tile_type == "U" and U not in self.deck
+        assert self.deck.count("U") == count - 1
+
+        for tile in self.deck.draw(5):
+            assert tile not in self.deck
+
+        assert len(self.deck) == total - 6
+        assert sum(self.deck.count(t) for t in {t.tile_type for t in self.deck}) == (
+            total - 6
+        )
+
+        self.deck.add(U)
+        assert U in self.deck and self.deck.count("U") == count
+
+        with self.assertRaises(ValueError):
+            self.deck.draw(total)
+
+    def test_snapshot_restore(self) -> None:
+        snapshot = self.deck.snapshot()
+        drawn = self.deck.draw(3)
+        self.deck.take("E")
+
+        self.deck.restore(snapshot)
+        assert self.deck.draw(3) == drawn
+
+    def test_remove_from_middle_of_type(self) -> None:
+        # Draws mostly take tiles that are not the last of their type
+        while len(self.deck) > 0:
+            self.deck.draw(min(3, len(self.deck)))
+            types = {tile.tile_type for tile in self.deck}
+            if types:
+                self.deck.take(min(types))
+
+            for tile_type in types:
+                assert self.deck.count(tile_type) == sum(
+                    1 for tile in self.deck if tile.tile_type == tile_type
+                )
+
+        assert all(self.deck.count(t) == 0 for t in "ABCDEUV")
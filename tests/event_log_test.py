@@ -0,0 +1,58 @@
+import unittest
+
+from engine.state.event_log import EventLog
+
+from lib.interface.events.event_game_ended import EventGameEndedStaleMate
+from lib.interface.events.event_player_drew_tiles import EventPlayerDrewTiles
+from lib.interface.events.event_player_meeple_freed import EventPlayerMeepleFreed
+from lib.interface.events.event_player_turn_started import EventPlayerTurnStarted
+from lib.interface.events.event_player_won import EventPlayerWon
+from lib.interface.events.event_river_phase_completed import EventRiverPhaseCompleted
+from lib.interface.events.event_tile_placed import EventStartingTilePlaced
+from lib.interface.events.moves.move_place_meeple import (
+    MovePlaceMeeple,
+    MovePlaceMeeplePass,
+)
+from lib.interface.events.moves.move_place_tile import MovePlaceTile
+from lib.interface.events.typing import EventType
+from lib.models.tile_model import TileModel
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self) -> None:
+        tile = TileModel(tile_type="U", pos=(85, 86), rotation=3)
+        river = TileModel(tile_type="R5", pos=(0, 0), rotation=0)
+        self.events: list[EventType] = [
+            EventStartingTilePlaced(tile_placed=river),
+            EventPlayerTurnStarted(player_id=2),
+            EventPlayerDrewTiles(player_id=2, num_tiles=1, tiles=[river]),
+            EventPlayerDrewTiles(player_id=3, num_tiles=2, tiles=[tile, river]),
+            MovePlaceTile(player_id=2, tile=tile, player_tile_index=1),
+            MovePlaceMeeple(player_id=2, tile=tile, placed_on="top_edge"),
+            MovePlaceMeeplePass(player_id=3),
+            EventPlayerMeepleFreed(
+                player_id=2, reward=7, tile=tile, placed_on="monastary"
+            ),
+            EventRiverPhaseCompleted(end_tile=tile),
+            EventGameEndedStaleMate(reason="No tiles left"),
+            EventPlayerWon(player_id=2, points=42),
+        ]
+
+        self.log = EventLog()
+        for event in self.events:
+            self.log.append(event)
+
+    def test_round_trip(self) -> None:
+        assert len(self.log) == len(self.events)
+        assert list(self.log) == self.events
+        assert self.log[-1] == self.events[-1]
+        assert self.log[4:6] == self.events[4:6]
+
+    def test_rows(self) -> None:
+        # Only the events that do not fit a row keep their model
+        assert sorted(self.log.others) == [3, 9]
+        assert self.log.strings.count("U") == 1
+
+    def test_out_of_range(self) -> None:
+        with self.assertRaises(IndexError):
+            self.log[len(self.events)]
@@ -0,0 +1,40 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from engine.config.game_config import NUM_PLAYERS
+from engine.headless import load_bot_factory, run_match
+from engine.interface.io.game_result import GameCrashedResult
+from engine.state.game_state import GameState
+
+
+class TestHeadless(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = load_bot_factory("example_submissions/complex.py", "ComplexBot")
+
+    def test_full_match(self) -> None:
+        result = run_match([self.factory] * NUM_PLAYERS)
+        assert not isinstance(result, GameCrashedResult)
+
+    def test_back_to_back_matches(self) -> None:
+        # Matches in the same process must not leak state into each other
+        for _ in range(3):
+            result = run_match([self.factory] * NUM_PLAYERS)
+            assert not isinstance(result, GameCrashedResult)
+
+    def test_concurrent_matches(self) -> None:
+        assert GameState().map.monastaries is not GameState().map.monastaries
+
+        stdout = sys.stdout
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(
+                    lambda seed: run_match([self.factory] * NUM_PLAYERS, seed=seed),
+                    range(8),
+                )
+            )
+
+        assert sys.stdout is stdout
+        for seed, result in enumerate(results):
+            assert not isinstance(result, GameCrashedResult)
+            assert result == run_match([self.factory] * NUM_PLAYERS, seed=seed)
@@ -0,0 +1,175 @@
+import unittest
+
+from lib.config.map_config import MAX_MAP_LENGTH
+from lib.interact.map import Map
+from lib.interact.meeple import Meeple
+from lib.interact.structure import StructureType
+
+
+class TestMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.map = Map()
+        self.map.start_base_phase()
+
+    def test_grid_access(self) -> None:
+        tile = self.map.get_tile_by_type("U", pop=True)
+        self.map._grid[84][85] = tile
+
+        assert len(self.map._grid) == MAX_MAP_LENGTH
+        assert len(self.map._grid[0]) == MAX_MAP_LENGTH
+        assert self.map._grid[84][85] is tile
+        assert self.map.get_tile(85, 84) is tile
+        assert self.map._grid[84][80:90][5] is tile
+        assert self.map._grid[85][85] is None
+
+        # Grid writes do not count as placing a tile
+        assert self.map.placed_tiles == []
+
+        self.map._grid[84][85] = None
+        assert self.map.get_tile(85, 84) is None
+
+    def test_place_tile(self) -> None:
+        U1 = self.map.get_tile_by_type("U", pop=True)
+        U2 = self.map.get_tile_by_type("U", pop=True)
+
+        self.map.place_tile(U1, (85, 85))
+        self.map.place_tile(U2, (86, 84))
+
+        assert U1.placed_pos == (85, 85)
+        assert self.map.placed_tiles == [U1, U2]
+        assert self.map.bounds == (85, 84, 86, 85)
+        assert dict(self.map.iter_tiles()) == {(85, 85): U1, (86, 84): U2}
+
+    def test_get_neighbours(self) -> None:
+        U1 = self.map.get_tile_by_type("U", pop=True)
+        U2 = self.map.get_tile_by_type("U", pop=True)
+
+        self.map.place_tile(U1, (85, 85))
+        self.map.place_tile(U2, (85, 84))
+
+        assert self.map.get_neighbour((85, 85), "top_edge") is U2
+        assert self.map.get_neighbour((85, 84), "bottom_edge") is U1
+        assert self.map.get_neighbours((85, 85)) == {
+            "left_edge": None,
+            "right_edge": None,
+            "top_edge": U2,
+            "bottom_edge": None,
+        }
+
+    def test_frontier(self) -> None:
+        U1 = self.map.get_tile_by_type("U", pop=True)
+        self.map.place_tile(U1, (85, 85))
+
+        assert set(self.map.frontier) == {(84, 85), (86, 85), (85, 84), (85, 86)}
+        assert self.map.frontier[(85, 84)] == {"bottom_edge": StructureType.ROAD}
+        assert self.map.frontier[(84, 85)] == {"right_edge": StructureType.GRASS}
+
+        U2 = self.map.get_tile_by_type("U", pop=True)
+        self.map.place_tile(U2, (85, 84))
+
+        assert (85, 84) not in self.map.frontier
+        assert self.map.frontier[(84, 84)] == {"right_edge": StructureType.GRASS}
+
+    def test_legal_placements(self) -> None:
+        U1 = self.map.get_tile_by_type("U", pop=True)
+        self.map.place_tile(U1, (85, 85))
+
+        # A straight road only continues the road above and below, and only
+        # puts grass against grass beside it, both in its vertical rotations
+        U2 = self.map.get_tile_by_type("U", pop=True)
+        assert set(self.map.legal_placements(U2)) == {
+            (85, 84, 0),
+            (85, 84, 2),
+            (85, 86, 0),
+            (85, 86, 2),
+            (84, 85, 0),
+            (84, 85, 2),
+            (86, 85, 0),
+            (86, 85, 2),
+        }
+        assert U2.rotation == 0
+
+    def test_structures(self) -> None:
+        E1 = self.map.get_tile_by_type("E", pop=True)
+        E2 = self.map.get_tile_by_type("E", pop=True)
+        E2.rotate_clockwise(2)
+
+        self.map.place_tile(E1, (85, 85))
+        city = self.map.structures.get_component(E1, "top_edge")
+        assert city is not None
+        assert city.open_edges == 1 and not city.is_complete
+
+        meeple = Meeple(0)
+        self.map.place_meeple(meeple, E1, "top_edge")
+        assert city.claims == {0: [meeple]}
+
+        self.map.place_tile(E2, (85, 84))
+        city = self.map.structures.get_component(E2, "bottom_edge")
+        assert city is self.map.structures.get_component(E1, "top_edge")
+        assert city is not None
+        assert city.is_complete
+        assert city.tiles == {E1, E2}
+        assert city.get_reward() == 4
+
+        self.map.free_meeple(meeple)
+        assert city.claims == {}
+
+    def test_checkpoint_rollback(self) -> None:
+        E1 = self.map.get_tile_by_type("E", pop=True)
+        E2 = self.map.get_tile_by_type("E", pop=True)
+        E2.rotate_clockwise(2)
+
+        self.map.place_tile(E1, (85, 85))
+        meeple = Meeple(0)
+        self.map.place_meeple(meeple, E1, "top_edge")
+        frontier = dict(self.map.frontier)
+
+        mark = self.map.checkpoint()
+        self.map.place_tile(E2, (85, 84))
+        self.map.free_meeple(meeple)
+
+        city = self.map.structures.get_component(E1, "top_edge")
+        assert city is not None and city.is_complete
+
+        self.map.rollback(mark)
+
+        assert self.map.journal is None
+        assert self.map.get_tile(85, 84) is None
+        assert self.map.placed_tiles == [E1]
+        assert E2.placed_pos is None
+        assert self.map.frontier == frontier
+        assert self.map.bounds == (85, 85, 85, 85)
+
+        city = self.map.structures.get_component(E1, "top_edge")
+        assert city is not None
+        assert city.open_edges == 1 and city.tiles == {E1}
+        assert city.claims == {0: [meeple]}
+        assert self.map.structures.get_component(E2, "bottom_edge") is None
+        assert meeple.placed is E1 and E1.internal_claims["top_edge"] is meeple
+
+    def test_monastaries(self) -> None:
+        B1 = self.map.get_tile_by_type("B", pop=True)
+        B2 = self.map.get_tile_by_type("B", pop=True)
+
+        self.map.place_tile(B1, (85, 85))
+        assert list(self.map.monastaries) == [B1]
+        assert self.map.monastaries.count(B1) == 1
+        assert len(self.map.monastaries.missing(B1)) == 8
+
+        self.map.place_tile(B2, (86, 85))
+        assert self.map.monastaries.count(B1) == 2
+        assert self.map.monastaries.count(B2) == 2
+
+        mark = self.map.checkpoint()
+        for pos in self.map.monastaries.missing(B1):
+            assert self.map.monastaries.completed_by(pos) == []
+            self.map.place_tile(self.map.get_tile_by_type("V", pop=True), pos)
+
+        assert self.map.monastaries.is_complete(B1)
+        assert self.map.monastaries.missing(B1) == []
+        assert self.map.monastaries.count(B2) == 6
+        assert self.map.monastaries.completed_by((84, 84)) == [B1]
+
+        self.map.rollback(mark)
+        assert self.map.monastaries.count(B1) == 2
+        assert list(self.map.monastaries) == [B1, B2]
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from engine.interface.io.deadline_pipe import DeadlinePipe
+
+SUBMISSION = """
+from helper.game import Game
+
+matches = 0
+
+
+def main():
+    global matches
+    matches += 1
+    print(f"match {matches}")
+    Game().get_next_query()
+"""
+
+
+class TestPool(unittest.TestCase):
+    def test_matches_reuse_the_process(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            with open(f"{root}/bot.py", "w") as f:
+                f.write(SUBMISSION)
+
+            worker = subprocess.Popen(
+                [sys.executable, "-m", "helper.pool", f"{root}/bot.py"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            assert worker.stdin is not None and worker.stdout is not None
+
+            for match in range(1, 3):
+                directory = f"{root}/match_{match}"
+                os.makedirs(f"{directory}/io")
+                os.mkfifo(f"{directory}/io/to_engine.pipe")
+                os.mkfifo(f"{directory}/io/from_engine.pipe")
+
+                worker.stdin.write(f"{directory}\n".encode())
+                worker.stdin.flush()
+
+                # Connecting and hanging up ends the match for the submission
+                reader = DeadlinePipe.open_reader(f"{directory}/io/to_engine.pipe")
+                writer = DeadlinePipe.open_writer(
+                    f"{directory}/io/from_engine.pipe", time.monotonic() + 10
+                )
+                reader.close()
+                writer.close()
+
+                assert worker.stdout.readline() == b"done\n"
+                with open(f"{directory}/io/submission.log") as f:
+                    assert f.read() == f"match {match}\n"
+
+            worker.stdin.close()
+            assert worker.wait(timeout=10) == 0
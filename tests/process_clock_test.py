@@ -0,0 +1,100 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+from engine.aio import AsyncPlayerConnection
+from engine.config.io_config import WALL_BACKSTOP_FACTOR
+from engine.interface.io.exceptions import (
+    CumulativeTimeoutException,
+    TimeoutException,
+)
+from engine.interface.io.process_clock import ProcessClock
+
+
+class TestProcessClock(unittest.TestCase):
+    def test_counts_cpu_not_waiting(self) -> None:
+        clock = ProcessClock(os.getpid())
+
+        start = clock()
+        time.sleep(0.3)
+        assert clock() - start < 0.1
+
+        start = clock()
+        deadline = time.process_time() + 0.3
+        while time.process_time() < deadline:
+            pass
+        assert clock() - start >= 0.2
+
+    def test_exited_process(self) -> None:
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        clock = ProcessClock(process.pid)
+        assert ProcessClock.available(process.pid)
+
+        process.wait()
+        assert not ProcessClock.available(process.pid)
+        assert clock() == 0.0
+
+    def test_counts_children(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-c", CHILD_WORKER], stdout=subprocess.PIPE
+        )
+        clock = ProcessClock(process.pid)
+        assert process.stdout is not None
+        assert process.stdout.readline() == b"done\n"
+
+        # Only the child used the CPU, the bot itself waited for it
+        assert clock() >= 0.4
+        process.kill()
+        process.wait()
+
+
+# A bot handing its work to a child process, which burns 0.5s of CPU
+CHILD_WORKER = """
+import subprocess, sys
+subprocess.run([sys.executable, "-c", "import time\\nt = time.process_time() + 0.5\\nwhile time.process_time() < t: pass"])
+print("done", flush=True)
+import time
+time.sleep(10)
+"""
+
+
+class TestCpuTimedConnection(unittest.TestCase):
+    def test_child_work_times_out(self) -> None:
+        async def move() -> None:
+            bot = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                CHILD_WORKER.replace("0.5", "1.5"),
+                stdout=asyncio.subprocess.PIPE,
+            )
+            assert bot.stdout is not None
+            connection = AsyncPlayerConnection(0, "io", bot.pid)
+            try:
+                await connection._time_limited(bot.stdout.readline(), 1, "slow", None)
+            finally:
+                bot.kill()
+                await bot.wait()
+
+        with patch("engine.aio.TIMEOUT_CLOCK", "cpu"):
+            with self.assertRaises(TimeoutException):
+                asyncio.run(move())
+
+    def test_cumulative_wall_backstop(self) -> None:
+        async def moves() -> None:
+            # Waiting uses no CPU, only the wall clock backstop can end it
+            connection = AsyncPlayerConnection(0, "io", os.getpid())
+            for _ in range(10):
+                await connection._time_limited(asyncio.sleep(0.4), 2, "slow", None)
+
+        with (
+            patch("engine.aio.TIMEOUT_CLOCK", "cpu"),
+            patch("engine.aio.CUMULATIVE_TIMEOUT_SECONDS", 0.2),
+        ):
+            start = time.monotonic()
+            with self.assertRaises(CumulativeTimeoutException):
+                asyncio.run(moves())
+            assert time.monotonic() - start < 0.2 * WALL_BACKSTOP_FACTOR + 0.5
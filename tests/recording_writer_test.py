@@ -0,0 +1,70 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from engine.interface.logging.event_inspector import EventInspector
+from engine.interface.logging.recording_writer import RecordingWriter
+
+from lib.interface.events.event_player_won import EventPlayerWon
+from lib.interface.events.moves.move_place_meeple import MovePlaceMeeple
+from lib.interface.events.typing import EventType
+from lib.models.tile_model import TileModel
+
+
+class TestRecordingWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+        tile = TileModel(tile_type="U", pos=(85, 86), rotation=3)
+        self.events: list[EventType] = [
+            MovePlaceMeeple(player_id=1, tile=tile, placed_on="top_edge"),
+            EventPlayerWon(player_id=1, points=12),
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_json_matches_inspector(self) -> None:
+        writer = RecordingWriter(self.path, "json")
+        for event in self.events:
+            writer.write(event)
+        writer.close()
+
+        inspector = EventInspector(self.events, {}, [])
+        with open(f"{self.path}/game.json") as f:
+            assert f.read() == inspector.get_recording_json()
+        with open(f"{self.path}/visualiser_forwards_differential.json") as f:
+            assert f.read() == inspector.get_visualiser_json()
+
+    def test_partial_recording(self) -> None:
+        writer = RecordingWriter(self.path, "jsonl")
+        writer.write(self.events[0])
+
+        # Readable before the match ends
+        with open(f"{self.path}/game.jsonl") as f:
+            lines = f.readlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["event_type"] == "move_place_meeple"
+        writer.close()
+
+    def test_compressed(self) -> None:
+        writer = RecordingWriter(self.path, "jsonl.gz")
+        for event in self.events:
+            writer.write(event)
+        writer.close()
+
+        with gzip.open(f"{self.path}/game.jsonl.gz", "rt") as f:
+            assert [json.loads(line)["event_type"] for line in f] == [
+                "move_place_meeple",
+                "event_player_won",
+            ]
+        with gzip.open(f"{self.path}/visualiser_forwards_differential.jsonl.gz") as f:
+            assert len(f.readlines()) == 1
+
+    def test_unknown_format(self) -> None:
+        with self.assertRaises(ValueError):
+            RecordingWriter(self.path, "yaml")
+        assert os.listdir(self.path) == []
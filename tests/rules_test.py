@@ -0,0 +1,66 @@
+import unittest
+
+from lib.config.scoring import EMBLEM_POINTS
+from lib.interact.structure import StructureType
+from lib.interact.tile import EDGES, Tile, TileModifier, create_base_tiles
+from lib.rules import (
+    ADJACENT,
+    BRIDGE,
+    CITY,
+    CLAIMABLE,
+    EDGE_INDEX,
+    EMBLEM_BONUS,
+    MODIFIER_FLAG,
+    OPPOSITE,
+    PARTIAL_POINTS,
+    POINTS,
+    STRUCTURE_CODE,
+    STRUCTURES,
+    compile_tile,
+    edge_code,
+    is_compatible,
+)
+
+
+class TestRules(unittest.TestCase):
+    def test_edges(self) -> None:
+        for edge in EDGES:
+            i = EDGE_INDEX[edge]
+            assert EDGES[OPPOSITE[i]] == Tile.get_opposite(edge)
+            assert [EDGES[a] for a in ADJACENT[i]] == Tile.adjacent_edges(edge)
+
+    def test_structures(self) -> None:
+        for s1 in STRUCTURES:
+            code = STRUCTURE_CODE[s1]
+            assert POINTS[code] == StructureType.get_points(s1)
+            assert PARTIAL_POINTS[code] == StructureType.get_partial_points(s1)
+            assert CLAIMABLE[code] == StructureType.can_claim(s1)
+            assert EMBLEM_BONUS[code] == (EMBLEM_POINTS if code == CITY else 0)
+
+            bridge = TileModifier.get_bridge_modifier(s1)
+            assert BRIDGE[code] == (MODIFIER_FLAG[bridge] if bridge else 0)
+
+            for s2 in STRUCTURES:
+                assert is_compatible(
+                    code, STRUCTURE_CODE[s2]
+                ) == StructureType.is_compatible(s1, s2)
+
+    def test_compile_tile(self) -> None:
+        for tile in create_base_tiles():
+            rules = compile_tile(tile.definition)
+            assert rules is compile_tile(tile.definition)
+
+            for modifier, flag in MODIFIER_FLAG.items():
+                assert bool(rules.flags & flag) == (modifier in tile.modifiers)
+
+            for rotation in range(4):
+                tile.rotation = rotation
+                for edge, structure in tile.internal_edges.items():
+                    assert (
+                        edge_code(tile, EDGE_INDEX[edge]) == (STRUCTURE_CODE[structure])
+                    )
+
+                assert rules.groups[rotation] == tuple(
+                    tuple(EDGE_INDEX[edge] for edge in group)
+                    for group in tile.get_connected_edges()
+                )
@@ -0,0 +1,55 @@
+import unittest
+
+from lib.config.map_config import MONASTARY_IDENTIFIER
+from lib.game.scoring import final_points, final_rewards
+from lib.interact.map import Map
+from lib.interact.meeple import Meeple
+
+
+class TestFinalScoring(unittest.TestCase):
+    def setUp(self) -> None:
+        self.map = Map()
+        self.map.start_base_phase()
+
+        self.E = self.map.get_tile_by_type("E", pop=True)
+        self.B = self.map.get_tile_by_type("B", pop=True)
+        self.map.place_tile(self.E, (85, 85))
+        self.map.place_tile(self.B, (86, 85))
+
+        self.first, self.second, self.third = Meeple(0), Meeple(0), Meeple(1)
+        self.monk = Meeple(2)
+        self.map.place_meeple(self.first, self.E, "top_edge")
+        self.map.place_meeple(self.third, self.E, "top_edge")
+        self.map.place_meeple(self.second, self.E, "top_edge")
+        self.map.place_meeple(self.monk, self.B, MONASTARY_IDENTIFIER)
+
+        self.meeples = [self.first, self.second, self.third, self.monk, Meeple(3)]
+
+    def test_final_rewards(self) -> None:
+        city = self.map.structures.get_component(self.E, "top_edge")
+        assert city is not None
+        reward = city.get_reward(partial=True)
+
+        assert final_rewards(self.map, self.meeples) == [
+            (self.first, reward),
+            (self.third, 0),
+            (self.monk, 2),
+        ]
+
+        # Nothing is freed
+        assert city.claims == {0: [self.first, self.second], 1: [self.third]}
+        assert self.B.internal_claims[MONASTARY_IDENTIFIER] is self.monk
+
+    def test_tied_players(self) -> None:
+        self.map.free_meeple(self.second)
+        rewards = final_rewards(self.map, self.meeples)
+        assert rewards[0][1] == rewards[1][1] > 0
+
+    def test_final_points(self) -> None:
+        points = {0: 10, 1: 3, 2: 0, 3: 1}
+        city = self.map.structures.get_component(self.E, "top_edge")
+        assert city is not None
+
+        totals = final_points(self.map, points, self.meeples)
+        assert totals == {0: 10 + city.get_reward(partial=True), 1: 3, 2: 2, 3: 1}
+        assert points == {0: 10, 1: 3, 2: 0, 3: 1}
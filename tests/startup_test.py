@@ -0,0 +1,19 @@
+import unittest
+
+from lib.startup import measure_imports, package_of
+
+
+class TestStartup(unittest.TestCase):
+    def test_measure_imports(self) -> None:
+        times = {t.module: t for t in measure_imports("import lib.config.map_config")}
+
+        assert "lib.config.map_config" in times
+        assert times["lib.config.map_config"].depth == 0
+        assert times["lib.config"].depth > 0
+        assert all(t.cumulative_us >= t.self_us for t in times.values())
+
+    def test_package_of(self) -> None:
+        assert package_of("lib.interface.io.wire") == "lib"
+        assert package_of("json.decoder") == "stdlib"
+        assert package_of("_collections_abc") == "stdlib"
+        assert package_of("pydantic.main") == "pydantic"
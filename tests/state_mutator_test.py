@@ -0,0 +1,97 @@
+import unittest
+
+from engine.headless import load_bot_factory
+from engine.interface.io.inprocess_connection import InProcessConnection
+from engine.state.game_state import GameState
+from engine.state.state_mutator import StateMutator
+from engine.state.turn_analysis import TurnAnalysis
+
+from helper.game import Game
+from helper.interface import LocalConnection
+
+from lib.interface.events.event_game_started import (
+    EventGameStarted,
+    PublicEventGameStarted,
+)
+from lib.interface.events.event_player_drew_tiles import (
+    EventPlayerDrewTiles,
+    PublicEventPlayerDrewTiles,
+)
+from lib.interface.events.event_player_turn_started import EventPlayerTurnStarted
+from lib.interact.map import Map
+from lib.interact.meeple import Meeple
+from lib.models.tile_model import TileModel
+
+
+class TestOutbound(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = GameState()
+        self.mutator = StateMutator(self.state)
+
+    def test_censored_once(self) -> None:
+        players = [player._to_player_model() for player in self.state.players.values()]
+        self.mutator.commit(EventGameStarted(turn_order=[0, 1, 2, 3], players=players))
+
+        tile = TileModel(tile_type="U", pos=(0, 0), rotation=0)
+        drew = EventPlayerDrewTiles(player_id=1, num_tiles=1, tiles=[tile])
+        self.mutator.commit(drew)
+
+        turn = EventPlayerTurnStarted(player_id=1)
+        self.mutator.commit(turn)
+
+        for player_id, player in self.state.players.items():
+            assert list(player.outbound) == [0, 1, 2]
+
+            started = player.outbound[0]
+            assert isinstance(started, PublicEventGameStarted)
+            assert started.you.player_id == player_id
+
+            assert player.outbound[2] is turn
+
+        assert self.state.players[1].outbound[1] is drew
+
+        public = self.state.players[0].outbound[1]
+        assert isinstance(public, PublicEventPlayerDrewTiles)
+        assert self.state.players[2].outbound[1] is public
+        assert self.state.players[3].outbound[1] is public
+
+    def test_queries_take_new_events(self) -> None:
+        factory = load_bot_factory("example_submissions/complex.py", "ComplexBot")
+        connection = InProcessConnection(0, factory(Game(LocalConnection())))
+
+        self.mutator.commit(EventPlayerTurnStarted(player_id=0))
+        self.mutator.commit(EventPlayerTurnStarted(player_id=1))
+        assert list(connection._get_record_update_dict(self.state)) == [0, 1]
+
+        with self.assertRaises(RuntimeError):
+            connection._get_record_update_dict(self.state)
+
+        self.mutator.commit(EventPlayerTurnStarted(player_id=2))
+        assert list(connection._get_record_update_dict(self.state)) == [2]
+
+
+class TestTurnAnalysis(unittest.TestCase):
+    def test_completed(self) -> None:
+        map = Map()
+        map.start_base_phase()
+        E1 = map.get_tile_by_type("E", pop=True)
+        E2 = map.get_tile_by_type("E", pop=True)
+        E2.rotate_clockwise(2)
+
+        map.place_tile(E1, (85, 85))
+        meeple = Meeple(1)
+        map.place_meeple(meeple, E1, "top_edge")
+
+        turn = TurnAnalysis(map, E1)
+        assert turn.completed == {} and turn.get_claims("top_edge") == [1]
+        assert not turn.monastary_complete
+
+        map.place_tile(E2, (85, 84))
+        turn = TurnAnalysis(map, E2)
+        city = map.structures.get_component(E2, "bottom_edge")
+        assert turn.completed == {"bottom_edge": city}
+        assert turn.rewards == {"bottom_edge": 4}
+
+        # Claims are read from the live component
+        map.free_meeple(meeple)
+        assert turn.get_claims("bottom_edge") == []
@@ -0,0 +1,36 @@
+import unittest
+
+from lib.interact.structure import StructureType
+from lib.interact.tile import create_base_tiles
+
+
+class TestTile(unittest.TestCase):
+    def test_rotation(self) -> None:
+        tiles = [t for t in create_base_tiles() if t.tile_type == "E"]
+        E1, E2 = tiles[0], tiles[1]
+
+        E1.rotate_clockwise(1)
+        assert E1.internal_edges["right_edge"] == StructureType.CITY
+        assert E1.internal_edges.top_edge == StructureType.GRASS
+        assert E1.get_rotated_edges(2)["bottom_edge"] == StructureType.CITY
+
+        # Rotating one tile leaves the others of its type alone
+        assert E2.internal_edges["top_edge"] == StructureType.CITY
+        assert E1.get_rotated_edges(0) is E2.internal_edges
+
+    def test_connected_edges(self) -> None:
+        U = next(t for t in create_base_tiles() if t.tile_type == "U")
+        assert ("top_edge", "bottom_edge") in U.get_connected_edges()
+
+        U.rotate_clockwise(1)
+        assert ("left_edge", "right_edge") in U.get_connected_edges()
+
+    def test_shared_definitions(self) -> None:
+        deck = create_base_tiles()
+        again = create_base_tiles()
+
+        for a, b in zip(deck, again):
+            assert a is not b
+            assert a.definition is b.definition
+
+        assert not hasattr(deck[0], "__dict__")
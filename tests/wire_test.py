@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+from io import BytesIO
+from typing import Any
+
+from lib.interface.events.event_player_drew_tiles import EventPlayerDrewTiles
+from lib.interface.events.moves.move_place_meeple import MovePlaceMeeple
+from lib.interface.io.wire import (
+    READ_BUFFER_SIZE,
+    FrameReader,
+    compact_dumps,
+    compact_loads,
+    dump_frame,
+    read_frame,
+)
+from lib.interface.queries.query_place_tile import QueryPlaceTile
+from lib.interface.queries.typing import QueryTypeAdapter
+from lib.models.tile_model import TileModel
+
+
+class TestWire(unittest.TestCase):
+    def setUp(self) -> None:
+        tile = TileModel(tile_type="U", pos=(85, 86), rotation=3)
+        self.query = QueryPlaceTile(
+            update={
+                0: EventPlayerDrewTiles(player_id=1, num_tiles=1, tiles=[tile]),
+            }
+        )
+        self.move = MovePlaceMeeple(player_id=1, tile=tile, placed_on="top_edge")
+
+    def test_compact_values(self) -> None:
+        values = [
+            None,
+            True,
+            False,
+            0,
+            127,
+            128,
+            -1,
+            -(2**40),
+            1.5,
+            "",
+            "é",
+            "left_edge",
+        ]
+        data = {
+            "a" * 20: values,
+            "nested": [list(range(20)), {str(i): i for i in range(20)}],
+        }
+
+        assert compact_loads(compact_dumps(values)) == values
+        assert compact_loads(compact_dumps(data)) == data
+
+    def test_frames(self) -> None:
+        pipe = BytesIO(
+            dump_frame(self.query, "compact")
+            + dump_frame(self.query, "json")
+            + dump_frame(self.move, "compact")
+        )
+
+        reader = FrameReader(pipe, 10000)
+
+        protocol, data = reader.read()
+        assert protocol == "compact"
+        assert QueryTypeAdapter.model_validate(compact_loads(data)).root == self.query
+
+        protocol, data = reader.read()
+        assert protocol == "json"
+        assert QueryTypeAdapter.model_validate_json(bytes(data)).root == self.query
+
+        protocol, data = reader.read()
+        assert MovePlaceMeeple.model_validate(compact_loads(data)) == self.move
+
+        with self.assertRaises(EOFError):
+            reader.read()
+
+    def test_split_reads(self) -> None:
+        class Trickle(BytesIO):
+            def readinto(self, buffer: Any) -> int:
+                return super().readinto(buffer[:3])
+
+        large = b"x" * (READ_BUFFER_SIZE + 10)
+        frames = [dump_frame(self.move, "json"), b"%d," % len(large) + large]
+        reader = FrameReader(Trickle(b"".join(frames * 2)), 2 * READ_BUFFER_SIZE)
+
+        for _ in range(2):
+            protocol, data = reader.read()
+            assert MovePlaceMeeple.model_validate_json(bytes(data)) == self.move
+
+            protocol, data = reader.read()
+            assert bytes(data) == large
+
+    def test_malformed(self) -> None:
+        for data in [b"", b"\xc2\x01", b"\xe5\x05ab", b"\xff", b"\x01\x02"]:
+            with self.assertRaises(ValueError):
+                compact_loads(data)
+
+        for frame in [b"12a,{}", b"99999999,{}", b"\x80\x01\x00\x00"]:
+            with self.assertRaises(ValueError):
+                FrameReader(BytesIO(frame), 10000).read()
+
+        with self.assertRaises(EOFError):
+            FrameReader(BytesIO(b"10,{}"), 10000).read()
+
+    def test_async_frames(self) -> None:
+        async def read_all(data: bytes) -> list[tuple[str, bytes]]:
+            stream = asyncio.StreamReader()
+            stream.feed_data(data)
+            stream.feed_eof()
+
+            frames = []
+            with self.assertRaises(EOFError):
+                while True:
+                    frames.append(await read_frame(stream, 10000))
+            return frames
+
+        frames = asyncio.run(
+            read_all(dump_frame(self.query, "compact") + dump_frame(self.move, "json"))
+        )
+        assert frames[0][0] == "compact"
+        assert QueryTypeAdapter.model_validate(compact_loads(frames[0][1])).root == (
+            self.query
+        )
+        assert frames[1][0] == "json"
+        assert MovePlaceMeeple.model_validate_json(frames[1][1]) == self.move
+
+        for frame in [b"12a,{}", b"99999999,{}", b"\x80\x01\x00\x00"]:
+            with self.assertRaises(ValueError):
+                asyncio.run(read_all(frame))
@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SUBMISSION = """
+import sys
+
+print(__name__, sys.argv)
+print("error", file=sys.stderr)
+sys.exit(3)
+"""
+
+
+def is_zombie(pid: int) -> bool:
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        stat = f.read()
+    return stat[stat.rindex(b")") + 2 :].startswith(b"Z")
+
+
+class TestZygote(unittest.TestCase):
+    def test_launch(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            zygote = subprocess.Popen(
+                [sys.executable, "-m", "helper.zygote"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            assert zygote.stdin is not None and zygote.stdout is not None
+
+            pids = []
+            for player in range(2):
+                directory = f"{root}/submission{player}"
+                os.makedirs(f"{directory}/io")
+                with open(f"{directory}/submission.py", "w") as f:
+                    f.write(SUBMISSION)
+
+                zygote.stdin.write(f"launch {directory}\n".encode())
+                zygote.stdin.flush()
+                pids.append(int(zygote.stdout.readline()))
+
+            # Forks keep their pid until they are killed through the zygote
+            for pid in pids:
+                deadline = time.monotonic() + 10
+                while not is_zombie(pid):
+                    assert time.monotonic() < deadline
+                    time.sleep(0.01)
+
+                zygote.stdin.write(f"kill {pid}\n".encode())
+                zygote.stdin.flush()
+                assert zygote.stdout.readline() == b"3\n"
+                assert not os.path.exists(f"/proc/{pid}")
+
+            # Only its own forks
+            zygote.stdin.write(f"kill {os.getpid()}\n".encode())
+            zygote.stdin.flush()
+            assert zygote.stdout.readline().startswith(b"unknown command")
+
+            for player in range(2):
+                with open(f"{root}/submission{player}/io/submission.log") as f:
+                    assert f.read() == "__main__ ['submission.py']\n"
+                with open(f"{root}/submission{player}/io/submission.err") as f:
+                    assert f.read() == "error\n"
+
+            zygote.stdin.close()
+            assert zygote.wait(timeout=10) == 0
+
+    def test_kills_forks_on_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(f"{directory}/io")
+            with open(f"{directory}/submission.py", "w") as f:
+                f.write("import time\ntime.sleep(60)\n")
+
+            zygote = subprocess.Popen(
+                [sys.executable, "-m", "helper.zygote"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            assert zygote.stdin is not None and zygote.stdout is not None
+            zygote.stdin.write(f"launch {directory}\n".encode())
+            zygote.stdin.flush()
+            pid = int(zygote.stdout.readline())
+
+            zygote.stdin.close()
+            assert zygote.wait(timeout=10) == 0
+            assert not os.path.exists(f"/proc/{pid}")
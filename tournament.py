@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+from math import sqrt
+from signal import SIGKILL
+from statistics import mean, stdev
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+from match_simulator import (
+    NUM_PLAYERS,
+    SubmissionPool,
+    Zygote,
+    clean_environment_for_player,
+    setup_environments,
+    start_submissions,
+    submission_pids_env,
+)
+
+MATCH_TIMEOUT_SECONDS = 600
+Z_95 = 1.96
+
+
+def main():
+    # python3 tournament.py --submissions example_submissions/complex.py my_submission.py --matches 100 --workers 8
+
+    commands = parse_cmd_args(sys.argv[1:])
+
+    try:
+        submissions = commands["--submissions"]
+        matches = int(commands["--matches"][0]) if "--matches" in commands else 1
+        workers = (
+            int(commands["--workers"][0])
+            if "--workers" in commands
+            else os.cpu_count() or 1
+        )
+        directory = commands["--output"][0] if "--output" in commands else "tournament"
+        clock = "cpu" if "--cpu-time" in commands else "wall"
+        aio = "--aio" in commands
+        pool = "--pool" in commands
+        zygote = "--zygote" in commands
+    except (ValueError, KeyError, IndexError):
+        print_usage()
+
+    if not submissions or aio + pool + zygote > 1:
+        print_usage()
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+    leaderboard = Leaderboard(submissions)
+    lineups = schedule(len(submissions), matches)
+
+    print(f"[tournament]: running {matches} matches on {workers} workers.")
+    if aio:
+        for match, lineup, result in run_matches_aio(
+            [[submissions[i] for i in lineup] for lineup in lineups],
+            directory,
+            workers,
+            clock,
+        ):
+            leaderboard.add_result(lineup, result)
+            print(f"[tournament]: match {match} {lineup} finished - {result}")
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    run_match,
+                    match,
+                    [submissions[i] for i in lineup],
+                    directory,
+                    clock,
+                    pool,
+                    zygote,
+                )
+                for match, lineup in enumerate(lineups)
+            ]
+
+            for future in as_completed(futures):
+                match, lineup, result = future.result()
+                leaderboard.add_result(lineup, result)
+                print(f"[tournament]: match {match} {lineup} finished - {result}")
+
+    leaderboard.print()
+    with open(f"{directory}/leaderboard.json", "w") as f:
+        f.write(json.dumps(leaderboard.to_dict(), indent=2))
+
+
+def parse_cmd_args(args: list[str]):
+    commands = {}
+
+    current_command = None
+    for arg in args:
+        if arg[:2] == "--":
+            current_command = arg
+            commands[current_command] = []
+            continue
+
+        if current_command is None:
+            print_usage()
+
+        commands[current_command].append(arg)
+
+    for command in commands.keys():
+        if command not in [
+            "--submissions",
+            "--matches",
+            "--workers",
+            "--output",
+            "--cpu-time",
+            "--aio",
+            "--pool",
+            "--zygote",
+        ]:
+            print_usage()
+
+    return commands
+
+
+def print_usage():
+    print(
+        "Usage: python3 tournament.py [options]\n"
+        "   options:\n"
+        "       --submissions <path> ...    Source files of the bots taking part. Every match seats 4 of them, rotating\n"
+        "                                       through all lineups (a bot fills several seats if there are less than 4).\n"
+        "       --matches <n>               Number of matches to play (default 1).\n"
+        "       --workers <n>               Number of matches to run at once (default number of cores).\n"
+        "       --output <path>             Directory holding one sandbox per match and the leaderboard (default tournament).\n"
+        "       --cpu-time                  Time bots by the CPU their process uses, not the wall clock, so more workers\n"
+        "                                       than cores do not get bots banned for waiting to be scheduled.\n"
+        "       --aio                       Referee every match from a single engine process (engine.aio), --workers\n"
+        "                                       matches at once, instead of one engine process per match.\n"
+        "       --pool                      Keep each submission running between matches (python3 -m helper.pool), its\n"
+        "                                       main() is called again for every match instead of starting a new process.\n"
+        "       --zygote                    Start submissions by forking an interpreter with lib and helper already\n"
+        "                                       imported (python3 -m helper.zygote) instead of a new python3.\n"
+        "\n"
+        "   examples:\n"
+        "       python3 tournament.py --submissions example_submissions/complex.py my_submission.py --matches 100\n"
+    )
+    sys.exit(0)
+
+
+def schedule(num_submissions: int, matches: int) -> list[tuple[int, ...]]:
+    if num_submissions >= NUM_PLAYERS:
+        lineups = list(combinations(range(num_submissions), NUM_PLAYERS))
+    else:
+        lineups = [
+            tuple((i + seat) % num_submissions for seat in range(NUM_PLAYERS))
+            for i in range(num_submissions)
+        ]
+
+    # Rotate seats each time the lineups repeat so no bot keeps the same seat
+    scheduled = []
+    for match in range(matches):
+        lineup = lineups[match % len(lineups)]
+        shift = (match // len(lineups)) % NUM_PLAYERS
+        scheduled.append(lineup[shift:] + lineup[:shift])
+
+    return scheduled
+
+
+def run_match(
+    match: int,
+    lineup: list[str],
+    directory: str,
+    clock: str = "wall",
+    pool: bool = False,
+    zygote: bool = False,
+):
+    """Runs a single match in its own sandbox, this is called in a worker process."""
+    root = os.path.abspath(f"{directory}/match_{match}")
+    os.makedirs(root)
+
+    setup_environments([(1, source) for source in lineup], root)
+    if pool:
+        submission_pids = worker_pool().start_submissions(lineup, root)
+    else:
+        submission_pids = start_submissions(
+            root, quiet=True, zygote=worker_zygote() if zygote else None
+        )
+
+    with (
+        open(f"{root}/output/engine.log", "w") as f_log,
+        open(f"{root}/output/engine.err", "w") as f_err,
+    ):
+        process = subprocess.Popen(
+            ["python3", "-m", "engine"],
+            stdout=f_log,
+            stderr=f_err,
+            env=dict(
+                os.environ,
+                GAME_ENGINE_CORE_DIRECTORY=root,
+                GAME_ENGINE_TIMEOUT_CLOCK=clock,
+                **submission_pids_env(submission_pids),
+            ),
+        )
+
+        try:
+            process.wait(timeout=MATCH_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    if pool:
+        worker_pool().finish_match()
+    elif zygote:
+        # Forks of the zygote are not our children, only it can signal them safely
+        for pid in submission_pids:
+            worker_zygote().kill(pid)
+    else:
+        for pid in submission_pids:
+            try:
+                os.kill(pid, SIGKILL)
+            except ProcessLookupError:
+                pass
+            os.waitpid(pid, 0)
+
+    return match, lineup, collect_result(root)
+
+
+_pool: SubmissionPool | None = None
+
+
+def worker_pool() -> SubmissionPool:
+    """Warm submissions of this worker process, they exit with it (EOF on their stdin)."""
+    global _pool
+    if _pool is None:
+        _pool = SubmissionPool()
+    return _pool
+
+
+_zygote: Zygote | None = None
+
+
+def worker_zygote() -> Zygote:
+    """Zygote of this worker process, it exits with it (EOF on its stdin)."""
+    global _zygote
+    if _zygote is None:
+        _zygote = Zygote()
+    return _zygote
+
+
+def run_matches_aio(
+    lineups: list[list[str]], directory: str, workers: int, clock: str = "wall"
+):
+    """Runs every match from one engine process, it starts the submissions itself."""
+    roots = []
+    for match, lineup in enumerate(lineups):
+        root = os.path.abspath(f"{directory}/match_{match}")
+        os.makedirs(root)
+        setup_environments([(1, source) for source in lineup], root)
+        roots.append(root)
+
+    with (
+        open(f"{directory}/engine.log", "w") as f_log,
+        open(f"{directory}/engine.err", "w") as f_err,
+    ):
+        subprocess.run(
+            ["python3", "-m", "engine.aio", "--concurrency", str(workers), *roots],
+            stdout=f_log,
+            stderr=f_err,
+            env=dict(os.environ, GAME_ENGINE_TIMEOUT_CLOCK=clock),
+        )
+
+    return [
+        (match, lineup, collect_result(root))
+        for match, (lineup, root) in enumerate(zip(lineups, roots))
+    ]
+
+
+def collect_result(root: str) -> dict:
+    # The engine copies the submission logs into output, the pipes are no longer needed
+    for player in range(NUM_PLAYERS):
+        clean_environment_for_player(player, root)
+
+    try:
+        with open(f"{root}/output/results.json", "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"result_type": "CRASHED", "reason": "No results.json was written."}
+
+
+class Leaderboard:
+    def __init__(self, submissions: list[str]) -> None:
+        self.seats = {s: 0 for s in submissions}
+        self.wins = {s: 0 for s in submissions}
+        self.bans = {s: 0 for s in submissions}
+        self.points: dict[str, list[int]] = {s: [] for s in submissions}
+        self.unfinished = 0
+
+    def add_result(self, lineup: list[str], result: dict) -> None:
+        match result["result_type"]:
+            case "SUCCESS":
+                score = {
+                    int(player): points for player, points in result["score"].items()
+                }
+                for player, submission in enumerate(lineup):
+                    self.seats[submission] += 1
+                    self.points[submission].append(score[player])
+
+                self.wins[lineup[result["ranking"][0]]] += 1
+
+            case "PLAYER_BANNED":
+                self.bans[lineup[result["player"]]] += 1
+                self.unfinished += 1
+
+            case _:
+                self.unfinished += 1
+
+    def win_rate(self, submission: str) -> tuple[float, float, float]:
+        """Win rate with its 95% Wilson score interval."""
+        n = self.seats[submission]
+        if n == 0:
+            return 0, 0, 0
+
+        p = self.wins[submission] / n
+        centre = (p + Z_95**2 / (2 * n)) / (1 + Z_95**2 / n)
+        spread = Z_95 * sqrt(p * (1 - p) / n + Z_95**2 / (4 * n**2)) / (1 + Z_95**2 / n)
+        return p, centre - spread, centre + spread
+
+    def mean_points(self, submission: str) -> tuple[float, float]:
+        """Mean points with the half width of its 95% confidence interval."""
+        points = self.points[submission]
+        if not points:
+            return 0, 0
+
+        if len(points) == 1:
+            return points[0], 0
+
+        return mean(points), Z_95 * stdev(points) / sqrt(len(points))
+
+    def to_dict(self) -> dict:
+        board = {}
+        for submission in self.seats:
+            p, low, high = self.win_rate(submission)
+            points, points_ci = self.mean_points(submission)
+            board[submission] = {
+                "seats": self.seats[submission],
+                "wins": self.wins[submission],
+                "bans": self.bans[submission],
+                "win_rate": p,
+                "win_rate_ci": [low, high],
+                "mean_points": points,
+                "mean_points_ci": points_ci,
+            }
+
+        return {"unfinished_matches": self.unfinished, "leaderboard": board}
+
+    def print(self) -> None:
+        board = self.to_dict()["leaderboard"]
+        print("\n[tournament]: leaderboard")
+        print(
+            f"{'submission':40} {'seats':>6} {'wins':>6} {'bans':>5} {'win rate (95% CI)':>24} {'mean points':>18}"
+        )
+        for submission, row in sorted(
+            board.items(), key=lambda x: x[1]["win_rate"], reverse=True
+        ):
+            low, high = row["win_rate_ci"]
+            print(
+                f"{submission:40} {row['seats']:>6} {row['wins']:>6} {row['bans']:>5} "
+                f"{row['win_rate']:>8.1%} ({low:.1%}-{high:.1%}) "
+                f"{row['mean_points']:>9.1f} ± {row['mean_points_ci']:.1f}"
+            )
+        print(f"Unfinished matches (bans, crashes): {self.unfinished}")
+
+
+if __name__ == "__main__":
+    main()